@@ -0,0 +1,173 @@
+"""
+Name: GPD_4303S_Acquisition.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Acquisition worker thread for the GPD-X303S GUI, reads the selected channels on a fixed period off the GUI thread, cuts the output when a software alarm limit is crossed, feeds the triggered capture and reconnects when the link drops
+"""
+
+import threading
+import time
+from datetime import datetime
+from PyQt6.QtCore import QThread, pyqtSignal
+import GPD_4303S_Alarms
+import GPD_4303S_Codec
+
+MeasureCommands = ["VOUT1?", "VOUT2?", "VOUT3?", "VOUT4?", "IOUT1?", "IOUT2?", "IOUT3?", "IOUT4?"] # Index in this list is the index of the reading in a sample
+TrackingBits = {"01": "Independent", "11": "Series", "10": "Parallel"} # STATUS? bits 2 and 3
+
+class AcquisitionWorker(QThread):
+    SampleReady = pyqtSignal(object) # Emitted with a sample dictionary for every reading
+    Failed = pyqtSignal(str) # Emitted when a reading fails and the link cannot be reopened, the worker stops afterwards
+    LinkLost = pyqtSignal(object) # Emitted once when a reading fails, the worker then reconnects with backoff
+    Reconnecting = pyqtSignal(int, float, str) # Attempt, seconds to the next attempt, why the last one failed
+    Reconnected = pyqtSignal(object) # Emitted when the same power supply answers again, acquisition carries on
+    Tripped = pyqtSignal(object) # Emitted after an alarm has already turned the output off
+    CaptureSaved = pyqtSignal(str) # Emitted with the file name of a finished triggered capture
+
+    def __init__(self, Link, Alarms, Capture=None, Parent=None):
+        super().__init__(Parent)
+        self.Link = Link # GPD_4303S_Link shared with the GUI
+        self.Alarms = Alarms # GPD_4303S_Alarms.AlarmLimits
+        self.Capture = Capture # GPD_4303S_Capture.TriggerCapture, sees every sample including the full rate ones
+        self.EventPath = None # Event log for alarm trips, set by the GUI once the SN is known
+        self.SN = None # Power supply the link has to come back to after a reconnect, set by the GUI
+        self.Backoff = (0.5, 30.0) # First and longest wait between reconnect attempts (s), doubling in between
+        self.Interval = 1.0 # Time between samples (s)
+        self.ReadStatus = True # Add STATUS? to samples that include CH1 or CH2 so CC/CV is logged with the readings
+        self.Channels = [1, 2, 3, 4] # Channels the user wants polled
+        self.Quantities = "VI" # "V", "I" or both
+        self.Tracking = "Independent" # Kept up to date from STATUS?, in Series/Parallel CH2 follows CH1 and is not queried
+        self.Parsers = {} # GPD_4303S_Codec.BatchParser for each command list used so far
+        self.Taken = 0 # Counters for the metrics endpoint, kept for the life of the worker: samples read (full rate ones included)
+        self.Emitted = 0 # Samples sent to the GUI for the log
+        self.Missed = 0 # Scheduled samples skipped because the link was slow or down
+        self.Malformed = 0 # Replies that failed to parse
+        self.Reconnects = 0
+        self.StopEvent = threading.Event()
+        self.Suspended = threading.Event() # Set while another worker needs the whole link (step response capture)
+
+    def StartAcquisition(self, IntervalMs=1000):
+        self.StopAcquisition()
+        self.Interval = IntervalMs / 1000.0
+        self.StopEvent.clear()
+        self.start()
+
+    def StopAcquisition(self): # Safe to call from the GUI thread, returns once the worker has finished its current sample
+        self.StopEvent.set()
+        if(self.isRunning() and QThread.currentThread() is not self):
+            self.wait()
+
+    def Polled(self): # Reading indexes to query this sample, and whether CH2 is copied from CH1 because of tracking
+        Channels = list(self.Channels)
+        Mirrored = self.Tracking in ("Series", "Parallel") and 1 in Channels and 2 in Channels
+        if(Mirrored):
+            Channels.remove(2)
+        Indexes = [Channel - 1 for Channel in Channels if "V" in self.Quantities] + [Channel + 3 for Channel in Channels if "I" in self.Quantities]
+        return sorted(Indexes), Mirrored
+
+    def Measure(self): # One pipelined pass over the selected readings (plus STATUS? when logged or when a CC trigger needs it)
+        Indexes, Mirrored = self.Polled()
+        Status = (self.ReadStatus and (1 in self.Channels or 2 in self.Channels)) or (self.Capture is not None and self.Capture.NeedsStatus())
+        Commands = tuple([MeasureCommands[Index] for Index in Indexes] + (["STATUS?"] if Status else []))
+        Parser = self.Parsers.get(Commands)
+        if(Parser is None):
+            Parser = self.Parsers[Commands] = GPD_4303S_Codec.BatchParser(Commands)
+        Start = time.monotonic()
+        Replies = self.Link.QueryBatch(Commands)
+        Done = time.monotonic()
+        Readings, Bits, Errors = Parser.Parse(Replies) # Malformed replies come back as NaN/None, the poll carries on
+        self.Taken += 1
+        self.Malformed += Errors
+        Values = [GPD_4303S_Codec.NaN] * 8 # Readings that were not polled stay NaN
+        for Index, Value in zip(Indexes, Readings):
+            Values[Index] = Value
+        if(Mirrored): # CH2 follows CH1 in Series/Parallel tracking
+            Values[1] = Values[0]
+            Values[5] = Values[4]
+        Sample = {"Time": Done, "Start": Start, "Wall": time.time(), "Stamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+                  "Voltages": Values[:4], "Currents": Values[4:], "Status": Bits, "Errors": Errors}
+        if(Bits is not None):
+            self.Tracking = TrackingBits.get(Bits[2:4], self.Tracking) # Catches tracking changed from the front panel
+        return Sample
+
+    def Emit(self, Sample): # Hand a sample to the GUI and the log
+        self.Emitted += 1
+        self.SampleReady.emit(Sample)
+
+    def Trip(self, Sample, Violations): # Cut the output straight from this thread, then log the event
+        self.Link.PriorityWrite("OUT0")
+        Off = time.monotonic()
+        Event = {"Stamp": Sample["Stamp"], "Violations": Violations, "Action": "OUT0",
+                 "Latency": Off - Sample["Time"], # Detection to output off (the write)
+                 "SampleLatency": Off - Sample["Start"]} # Start of the tripping sample to output off
+        self.Alarms.WorstLatency = max(self.Alarms.WorstLatency, Event["SampleLatency"])
+        if(self.EventPath is not None):
+            try:
+                GPD_4303S_Alarms.WriteEvent(self.EventPath, Event)
+            except Exception as e:
+                print(f"Error writing alarm event: {e}")
+        return Event
+
+    def Recover(self, Error): # Reopen the link with exponential backoff until the same power supply answers, returns False if acquisition was stopped first
+        self.Link.Drop()
+        Lost = {"Stamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3], "Wall": time.time(), "Error": Error}
+        self.LinkLost.emit(Lost)
+        Wait = self.Backoff[0]
+        Attempt = 0
+        while not self.StopEvent.wait(Wait):
+            Attempt += 1
+            try:
+                self.Link.Reconnect(self.SN)
+            except Exception as e:
+                Wait = min(Wait * 2, self.Backoff[1])
+                self.Reconnecting.emit(Attempt, Wait, str(e))
+                continue
+            self.Reconnects += 1
+            self.Reconnected.emit({"Lost": Lost["Stamp"], "Stamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+                                   "Down": time.time() - Lost["Wall"], "Attempts": Attempt, "Error": Error})
+            return True
+        return False
+
+    def run(self):
+        NextTime = time.monotonic()
+        while not self.StopEvent.is_set():
+            if(self.Suspended.is_set()):
+                self.StopEvent.wait(0.05)
+                NextTime = time.monotonic()
+                continue
+            try:
+                Sample = self.Measure()
+            except Exception as e:
+                if(self.Link.Opener is None):
+                    self.Failed.emit(str(e))
+                    return
+                Down = time.monotonic()
+                if(not self.Recover(str(e))):
+                    return # Stopped while the link was down
+                NextTime = time.monotonic()
+                self.Missed += int((NextTime - Down) / self.Interval)
+                continue
+            Violations = self.Alarms.Check(Sample["Voltages"], Sample["Currents"])
+            if(Violations):
+                try:
+                    Event = self.Trip(Sample, Violations)
+                except Exception as e:
+                    self.Emit(Sample)
+                    self.Failed.emit(f"alarm cut-off failed: {e}")
+                    return
+                self.Emit(Sample) # Log the tripping sample before the GUI closes off the run
+                self.Tripped.emit(Event)
+                return # Output is off, nothing left to acquire
+            if(Sample["Start"] >= NextTime - 0.001): # Only samples on the regular schedule go to the GUI and the log
+                self.Emit(Sample)
+                NextTime += self.Interval
+                if(NextTime < Sample["Start"]): # Fell behind (slow link), restart the schedule instead of bursting
+                    self.Missed += int((Sample["Start"] - NextTime) / self.Interval) + 1
+                    NextTime = Sample["Start"] + self.Interval
+            if(self.Capture is not None):
+                Path = self.Capture.Add(Sample)
+                if(Path is not None):
+                    self.CaptureSaved.emit(Path)
+                if(self.Capture.Capturing()):
+                    continue # Post-trigger window, sample again straight away
+            self.StopEvent.wait(max(0.0, NextTime - time.monotonic()))
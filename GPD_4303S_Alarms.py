@@ -0,0 +1,55 @@
+"""
+Name: GPD_4303S_Alarms.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Software over/under voltage and current limits for the GPD-X303S GUI, checked against every acquisition sample with a timestamped event log of each trip
+"""
+
+import csv
+import math
+
+LimitKeys = ["V1", "V2", "V3", "V4", "A1", "A2", "A3", "A4"] # Same keys the GUI uses in ChannelSettings
+
+class AlarmLimits():
+    def __init__(self):
+        self.Limits = {} # Key -> (Low, High), either side may be None when unused
+        self.WorstLatency = 0.0 # Slowest detect-to-off time seen so far (s)
+
+    def SetLimit(self, Key, Low=None, High=None):
+        if(Low is None and High is None):
+            self.Limits.pop(Key, None)
+        else:
+            self.Limits[Key] = (Low, High)
+
+    def Clear(self):
+        self.Limits = {}
+
+    def Describe(self): # Human readable list of the active limits
+        Lines = []
+        for Key in LimitKeys:
+            if(Key in self.Limits):
+                Low, High = self.Limits[Key]
+                Lines.append(f"{Key}: low {'-' if Low is None else Low} high {'-' if High is None else High}")
+        return Lines if Lines else ["No alarm limits set"]
+
+    def Check(self, Voltages, Currents): # Return the violations of one sample as (Key, Value, "OVER"/"UNDER", Limit) tuples, empty list if none
+        Limits = self.Limits # Read once, the GUI thread may replace entries while we check
+        if(not Limits):
+            return []
+        Violations = []
+        for i in range(len(Voltages)):
+            for Key, Value in (("V" + str(i + 1), Voltages[i]), ("A" + str(i + 1), Currents[i])):
+                if(Key not in Limits or math.isnan(Value)):
+                    continue
+                Low, High = Limits[Key]
+                if(High is not None and Value > High):
+                    Violations.append((Key, Value, "OVER", High))
+                elif(Low is not None and Value < Low):
+                    Violations.append((Key, Value, "UNDER", Low))
+        return Violations
+
+def WriteEvent(Path, Event): # Append one trip to the event log (written from the acquisition thread, not the GUI)
+    with open(Path, mode='a', newline='') as event_file:
+        csv_writer = csv.writer(event_file)
+        for Key, Value, Kind, Limit in Event["Violations"]:
+            csv_writer.writerow([Event["Stamp"], "TRIP", Key, Kind, Value, Limit, Event["Action"], f"{Event['Latency'] * 1000:.1f} ms"])
@@ -0,0 +1,204 @@
+"""
+Name: GPD_4303S_Analysis.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Chunked NumPy loader for the GPD-X303S CSV logs (or a memory-mapped .npy copy of them) with streaming ripple, settling time and CC/CV dwell analyses whose memory use is bounded by the chunk size
+"""
+
+Usage = """
+Usage: python GPD_4303S_Analysis.py LOG ANALYSIS [OPTIONS]
+- LOG is a GPD_4303S_Log_<SN>.csv file (or the .npy made by "convert")
+- convert                          Write LOG.npy so later passes memory-map the log instead of parsing the CSV
+- ripple [Window s]                Peak to peak and RMS ripple of every reading per time window (default 10 s)
+- settling [Step V] [Tol V] [Hold] Settling time after each voltage step larger than Step (defaults 0.05, 0.01, 3 samples)
+- dwell                            Time spent in CC and CV on CH1/CH2 (needs the Status column logged since this tool was added)
+Results are written as CSV to standard output.
+"""
+
+import csv
+import io
+import os
+import sys
+import numpy as np
+from numpy.lib.format import open_memmap
+from numpy.lib.stride_tricks import sliding_window_view
+
+Columns = ["V1", "V2", "V3", "V4", "A1", "A2", "A3", "A4"] # Reading columns after the timestamp, in log order
+ChunkRows = 100000 # Rows parsed (or sliced from the memory map) per pass
+
+def ParseLines(Lines): # Parse CSV log lines into (Time, Readings, Status), comment and blank lines must already be removed
+    Lines = [Line if Line.count(",") == 9 else Line + ",nan" for Line in Lines] # Rows logged before the Status column get NaN
+    Time = np.array([Line[:23] for Line in Lines], dtype="datetime64[ms]").astype(np.int64) / 1000.0 # Seconds, local wall clock as written
+    Values = np.loadtxt(io.StringIO("\n".join(Lines)), delimiter=",", usecols=range(1, 10), dtype=np.float64, ndmin=2)
+    return Time, Values[:, :8], Values[:, 8] # The 8 digit STATUS? bit string reads as a number, bits are decoded by StatusBit
+
+def IterCSV(Path, Rows=ChunkRows): # Yield (Time, Readings, Status) chunks of at most Rows rows from a CSV log
+    Lines = []
+    with open(Path, "r", newline="") as log_file:
+        for Line in log_file:
+            if(Line.startswith("#") or not Line.strip()):
+                continue
+            Lines.append(Line.rstrip("\r\n"))
+            if(len(Lines) >= Rows):
+                yield ParseLines(Lines)
+                Lines = []
+    if(Lines):
+        yield ParseLines(Lines)
+
+def BinaryPath(Path):
+    return Path + ".npy"
+
+def Convert(Path, Rows=ChunkRows): # Write the CSV log as an (N, 10) float64 .npy (time, 8 readings, status) that IterChunks memory-maps
+    with open(Path, "rb") as log_file:
+        Count = sum(1 for Line in log_file if Line.strip() and not Line.startswith(b"#"))
+    Output = open_memmap(BinaryPath(Path) + ".tmp.npy", mode="w+", dtype=np.float64, shape=(Count, 10))
+    Row = 0
+    for Time, Values, Status in IterCSV(Path, Rows):
+        Output[Row:Row + len(Time), 0] = Time
+        Output[Row:Row + len(Time), 1:9] = Values
+        Output[Row:Row + len(Time), 9] = Status
+        Row += len(Time)
+    Output.flush()
+    del Output
+    os.replace(BinaryPath(Path) + ".tmp.npy", BinaryPath(Path))
+    return Count
+
+def IterChunks(Path, Rows=ChunkRows): # Yield (Time, Readings, Status) chunks, from the memory map when an up to date .npy exists
+    if(Path.endswith(".npy")):
+        Binary = Path
+    elif(os.path.exists(BinaryPath(Path)) and os.path.getmtime(BinaryPath(Path)) >= os.path.getmtime(Path)):
+        Binary = BinaryPath(Path)
+    else:
+        yield from IterCSV(Path, Rows)
+        return
+    Data = np.load(Binary, mmap_mode="r")
+    for Start in range(0, len(Data), Rows):
+        Chunk = np.asarray(Data[Start:Start + Rows]) # Only this slice is paged in
+        yield Chunk[:, 0], Chunk[:, 1:9], Chunk[:, 9]
+
+def StatusBit(Status, Bit): # Bit 0..7 of the STATUS? string as logged (NaN stays NaN)
+    return np.floor(Status / 10.0 ** (7 - Bit)) % 10
+
+def Ripple(Chunks, Window=10.0): # Yield (Window start, Samples, peak to peak[8], RMS ripple[8]) for every Window seconds of data
+    Carry = None # Aggregates of the window still open at the end of the last chunk: [Id, Count, Min, Max, Sum, SumSq]
+    Origin = None
+    for Time, Values, Status in Chunks:
+        if(len(Time) == 0):
+            continue
+        if(Origin is None):
+            Origin = Time[0]
+        Ids = np.floor((Time - Origin) / Window).astype(np.int64)
+        Starts = np.concatenate(([0], np.flatnonzero(np.diff(Ids)) + 1))
+        Valid = ~np.isnan(Values) # "nan" readings (malformed or not polled) are left out of every aggregate
+        Clean = np.where(Valid, Values, 0.0)
+        Counts = np.add.reduceat(Valid, Starts, dtype=np.int64) # Per reading, so the RMS of each column uses its own sample count
+        Min = np.fmin.reduceat(Values, Starts)
+        Max = np.fmax.reduceat(Values, Starts)
+        Sum = np.add.reduceat(Clean, Starts)
+        SumSq = np.add.reduceat(Clean * Clean, Starts)
+        Groups = [[Ids[Start], Counts[i], Min[i], Max[i], Sum[i], SumSq[i]] for i, Start in enumerate(Starts)]
+        if(Carry is not None):
+            if(Groups[0][0] == Carry[0]): # Window split across the chunk boundary
+                First = Groups[0]
+                Groups[0] = [Carry[0], Carry[1] + First[1], np.fmin(Carry[2], First[2]), np.fmax(Carry[3], First[3]), Carry[4] + First[4], Carry[5] + First[5]]
+            else:
+                Groups.insert(0, Carry)
+        Carry = Groups.pop()
+        for Group in Groups:
+            yield RippleRow(Origin, Window, Group)
+    if(Carry is not None):
+        yield RippleRow(Origin, Window, Carry)
+
+def RippleRow(Origin, Window, Group):
+    Id, Count, Min, Max, Sum, SumSq = Group
+    with np.errstate(invalid="ignore", divide="ignore"): # A reading with no valid sample in the window stays NaN
+        Mean = Sum / Count
+        RMS = np.sqrt(np.maximum(SumSq / Count - Mean * Mean, 0.0))
+    return Origin + Id * Window, int(Count.max()), Max - Min, RMS # RMS ripple is the AC (mean removed) RMS
+
+def Settling(Chunks, Step=0.05, Tolerance=0.01, Hold=3): # Yield (Channel, Step time, From V, To V, Settling time s or NaN if a new step came first) for the voltage channels
+    Hold = max(1, int(Hold))
+    Tails = [None] * 4 # Per channel, last Hold-1 valid readings (at least one) of the previous chunks, their stability windows were not complete yet and a step into the next chunk is measured from the last
+    Pending = [[] for i in range(4)] # Steps still waiting to settle: (Step time, From V)
+    for Times, Values, Status in Chunks:
+        for Channel in range(4):
+            Valid = ~np.isnan(Values[:, Channel]) # NaN readings (malformed or not polled) are left out, a step is measured between the valid readings either side
+            Time = Times[Valid]
+            V = Values[Valid, Channel]
+            if(len(Time) == 0):
+                continue
+            First = 0 # Steps are only looked for in the readings new to this pass
+            if(Tails[Channel] is not None):
+                First = len(Tails[Channel][0])
+                Time = np.concatenate((Tails[Channel][0], Time))
+                V = np.concatenate((Tails[Channel][1], V))
+            Steps = np.flatnonzero(np.abs(np.diff(V)) > Step) + 1
+            Steps = Steps[Steps >= max(First, 1)]
+            if(len(V) >= Hold):
+                Windows = sliding_window_view(V, Hold)
+                Stable = np.flatnonzero(Windows.max(axis=1) - Windows.min(axis=1) <= 2 * Tolerance)
+            else:
+                Stable = np.array([], dtype=np.int64)
+            Events = [(Stepped, From, None) for Stepped, From in Pending[Channel]] + [(Time[Index], V[Index - 1], Index) for Index in Steps]
+            Pending[Channel] = []
+            for i, (Stepped, From, Index) in enumerate(Events):
+                Next = Events[i + 1][0] if i + 1 < len(Events) else None
+                Search = np.searchsorted(Time, Stepped) if Index is None else Index
+                Found = Stable[np.searchsorted(Stable, Search):]
+                Settled = Found[0] if len(Found) else None
+                if(Settled is not None and (Next is None or Time[Settled] < Next)):
+                    yield Channel + 1, Stepped, From, V[Settled], Time[Settled] - Stepped
+                elif(Next is not None):
+                    yield Channel + 1, Stepped, From, np.nan, np.nan # Superseded by the next step before it settled
+                else:
+                    Pending[Channel].append((Stepped, From))
+            Keep = min(max(Hold - 1, 1), len(Time))
+            Tails[Channel] = (Time[len(Time) - Keep:], V[len(V) - Keep:])
+    for Channel in range(4):
+        for Stepped, From in Pending[Channel]:
+            yield Channel + 1, Stepped, From, np.nan, np.nan # Log ended before it settled
+
+def Dwell(Chunks): # Return {"CH1": {"CC": s, "CV": s, "CC Entries": n}, "CH2": ...}, each interval counts toward the mode at its start
+    Result = {f"CH{i + 1}": {"CC": 0.0, "CV": 0.0, "CC Entries": 0} for i in range(2)}
+    Last = None # (Time, CC flags) of the last row with a status, carried between chunks
+    for Time, Values, Status in Chunks:
+        Valid = ~np.isnan(Status)
+        if(not Valid.any()):
+            continue
+        Time = Time[Valid]
+        CC = np.stack([StatusBit(Status[Valid], Bit) == 0 for Bit in range(2)], axis=1) # 1 is CV, 0 is CC
+        if(Last is not None):
+            Time = np.concatenate(([Last[0]], Time))
+            CC = np.concatenate(([Last[1]], CC))
+        Intervals = np.diff(Time)
+        for i, Channel in enumerate(("CH1", "CH2")):
+            Mode = CC[:-1, i]
+            Result[Channel]["CC"] += float(Intervals[Mode].sum())
+            Result[Channel]["CV"] += float(Intervals[~Mode].sum())
+            Result[Channel]["CC Entries"] += int(np.count_nonzero(CC[1:, i] & ~CC[:-1, i]))
+        Last = (Time[-1], CC[-1])
+    return Result
+
+if __name__=="__main__": # Command line front end, see the usage notes at the top
+    if(len(sys.argv) < 3):
+        print(Usage)
+        sys.exit(1)
+    LogPath, Analysis, Options = sys.argv[1], sys.argv[2], [float(Option) for Option in sys.argv[3:]]
+    Writer = csv.writer(sys.stdout)
+    if(Analysis == "convert"):
+        print(f"Wrote {Convert(LogPath)} rows to {BinaryPath(LogPath)}")
+    elif(Analysis == "ripple"):
+        Writer.writerow(["Window Start", "Samples"] + [Key + " P-P" for Key in Columns] + [Key + " RMS" for Key in Columns])
+        for Start, Count, PP, RMS in Ripple(IterChunks(LogPath), *Options[:1]):
+            Writer.writerow([f"{Start:.3f}", Count] + [f"{Value:.4f}" for Value in PP] + [f"{Value:.5f}" for Value in RMS])
+    elif(Analysis == "settling"):
+        Writer.writerow(["Channel", "Step Time", "From V", "To V", "Settling Time (s)"])
+        for Row in Settling(IterChunks(LogPath), *Options[:2], *[int(Option) for Option in Options[2:3]]):
+            Writer.writerow([Row[0], f"{Row[1]:.3f}", f"{Row[2]:.3f}", f"{Row[3]:.3f}", f"{Row[4]:.3f}"])
+    elif(Analysis == "dwell"):
+        Writer.writerow(["Channel", "CC (s)", "CV (s)", "CC Entries"])
+        for Channel, Dwelled in Dwell(IterChunks(LogPath)).items():
+            Writer.writerow([Channel, f"{Dwelled['CC']:.3f}", f"{Dwelled['CV']:.3f}", Dwelled["CC Entries"]])
+    else:
+        print(f"Unknown analysis: {Analysis}")
+        sys.exit(1)
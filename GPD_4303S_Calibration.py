@@ -0,0 +1,112 @@
+"""
+Name: GPD_4303S_Calibration.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Link calibration for the GPD-X303S, measures the reply latency of each command class at the current baud rate, derives tight timeouts and the smallest command gap that never drops a command, and keeps the result per serial number
+"""
+
+import json
+import os
+import statistics
+import time
+from PyQt6.QtCore import QThread, pyqtSignal
+import GPD_4303S_Codec
+
+ClassCommands = {"Measure": ["VOUT1?", "VOUT2?", "VOUT3?", "VOUT4?", "IOUT1?", "IOUT2?", "IOUT3?", "IOUT4?"], "Status": ["STATUS?"],
+                 "Setting": ["VSET1?", "ISET1?"], "Identity": ["*IDN?"]} # Queries timed for each class
+GapSteps = [0.0, 0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05] # Candidate command gaps (s), tried smallest first
+MinTimeout = 0.02 # Never time out faster than this, whatever the measured latency
+Path = "GPD_4303S_Calibration.json"
+
+def Latencies(Link, Commands, Count): # Round trip of each command Count times, a reply is never waited on longer than this (pipelined replies only arrive sooner)
+    Times = []
+    for i in range(Count):
+        for Command in Commands:
+            with Link.Lock:
+                Start = time.perf_counter()
+                Link.Resource.query(Command)
+                Times.append(time.perf_counter() - Start)
+    return Times
+
+def Timeout(Times): # Tight but safe: well above the slowest reply seen, never below MinTimeout
+    Times = sorted(Times)
+    P99 = Times[max(int(len(Times) * 0.99) - 1, 0)]
+    return round(max(MinTimeout, 3.0 * P99, 1.5 * Times[-1]) + 0.0005, 3) # Rounded up to the ms
+
+def GapHolds(Link, Gap, Trials, Channel=1): # True if bursts of setpoint writes Gap apart all land (the last value reads back) and no reply goes missing
+    Link.Gap = GapSteps[-1] # Reading and restoring the setpoint is always done at the safest gap
+    Original = GPD_4303S_Codec.Reading(Link.query(f"VSET{Channel}?"), "V")
+    if(Original != Original):
+        raise ValueError("Malformed VSET? reply")
+    try:
+        Link.Gap = Gap
+        for Trial in range(Trials):
+            Values = [f"{0.001 * (Trial * 5 + i + 1):.3f}" for i in range(5)] # Distinct values so a dropped write shows up as the wrong readback
+            for Value in Values:
+                Link.write(f"VSET{Channel}:{Value}", "script")
+            if(GPD_4303S_Codec.Reading(Link.query(f"VSET{Channel}?"), "V") != float(Values[-1])): # A malformed reply (NaN) fails too
+                return False
+            Link.QueryBatch(ClassCommands["Measure"])
+        return True
+    except Exception: # A reply that never came counts as a dropped command
+        time.sleep(0.1)
+        Link.Flush()
+        return False
+    finally:
+        Link.Gap = GapSteps[-1]
+        Link.write(f"VSET{Channel}:{Original}", "script")
+
+def Calibrate(Link, Count=200, Trials=20): # Returns the calibration dictionary, the output must be off (setpoints are written)
+    Result = {"Measured": time.strftime("%Y-%m-%d %H:%M:%S"), "Latency": {}, "Timeouts": {}, "Gap": GapSteps[-1]}
+    Link.Calibrate(0.0, {}) # Default timeout while measuring, each round trip finishes before the next command so no gap is needed yet
+    for Class, Commands in ClassCommands.items():
+        Times = Latencies(Link, Commands, Count if Class != "Identity" else max(Count // 10, 1))
+        Result["Latency"][Class] = {"Median": statistics.median(Times), "Max": max(Times)}
+        Result["Timeouts"][Class] = Timeout(Times)
+    Link.Calibrate(GapSteps[-1], Result["Timeouts"]) # Find the gap with the tight timeouts in place, so they are proven under load too
+    Held = False
+    for Gap in GapSteps: # The gap used is one step above the smallest that held, and that margin step has to hold as well (zero included)
+        if(not GapHolds(Link, Gap, Trials)):
+            Held = False
+            continue
+        if(Held or Gap == GapSteps[-1]):
+            Result["Gap"] = Gap
+            break
+        Held = True
+    Link.Calibrate(Result["Gap"], Result["Timeouts"])
+    return Result
+
+def Key(SN, BaudRate): # A calibration only holds for the supply and baud rate it was measured on
+    return f"{SN}@{BaudRate}"
+
+def Load(SN, BaudRate, Path=Path): # Stored calibration or None
+    if(not os.path.exists(Path)):
+        return None
+    with open(Path, "r") as calibration_file:
+        return json.load(calibration_file).get(Key(SN, BaudRate))
+
+def Save(SN, BaudRate, Result, Path=Path):
+    Stored = {}
+    if(os.path.exists(Path)):
+        with open(Path, "r") as calibration_file:
+            Stored = json.load(calibration_file)
+    Stored[Key(SN, BaudRate)] = Result
+    with open(Path, "w") as calibration_file:
+        json.dump(Stored, calibration_file, indent=1)
+
+def Describe(Result):
+    return f"gap {Result['Gap'] * 1e3:.1f} ms, timeouts " + ", ".join(f"{Class} {Seconds * 1e3:.0f} ms" for Class, Seconds in Result["Timeouts"].items())
+
+class CalibrationWorker(QThread): # Runs Calibrate off the GUI thread, it takes a few seconds
+    Finished = pyqtSignal(object)
+    Failed = pyqtSignal(str)
+
+    def __init__(self, Link, Parent=None):
+        super().__init__(Parent)
+        self.Link = Link
+
+    def run(self):
+        try:
+            self.Finished.emit(Calibrate(self.Link))
+        except Exception as e:
+            self.Failed.emit(str(e))
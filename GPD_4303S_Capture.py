@@ -0,0 +1,93 @@
+"""
+Name: GPD_4303S_Capture.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Triggered capture for the GPD-X303S GUI, keeps a ring buffer of pre-trigger samples and records a post-trigger window at the maximum link rate when a channel enters CC mode or crosses a trigger level
+"""
+
+import collections
+import csv
+import os
+from datetime import datetime
+import GPD_4303S_Alarms
+import GPD_4303S_Codec
+
+class TriggerCapture():
+    def __init__(self):
+        self.PreSamples = 10 # Samples of history kept before the trigger
+        self.PostSeconds = 2.0 # Length of the post-trigger window, acquired as fast as the link allows
+        self.TriggerOnCC = True # Trigger when CH1 or CH2 drops from CV into CC (STATUS? bits 0/1)
+        self.Levels = GPD_4303S_Alarms.AlarmLimits() # Trigger levels use the same low/high checks as the alarms
+        self.Prefix = "GPD_4303S_Capture" # File name prefix, the GUI adds the SN
+        self.Armed = False
+        self.History = collections.deque(maxlen=self.PreSamples)
+        self.Post = None # Samples after the trigger, None while waiting for a trigger
+        self.PostEnd = 0.0
+        self.Reason = ""
+        self.LastCC = (False, False)
+
+    def Arm(self):
+        self.History = collections.deque(maxlen=self.PreSamples)
+        self.Post = None
+        self.LastCC = (False, False)
+        self.Armed = True
+
+    def Disarm(self):
+        self.Armed = False
+        self.Post = None
+
+    def NeedsStatus(self): # The worker only adds STATUS? to its batch when a CC trigger is wanted
+        return self.Armed and self.TriggerOnCC
+
+    def Capturing(self): # True during the post-trigger window, the worker runs at full rate
+        return self.Post is not None
+
+    def Trigger(self, Sample): # Return the trigger reason for a sample, empty string if it does not trigger
+        Reasons = []
+        if(self.TriggerOnCC and Sample.get("Status")):
+            Status = Sample["Status"]
+            CC = (Status[0] == "0", Status[1] == "0") # 1 is CV, 0 is CC
+            for i in range(2):
+                if(CC[i] and not self.LastCC[i]): # Only the CV to CC edge triggers
+                    Reasons.append(f"CH{i + 1} CC")
+            self.LastCC = CC
+        for Key, Value, Kind, Limit in self.Levels.Check(Sample["Voltages"], Sample["Currents"]):
+            Reasons.append(f"{Key} {Kind} {Limit}")
+        return ", ".join(Reasons)
+
+    def Add(self, Sample): # Feed every sample the worker takes, returns the file name when a capture has just been written
+        if(not self.Armed):
+            return None
+        if(self.Post is None):
+            Reason = self.Trigger(Sample)
+            if(not Reason):
+                self.History.append(Sample)
+                return None
+            self.Reason = Reason
+            self.Post = [Sample]
+            self.PostEnd = Sample["Time"] + self.PostSeconds
+            return None
+        self.Post.append(Sample)
+        if(Sample["Time"] < self.PostEnd):
+            return None
+        Path = self.Dump()
+        self.Arm() # Re-arm for the next event
+        return Path
+
+    def Dump(self): # Write the pre-trigger history and the post-trigger window to their own file
+        Trigger = self.Post[0]
+        Name = self.Prefix + "_" + datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3] # Milliseconds, triggers can follow each other within a second
+        Path = Name + ".csv"
+        Count = 1
+        while os.path.exists(Path): # Never overwrite an earlier capture
+            Path = f"{Name}_{Count}.csv"
+            Count += 1
+        with open(Path, mode='w', newline='') as capture_file:
+            csv_writer = csv.writer(capture_file)
+            csv_writer.writerow(["# Trigger", Trigger["Stamp"], self.Reason])
+            csv_writer.writerow(["Time", "Offset (s)", "Phase", "V1", "V2", "V3", "V4", "A1", "A2", "A3", "A4"])
+            for Phase, Samples in (("PRE", self.History), ("POST", self.Post)):
+                for Sample in Samples:
+                    csv_writer.writerow([Sample["Stamp"], f"{Sample['Time'] - Trigger['Time']:.4f}", "TRIG" if Sample is Trigger else Phase] +
+                                        [GPD_4303S_Codec.Format(Value) for Value in Sample["Voltages"] + Sample["Currents"]])
+        return Path
@@ -0,0 +1,62 @@
+"""
+Name: GPD_4303S_Checkpoint.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Crash-safe session checkpoint for the GPD-X303S GUI, the session state is written to a small JSON file with an atomic replace at a bounded rate so a restart after a crash can re-attach to the running power supply instead of resetting it
+"""
+
+import json
+import os
+
+Interval = 2.0 # Seconds between checkpoint writes at most, a crash loses at most this much of the session state
+
+def CheckpointPath(SN):
+    return "GPD_4303S_Checkpoint_" + str(SN) + ".json"
+
+def Load(Path): # Stored session state, None if there is none or it cannot be read
+    try:
+        with open(Path, "r") as checkpoint_file:
+            return json.load(checkpoint_file)
+    except (OSError, ValueError):
+        return None
+
+def RepairLog(Path, Size): # Cut a partial last row (crash mid-write) off the log before it is appended to, returns (bytes cut, whether the log is shorter than the checkpointed Size)
+    if(not os.path.exists(Path)):
+        return 0, Size > 0
+    with open(Path, "rb+") as log_file:
+        End = log_file.seek(0, os.SEEK_END)
+        Start = End
+        while Start > 0:
+            Start = max(0, Start - 65536)
+            log_file.seek(Start)
+            Newline = log_file.read(End - Start).rfind(b"\n")
+            if(Newline >= 0):
+                Keep = Start + Newline + 1
+                break
+        else:
+            Keep = 0
+        if(Keep < End):
+            log_file.truncate(Keep)
+    return End - Keep, Keep < Size
+
+class CheckpointWriter():
+    def __init__(self, Path):
+        self.Path = Path
+        self.Last = None # Text of the last checkpoint written, an unchanged state is not written again
+
+    def Save(self, State, Volatile=None): # Write State if it changed, the old checkpoint stays whole until the new one has reached the disk
+        Text = json.dumps(State)
+        if(Text == self.Last): # Volatile fields (save time, log size) are left out of the comparison, they change on every call
+            return False
+        with open(self.Path + ".tmp", "w") as checkpoint_file:
+            checkpoint_file.write(json.dumps(dict(State, **Volatile)) if Volatile else Text)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(self.Path + ".tmp", self.Path)
+        self.Last = Text
+        return True
+
+    def Remove(self): # Clean shutdown, nothing to resume next time
+        self.Last = None
+        if(os.path.exists(self.Path)):
+            os.remove(self.Path)
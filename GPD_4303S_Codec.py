@@ -0,0 +1,62 @@
+"""
+Name: GPD_4303S_Codec.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Typed parsing of GPD-X303S replies (readings, STATUS?, *IDN?) in one pass each, checking the frame, number format and unit so a malformed reply becomes NaN or None instead of an exception or a silently wrong value
+"""
+
+import math
+import re
+
+NaN = math.nan
+ReadingFormat = re.compile(r"(\d{1,2}\.\d{3})([VA])\r?\n?") # The power supply always sends three decimals and the unit, "12.345V\r\n"
+StatusFormat = re.compile(r"([01]{8})\r?\n?")
+IdentityFormat = re.compile(r"([^,]*),([^,]*),SN:([^,]*),([^,\s]*)\s*")
+Units = {"VOUT": "V", "IOUT": "A", "VSET": "V", "ISET": "A"} # Unit each reading query has to come back with
+Tracking = {"01": "Independent", "11": "Series", "10": "Parallel"}
+BaudRates = {"00": "115200", "01": "57600", "10": "9600"}
+
+def Unit(Command): # "VOUT1?" -> "V"
+    return Units[Command[:4]]
+
+def Reading(Reply, Unit): # "1.234V\r\n" -> 1.234, NaN if the reply is malformed or has the wrong unit
+    Match = ReadingFormat.fullmatch(Reply)
+    if(Match is None or Match.group(2) != Unit):
+        return NaN
+    return float(Match.group(1))
+
+def Status(Reply): # "11011000\r\n" -> "11011000", None if it is not eight 0/1 bits
+    Match = StatusFormat.fullmatch(Reply)
+    return Match.group(1) if Match is not None else None
+
+def StatusFields(Reply): # STATUS? as the values ReadState shows, None if malformed
+    Bits = Status(Reply)
+    if(Bits is None):
+        return None
+    return {"C1CCCV": "CV" if Bits[0] == "1" else "CC", "C2CCCV": "CV" if Bits[1] == "1" else "CC", "Track": Tracking.get(Bits[2:4], "Unknown"),
+            "Beep": "ON" if Bits[4] == "1" else "OFF", "Output": "ON" if Bits[5] == "1" else "OFF", "BaudRate": BaudRates.get(Bits[6:8], "Unknown")}
+
+def Identity(Reply): # "GW INSTEK,GPD-4303S,SN:GEX123456,V1.00\r\n" -> dictionary, None if malformed
+    Match = IdentityFormat.fullmatch(Reply)
+    if(Match is None):
+        return None
+    return {"Mfr.": Match.group(1), "Model": Match.group(2), "SN": Match.group(3), "FWVer": Match.group(4)}
+
+class BatchParser(): # One pattern compiled per command list, so a whole pipelined batch (readings then an optional STATUS?) is checked and split by a single match
+    def __init__(self, Commands):
+        self.Commands = list(Commands)
+        self.Count = len([Command for Command in self.Commands if Command != "STATUS?"]) # Readings come first
+        self.Units = [Unit(Command) for Command in self.Commands[:self.Count]]
+        self.Pattern = re.compile("".join(r"([01]{8})\r\n" if Command == "STATUS?" else r"(\d{1,2}\.\d{3})" + Unit(Command) + r"\r\n" for Command in self.Commands))
+
+    def Parse(self, Replies): # Returns (readings, status bits or None, malformed count), a malformed reading is NaN
+        Match = self.Pattern.fullmatch("".join(Replies))
+        if(Match is not None): # Every reply well formed, the usual case
+            Groups = Match.groups()
+            return list(map(float, Groups[:self.Count])), Groups[self.Count] if len(Groups) > self.Count else None, 0
+        Values = [Reading(Reply, Expected) for Reply, Expected in zip(Replies, self.Units)] # Find which ones are bad
+        Bits = Status(Replies[self.Count]) if len(Replies) > self.Count else None
+        return Values, Bits, sum(1 for Value in Values if Value != Value) + (1 if len(Replies) > self.Count and Bits is None else 0)
+
+def Format(Value): # Reading as the power supply wrote it, for the display and the log
+    return "nan" if Value != Value else f"{Value:.3f}"
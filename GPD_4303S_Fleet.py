@@ -0,0 +1,149 @@
+"""
+Name: GPD_4303S_Fleet.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Summarise the GPD-X303S logs of a whole fleet of power supplies (energy, min/max, alarm counts, uptime) by spreading files, and byte ranges of large files, across a pool of processes
+"""
+
+Usage = """
+Usage: python GPD_4303S_Fleet.py SUMMARY.csv LOG [LOG ...] [--workers N] [--chunk-mb M] [--max-gap S]
+- LOG files are GPD_4303S_Log_<SN>.csv, alarm counts come from the GPD_4303S_Events_<SN>.csv next to each one
+- --workers N   Processes to use (default: every CPU core, 1 runs serially)
+- --chunk-mb M  Files larger than this are split into ranges of this size (default 64)
+- --max-gap S   Gaps between samples longer than this do not count as uptime (default 5 s)
+"""
+
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import GPD_4303S_Analysis
+
+Columns = GPD_4303S_Analysis.Columns
+
+def Ranges(Path, ChunkBytes): # Split a file into byte ranges, each range owns the lines that start inside it
+    Size = os.path.getsize(Path)
+    return [(Path, Start, min(Start + ChunkBytes, Size)) for Start in range(0, max(Size, 1), ChunkBytes)]
+
+def ReadRange(Path, Start, End, Rows=GPD_4303S_Analysis.ChunkRows): # Yield parsed chunks for the lines starting in [Start, End)
+    with open(Path, "rb") as log_file:
+        log_file.seek(Start)
+        if(Start > 0):
+            log_file.seek(Start - 1)
+            log_file.readline() # Finish the line that straddles the start, it belongs to the previous range
+        Lines = []
+        while log_file.tell() < End:
+            Line = log_file.readline()
+            if(not Line):
+                break
+            if(Line.startswith(b"#") or not Line.strip()):
+                continue
+            Lines.append(Line.decode("ascii", "replace").rstrip("\r\n"))
+            if(len(Lines) >= Rows):
+                yield GPD_4303S_Analysis.ParseLines(Lines)
+                Lines = []
+        if(Lines):
+            yield GPD_4303S_Analysis.ParseLines(Lines)
+
+def Summarise(Task): # Worker: partial aggregate of one byte range, mergeable with its neighbours
+    Path, Start, End, MaxGap = Task
+    Part = {"Path": Path, "Start": Start, "Count": 0, "Min": np.full(8, np.inf), "Max": np.full(8, -np.inf),
+            "Energy": np.zeros(4), "Uptime": 0.0, "First": None, "Last": None}
+    for Time, Values, Status in ReadRange(Path, Start, End):
+        if(Part["Last"] is not None): # Stitch this chunk to the previous one
+            Time = np.concatenate(([Part["Last"][0]], Time))
+            Values = np.concatenate(([Part["Last"][1]], Values))
+            Part["Count"] -= 1
+        else:
+            Part["First"] = (Time[0], Values[0])
+        Part["Count"] += len(Time)
+        Part["Min"] = np.fmin(Part["Min"], np.fmin.reduce(Values, axis=0)) # fmin/fmax skip "nan" readings (malformed or not polled), an all-NaN column leaves the running value alone
+        Part["Max"] = np.fmax(Part["Max"], np.fmax.reduce(Values, axis=0))
+        Power = Values[:, :4] * Values[:, 4:]
+        Intervals = np.diff(Time)
+        Up = (Intervals > 0) & (Intervals <= MaxGap) # Power off gaps (between runs) count as neither energy nor uptime
+        Trapezoids = (Power[1:] + Power[:-1]) * 0.5 * (Intervals * Up)[:, None]
+        Part["Energy"] += np.where(np.isnan(Trapezoids), 0.0, Trapezoids).sum(axis=0) / 3600.0 # Intervals with a NaN at either end carry no energy
+        Part["Uptime"] += float(Intervals[Up].sum())
+        Part["Last"] = (Time[-1], Values[-1])
+    return Part
+
+def Merge(Parts, MaxGap): # Join the ranges of one file in order, adding the interval between neighbouring ranges
+    Total = None
+    for Part in sorted(Parts, key=lambda Part: Part["Start"]):
+        if(Part["Count"] == 0):
+            continue
+        if(Total is None):
+            Total = Part
+            continue
+        Interval = Part["First"][0] - Total["Last"][0]
+        if(0 < Interval <= MaxGap):
+            Before = Total["Last"][1]
+            After = Part["First"][1]
+            Trapezoid = (Before[:4] * Before[4:] + After[:4] * After[4:]) * 0.5 * Interval / 3600.0
+            Total["Energy"] += np.where(np.isnan(Trapezoid), 0.0, Trapezoid)
+            Total["Uptime"] += Interval
+        Total["Count"] += Part["Count"]
+        Total["Min"] = np.fmin(Total["Min"], Part["Min"])
+        Total["Max"] = np.fmax(Total["Max"], Part["Max"])
+        Total["Energy"] += Part["Energy"]
+        Total["Uptime"] += Part["Uptime"]
+        Total["Last"] = Part["Last"]
+    return Total
+
+def AlarmCount(LogPath): # Trips recorded in the event log of the same power supply
+    Folder, Name = os.path.split(LogPath)
+    EventPath = os.path.join(Folder, Name.replace("GPD_4303S_Log_", "GPD_4303S_Events_"))
+    if(EventPath == LogPath or not os.path.exists(EventPath)):
+        return 0
+    with open(EventPath, "r", newline="") as event_file:
+        return sum(1 for Row in csv.reader(event_file) if len(Row) > 1 and Row[1] == "TRIP")
+
+def FleetSummary(Paths, Workers=None, ChunkBytes=64 << 20, MaxGap=5.0): # Returns one summary dictionary per log
+    Tasks = [Range + (MaxGap,) for Path in Paths for Range in Ranges(Path, ChunkBytes)]
+    Tasks.sort(key=lambda Task: Task[2] - Task[1], reverse=True) # Largest ranges first so the pool finishes evenly
+    if(Workers == 1):
+        Parts = [Summarise(Task) for Task in Tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=Workers) as Pool:
+            Parts = list(Pool.map(Summarise, Tasks))
+    Summaries = []
+    for Path in Paths:
+        Total = Merge([Part for Part in Parts if Part["Path"] == Path], MaxGap)
+        if(Total is None):
+            continue
+        Total["Alarms"] = AlarmCount(Path)
+        Summaries.append(Total)
+    return Summaries
+
+def WriteSummary(OutputPath, Summaries):
+    with open(OutputPath, mode='w', newline='') as summary_file:
+        csv_writer = csv.writer(summary_file)
+        csv_writer.writerow(["Log", "Samples", "Uptime (h)", "Alarms"] + [f"CH{i + 1} Energy (Wh)" for i in range(4)] + [Key + " Min" for Key in Columns] + [Key + " Max" for Key in Columns])
+        for Summary in Summaries:
+            csv_writer.writerow([os.path.basename(Summary["Path"]), Summary["Count"], f"{Summary['Uptime'] / 3600:.3f}", Summary["Alarms"]] +
+                                [f"{Value:.6f}" for Value in Summary["Energy"]] + [f"{Value:.3f}" for Value in np.concatenate((Summary["Min"], Summary["Max"]))])
+        if(Summaries):
+            csv_writer.writerow(["FLEET", sum(Summary["Count"] for Summary in Summaries), f"{sum(Summary['Uptime'] for Summary in Summaries) / 3600:.3f}", sum(Summary["Alarms"] for Summary in Summaries)] +
+                                [f"{Value:.6f}" for Value in sum(Summary["Energy"] for Summary in Summaries)] +
+                                [f"{Value:.3f}" for Value in np.min([Summary["Min"] for Summary in Summaries], axis=0)] +
+                                [f"{Value:.3f}" for Value in np.max([Summary["Max"] for Summary in Summaries], axis=0)])
+
+if __name__=="__main__": # Command line front end, see the usage notes at the top
+    Arguments = sys.argv[1:]
+    Options = {"--workers": None, "--chunk-mb": 64.0, "--max-gap": 5.0}
+    for Option in Options:
+        if(Option in Arguments):
+            i = Arguments.index(Option)
+            Options[Option] = float(Arguments[i + 1])
+            del Arguments[i:i + 2]
+    if(len(Arguments) < 2):
+        print(Usage)
+        sys.exit(1)
+    Workers = None if Options["--workers"] is None else int(Options["--workers"])
+    Start = time.perf_counter()
+    Summaries = FleetSummary(Arguments[1:], Workers, int(Options["--chunk-mb"] * (1 << 20)), Options["--max-gap"])
+    WriteSummary(Arguments[0], Summaries)
+    print(f"Summarised {len(Summaries)} logs in {time.perf_counter() - Start:.2f} s with {Workers or os.cpu_count()} worker(s)")
@@ -18,35 +18,106 @@ Other Python Modules To Install Beyond (PyVISA, PyVISA-py, PyUSB) (Likely will n
 import sys
 from PyQt6 import QtWidgets
 from PyQt6.QtCore import QTimer
-from datetime import datetime
 import csv
+import os
+import time
+from datetime import datetime
 import pyvisa
+import GPD_4303S_Presets
+import GPD_4303S_Stats
+import GPD_4303S_Link
+import GPD_4303S_Transport
+import GPD_4303S_Calibration
+import GPD_4303S_Trace
+import GPD_4303S_Simulator
+import GPD_4303S_Codec
+import GPD_4303S_Journal
+import GPD_4303S_Checkpoint
+import GPD_4303S_Metrics
+import GPD_4303S_Stream
+import GPD_4303S_Alarms
+import GPD_4303S_Acquisition
+import GPD_4303S_Capture
+import GPD_4303S_History
+import GPD_4303S_LogIndex
+import GPD_4303S_Sweep
+import GPD_4303S_Regulator
 import GPD_4303S_GUI_UI_Small as GPD_4303S_GUI_UI # If you want to use the smaller GUI (built for 720p) that is included switch out the left side of the import for GPD_4303S_GUI_UI with GPD_4303S_GUI_UI_Small
 
 class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
-    def __init__(self, Resource="ASRL3::INSTR"):
+    SetpointKeys = ["A1", "A2", "A3", "A4", "V1", "V2", "V3", "V4"] # ChannelSettings keys in the order they are written
+    SetpointCommands = {"V1": "VSET1", "V2": "VSET2", "V3": "VSET3", "V4": "VSET4", "A1": "ISET1", "A2": "ISET2", "A3": "ISET3", "A4": "ISET4"}
+    StateCommands = {"OUT0": ("Output", "OFF"), "OUT1": ("Output", "ON"), "BEEP0": ("Beep", "OFF"), "BEEP1": ("Beep", "ON"),
+                     "TRACK0": ("Track", "Independent"), "TRACK1": ("Track", "Series"), "TRACK2": ("Track", "Parallel")} # STATUS? field each command sets, checked for the journal
+
+    def __init__(self, Resource="ASRL3::INSTR", Backend="visa", Record=None, Resume=None, Metrics=None, Stream=None):
         print(Resource)
         super().__init__()
         self.PSstate = {} # No need to initalize, the power supply will tell us this
         self.ChannelSettings = {} # Current state of the power supply channel, will be initalized
         self.SavedSettings = [{},{},{},{}] # Create a lit of dictionaries that is the saved memory settings, will fill with data read from power supply
+        self.Presets = GPD_4303S_Presets.PresetLibrary() # Named presets stored on disk, no limit on how many
+        self.Stats = GPD_4303S_Stats.StatsEngine() # Running per-channel statistics and energy, fed by MeasureOutputs
+        self.History = GPD_4303S_History.TieredHistory() # Full rate recent data plus 1 s/1 min/1 h min/max/mean tiers, bounded in memory
         self.setupUi(self)
         self.RM = pyvisa.ResourceManager("@py") # PyVISA wrapper intstance for PyVISA-py
         print(self.RM.list_resources()) # use this to find out what resource your computer has designated the power supply to
-        self.GPD_4303S_RM = self.RM.open_resource(Resource) # What COM port I found the power supply I was developing on was connected to (likely different for you, I found it was random through exploring the other power supplies of the same model in my lab)
-        self.GPD_4303S_RM.baud_rate = 115200 # If you are starting new, you will likely have to change this value (Possible Values: 9600, 57600, 115200 , Default is 9600)
+        self.BaudRate = BaudRate = 115200 # If you are starting new, you will likely have to change this value (Possible Values: 9600, 57600, 115200 , Default is 9600)
+        if(Backend == "serial"): # Direct pyserial transport, skips the PyVISA layers on every transaction
+            Opener = lambda: GPD_4303S_Transport.SerialTransport(Resource, BaudRate)
+        elif(Backend in ("replay", "realtime")): # Resource is a trace recorded with Record, replayed as fast as possible or at the recorded reply latency
+            Opener = lambda: GPD_4303S_Trace.ReplayTransport(Resource, Backend == "realtime")
+        elif(Backend == "simulate"): # No power supply, Resource is the fault injection spec for the simulated one ("" for none)
+            Supply = GPD_4303S_Simulator.SimulatedSupply()
+            Faults = GPD_4303S_Simulator.ParseFaults(Resource)
+            Opener = lambda: GPD_4303S_Simulator.SimulatedTransport(Supply, Faults)
+        else: # Resource is what COM port I found the power supply I was developing on was connected to (likely different for you, I found it was random through exploring the other power supplies of the same model in my lab)
+            Opener = lambda: GPD_4303S_Transport.VisaTransport(self.RM, Resource, BaudRate)
+        if(Record is not None): # Record every command and reply to a trace file for replay
+            Writer = GPD_4303S_Trace.TraceWriter(Record)
+            Open = Opener
+            Opener = lambda: GPD_4303S_Trace.RecordingTransport(Open(), Writer)
+        Instrument = Opener() # Opener is kept by the link so the acquisition worker can reopen the port if the adapter drops
         # To modify the baud rate you need to use the current baud rate (Try each of the 3 setting) to set a new baudrate (BAUD0 = 115200, BAUD1 = 57600, BAUD2 = 9600) with the command commented out below
         # changing the baud rate will disconnect the instance. Once you have changed the baud rate you need to start a new instance using the baud rate you set with the above ^ ".baudrate = New Baud Rate"
-        #self.GPD_4303S_RM.write("BAUD0") # comment this line out once you have modified you own power supplies initial setting for baud rate
+        #Instrument.write("BAUD0") # comment this line out once you have modified you own power supplies initial setting for baud rate
+        self.GPD_4303S_RM = GPD_4303S_Link.GPD_4303S_Link(Instrument, Opener) # Locked wrapper so the acquisition worker and the GUI can share the port
+        self.Alarms = GPD_4303S_Alarms.AlarmLimits() # Software limits checked against every sample on the acquisition worker
+        self.Capture = GPD_4303S_Capture.TriggerCapture() # Pre/post-trigger capture around CC events and trigger levels
+        self.Acquisition = GPD_4303S_Acquisition.AcquisitionWorker(self.GPD_4303S_RM, self.Alarms, self.Capture, self) # Periodic reading of the outputs, off the GUI thread
+        self.Acquisition.SampleReady.connect(self.MeasureOutputs)
+        self.Acquisition.Failed.connect(self.AcquisitionFailed)
+        self.Acquisition.Tripped.connect(self.AlarmTripped)
+        self.Acquisition.CaptureSaved.connect(self.CaptureSaved)
+        self.Acquisition.LinkLost.connect(self.LinkLost)
+        self.Acquisition.Reconnecting.connect(self.LinkReconnecting)
+        self.Acquisition.Reconnected.connect(self.LinkReconnected)
         self.ReadState() # Read Out status information about the connected GPD-4303S power supply
         self.IdentifyPS() # Read out indentifying information about the connected GPD-4303S power supply
-        self.ReadMemSetting() # Read Memory settings to grab the memory states already on the power supply
-        self.PSReset() # Channel Settings Initialized Here
-        self.UpdateSettingInterface() # Update interface to match the power supply
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.MeasureOutputs)
+        self.Acquisition.EventPath = "GPD_4303S_Events_" + str(self.PSstate.get("SN")) + ".csv" # Alarm trips are logged per power supply
+        self.Capture.Prefix = "GPD_4303S_Capture_" + str(self.PSstate.get("SN"))
+        self.Acquisition.SN = self.PSstate.get("SN") # Only this power supply is accepted back after a reconnect
+        self.Journal = GPD_4303S_Journal.JournalWriter("GPD_4303S_Journal_" + str(self.PSstate.get("SN")) + ".gpdj") # Append-only record of every setting command, its origin and readback
+        self.GPD_4303S_RM.Journal = self.Journal
+        self.LoadCalibration() # Run at the link limits measured for this power supply, if it has been calibrated
+        self.LogIndex = GPD_4303S_LogIndex.LogIndexWriter(self.LogPath()) # Sidecar index (byte offset every N rows) for fast time range lookups in the log
+        Checkpoint = GPD_4303S_Checkpoint.Load(GPD_4303S_Checkpoint.CheckpointPath(self.PSstate.get("SN"))) # Left behind when the last session did not shut down cleanly
+        if(Checkpoint is not None and (Resume if Resume is not None else self.AskResume(Checkpoint))):
+            self.ResumeSession(Checkpoint) # Re-attach to the power supply as it is, no recall and no reset
+        else:
+            self.ReadMemSetting() # Read Memory settings to grab the memory states already on the power supply
+            self.PSReset("startup") # Channel Settings Initialized Here, journaled apart from a reset the user asks for
+            self.UpdateSettingInterface() # Update interface to match the power supply
+        self.Checkpoint = GPD_4303S_Checkpoint.CheckpointWriter(GPD_4303S_Checkpoint.CheckpointPath(self.PSstate.get("SN")))
+        self.CheckpointTimer = QTimer(self) # Session state is checkpointed at a bounded rate, only when it changed
+        self.CheckpointTimer.timeout.connect(self.SaveCheckpoint)
+        self.CheckpointTimer.start(int(GPD_4303S_Checkpoint.Interval * 1000))
+        self.LastSample = None # Latest sample logged, served by the metrics endpoint
+        self.Logged = 0 # Samples written to the log, the worker's count minus this is how many are still queued for the GUI thread
+        self.Metrics = GPD_4303S_Metrics.MetricsServer(self.MetricsText, Metrics) if Metrics is not None else None # Prometheus endpoint on this port, off by default
+        self.Stream = GPD_4303S_Stream.StreamServer(Stream) if Stream is not None else None # WebSocket push of every logged sample on this port, off by default
         self.actionExit.triggered.connect(self.GUI_Shutdown)
-        self.pushButtonOutput.clicked.connect(self.OutputToggle)
+        self.pushButtonOutput.clicked.connect(lambda: self.OutputToggle())
         self.actionSave_State_1.triggered.connect(self.SaveState1)
         self.actionSave_State_2.triggered.connect(self.SaveState2)
         self.actionSave_State_3.triggered.connect(self.SaveState3)
@@ -57,7 +128,32 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
         self.actionLoad_State_4.triggered.connect(self.LoadState4)
         self.action_ToggleBeep.triggered.connect(self.BeepToggle)
         self.actionToggleTracking.triggered.connect(self.TrackingChange)
-        self.actionReset.triggered.connect(self.PSReset)
+        self.actionReset.triggered.connect(lambda: self.PSReset())
+        self.actionApply_All.triggered.connect(self.ApplyAll)
+        self.actionSave_Preset.triggered.connect(self.SavePreset)
+        self.actionLoad_Preset.triggered.connect(self.LoadPreset)
+        self.actionDelete_Preset.triggered.connect(self.DeletePreset)
+        self.actionShow_Statistics.triggered.connect(self.ShowStatistics)
+        self.actionReset_Statistics.triggered.connect(self.Stats.Reset)
+        self.actionSet_Alarm_Limit.triggered.connect(self.SetAlarmLimit)
+        self.actionClear_Alarm_Limits.triggered.connect(self.ClearAlarmLimits)
+        self.actionShow_Alarm_Limits.triggered.connect(self.ShowAlarmLimits)
+        self.actionConfigure_Capture.triggered.connect(self.ConfigureCapture)
+        self.actionSet_Capture_Trigger.triggered.connect(self.SetCaptureTrigger)
+        self.actionArm_Capture.triggered.connect(self.ArmCapture)
+        self.actionDisarm_Capture.triggered.connect(self.DisarmCapture)
+        self.actionExport_History.triggered.connect(self.ExportHistory)
+        self.actionClear_History.triggered.connect(self.History.Clear)
+        self.actionQuery_Log_Range.triggered.connect(self.QueryLogRange)
+        self.actionRebuild_Log_Index.triggered.connect(self.RebuildLogIndex)
+        self.actionRun_Sweep.triggered.connect(self.RunSweep)
+        self.actionStop_Sweep.triggered.connect(self.StopSweep)
+        self.actionStep_Response.triggered.connect(self.RunStepResponse)
+        self.actionConstant_Power.triggered.connect(lambda: self.StartRegulator("CP"))
+        self.actionConstant_Resistance.triggered.connect(lambda: self.StartRegulator("CR"))
+        self.actionStop_Regulator.triggered.connect(self.StopRegulator)
+        self.actionPolling.triggered.connect(self.SetPolling)
+        self.actionCalibrate_Link.triggered.connect(self.CalibrateLink)
         self.pushButtonV1Set.clicked.connect(self.V1Set)
         self.pushButtonV2Set.clicked.connect(self.V2Set)
         self.pushButtonV3Set.clicked.connect(self.V3Set)
@@ -70,39 +166,41 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
     def TrackingChange(self): # Cycle to the next tracking setting built-into the power supply
         try:
             if(self.PSstate["Track"] == "Independent"):
-                self.GPD_4303S_RM.write("TRACK1")
+                Command = "TRACK1"
             elif(self.PSstate["Track"] == "Series"):
-                self.GPD_4303S_RM.write("TRACK2")
+                Command = "TRACK2"
             elif(self.PSstate["Track"] == "Parallel"):
-                self.GPD_4303S_RM.write("TRACK0")
+                Command = "TRACK0"
             else:
                 self.textEditMSG.setText("Error: Unknown tracking state")
+                return
+            self.GPD_4303S_RM.write(Command)
             self.ReadState()
+            self.VerifyState(Command)
         except Exception as e:
             self.textEditMSG.setText(f"Error in TrackingChange: {e}")
 
     def BeepToggle(self): # Toggle the beep (Will beep when swapping OFF to ON)
         try:
-            if(self.PSstate["Beep"] == "OFF"):
-                self.GPD_4303S_RM.write("BEEP1")
-            elif(self.PSstate["Beep"] == "ON"):
-                self.GPD_4303S_RM.write("BEEP0")
+            Command = "BEEP1" if self.PSstate["Beep"] == "OFF" else "BEEP0"
+            self.GPD_4303S_RM.write(Command)
             self.ReadState()
+            self.VerifyState(Command)
         except Exception as e:
             self.textEditMSG.setText(f"Error in BeepToggle: {e}")
 
     def ReadMemSetting(self): # Cycle through the built in memory to initalize a copy dataset
         try:
             for i in range(1,5):
-                self.GPD_4303S_RM.write("RCL" + str(i))
-                self.SavedSettings[i-1]["V1"] = float(self.GPD_4303S_RM.query("VSET1?")[:-3])
-                self.SavedSettings[i-1]["V2"] = float(self.GPD_4303S_RM.query("VSET2?")[:-3])
-                self.SavedSettings[i-1]["V3"] = float(self.GPD_4303S_RM.query("VSET3?")[:-3])
-                self.SavedSettings[i-1]["V4"] = float(self.GPD_4303S_RM.query("VSET4?")[:-3])
-                self.SavedSettings[i-1]["A1"] = float(self.GPD_4303S_RM.query("ISET1?")[:-3])
-                self.SavedSettings[i-1]["A2"] = float(self.GPD_4303S_RM.query("ISET2?")[:-3])
-                self.SavedSettings[i-1]["A3"] = float(self.GPD_4303S_RM.query("ISET3?")[:-3])
-                self.SavedSettings[i-1]["A4"] = float(self.GPD_4303S_RM.query("ISET4?")[:-3])
+                self.GPD_4303S_RM.write("RCL" + str(i), "script") # Not asked for by the user, journaled as the application's own
+                self.SavedSettings[i-1]["V1"] = GPD_4303S_Codec.Reading(self.GPD_4303S_RM.query("VSET1?"), "V")
+                self.SavedSettings[i-1]["V2"] = GPD_4303S_Codec.Reading(self.GPD_4303S_RM.query("VSET2?"), "V")
+                self.SavedSettings[i-1]["V3"] = GPD_4303S_Codec.Reading(self.GPD_4303S_RM.query("VSET3?"), "V")
+                self.SavedSettings[i-1]["V4"] = GPD_4303S_Codec.Reading(self.GPD_4303S_RM.query("VSET4?"), "V")
+                self.SavedSettings[i-1]["A1"] = GPD_4303S_Codec.Reading(self.GPD_4303S_RM.query("ISET1?"), "A")
+                self.SavedSettings[i-1]["A2"] = GPD_4303S_Codec.Reading(self.GPD_4303S_RM.query("ISET2?"), "A")
+                self.SavedSettings[i-1]["A3"] = GPD_4303S_Codec.Reading(self.GPD_4303S_RM.query("ISET3?"), "A")
+                self.SavedSettings[i-1]["A4"] = GPD_4303S_Codec.Reading(self.GPD_4303S_RM.query("ISET4?"), "A")
         except Exception as e:
             self.textEditMSG.setText(f"Error reading memory: {e}")
 
@@ -111,7 +209,7 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
             self.GPD_4303S_RM.write("RCL1")
             self.textEditMSG.setText("LOADED STATE1")
             if(self.PSstate["Output"] == "ON"): # When loading a new state and outputting the output will stop
-                self.timer.stop()
+                self.Acquisition.StopAcquisition()
                 self.ReadState()
             self.ChannelSettings = self.SavedSettings[0].copy()
             self.UpdateSettingInterface()
@@ -123,7 +221,7 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
             self.GPD_4303S_RM.write("RCL2")
             self.textEditMSG.setText("LOADED STATE2")
             if(self.PSstate["Output"] == "ON"): # When loading a new state and outputting the output will stop
-                self.timer.stop()
+                self.Acquisition.StopAcquisition()
                 self.ReadState()
             self.ChannelSettings = self.SavedSettings[1].copy()
             self.UpdateSettingInterface()
@@ -135,7 +233,7 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
             self.GPD_4303S_RM.write("RCL3")
             self.textEditMSG.setText("LOADED STATE3")
             if(self.PSstate["Output"] == "ON"): # When loading a new state and outputting the output will stop
-                self.timer.stop()
+                self.Acquisition.StopAcquisition()
                 self.ReadState()
             self.ChannelSettings = self.SavedSettings[2].copy()
             self.UpdateSettingInterface()
@@ -147,7 +245,7 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
             self.GPD_4303S_RM.write("RCL4")
             self.textEditMSG.setText("LOADED STATE4")
             if(self.PSstate["Output"] == "ON"): # When loading a new state and outputting the output will stop
-                self.timer.stop()
+                self.Acquisition.StopAcquisition()
                 self.ReadState()
             self.ChannelSettings = self.SavedSettings[3].copy()
             self.UpdateSettingInterface()
@@ -186,31 +284,112 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
         except Exception as e:
             self.textEditMSG.setText(f"Error saving state 4: {e}")
 
-    def PSReset(self): # Set Amp limit and voltage settings to zero
+    def SavePreset(self): # Save the current channel settings as a named preset in the on-disk library
+        try:
+            Name, OK = QtWidgets.QInputDialog.getText(self, "Save Preset", "Preset name:")
+            if(not OK or Name.strip() == ""):
+                return
+            self.Presets.Save(Name.strip(), self.ChannelSettings)
+            self.textEditMSG.setText("SAVED PRESET " + Name.strip())
+        except Exception as e:
+            self.textEditMSG.setText(f"Error saving preset: {e}")
+
+    def PickPreset(self, Title): # Search the preset library and let the user pick one of the matches, returns None if cancelled
+        Text, OK = QtWidgets.QInputDialog.getText(self, Title, "Search presets (blank for all):")
+        if(not OK):
+            return None
+        Names = self.Presets.Search(Text.strip())
+        if(not Names):
+            self.textEditMSG.setText("No presets match \"" + Text.strip() + "\"")
+            return None
+        Name, OK = QtWidgets.QInputDialog.getItem(self, Title, f"{len(Names)} preset(s):", Names, 0, False)
+        return Name if OK else None
+
+    def LoadPreset(self): # Apply a preset from the library, only the registers that differ from the current settings are sent
+        try:
+            Name = self.PickPreset("Load Preset")
+            if(Name is None):
+                return
+            Settings = self.Presets.Load(Name)
+            Mismatch = self.ApplySetpoints(Settings, VerifyAll=False)
+            if(self.PSstate["Output"] == "OFF"):
+                self.UpdateSettingInterface()
+            if(Mismatch):
+                self.textEditMSG.setText("Preset mismatch: " + ", ".join(Mismatch))
+            else:
+                self.textEditMSG.setText("LOADED PRESET " + Name)
+        except Exception as e:
+            self.textEditMSG.setText(f"Error loading preset: {e}")
+
+    def DeletePreset(self): # Remove a preset from the library
+        try:
+            Name = self.PickPreset("Delete Preset")
+            if(Name is None):
+                return
+            self.Presets.Delete(Name)
+            self.textEditMSG.setText("DELETED PRESET " + Name)
+        except Exception as e:
+            self.textEditMSG.setText(f"Error deleting preset: {e}")
+
+    def PSReset(self, Origin="user"): # Set Amp limit and voltage settings to zero
         try:
             if(self.PSstate["Output"] == "ON"): # If power supply is on, turn it off
-                self.OutputToggle()
-            self.GPD_4303S_RM.write("ISET1:0")
-            self.GPD_4303S_RM.write("ISET2:0")
-            self.GPD_4303S_RM.write("ISET3:0")
-            self.GPD_4303S_RM.write("ISET4:0")
-            self.GPD_4303S_RM.write("VSET1:0")
-            self.GPD_4303S_RM.write("VSET2:0")
-            self.GPD_4303S_RM.write("VSET3:0")
-            self.GPD_4303S_RM.write("VSET4:0")
-            self.ChannelSettings["V1"] = 0.0
-            self.ChannelSettings["V2"] = 0.0
-            self.ChannelSettings["V3"] = 0.0
-            self.ChannelSettings["V4"] = 0.0
-            self.ChannelSettings["A1"] = 0.0
-            self.ChannelSettings["A2"] = 0.0
-            self.ChannelSettings["A3"] = 0.0
-            self.ChannelSettings["A4"] = 0.0
+                self.OutputToggle(Origin)
+            Mismatch = self.ApplySetpoints(dict.fromkeys(self.SetpointKeys, 0.0), Force=True, Origin=Origin) # Safety path, all eight zeros are written whatever the cache says, then verified
+            if(Mismatch):
+                self.textEditMSG.setText("Reset mismatch: " + ", ".join(Mismatch))
             self.UpdateSettingInterface()
             self.UpdateState()
         except Exception as e:
             self.textEditMSG.setText(f"Error resetting PS: {e}")
 
+    def ApplySetpoints(self, Settings, VerifyAll=True, Force=False, Origin="user"): # Write only the setpoints that differ from the cached ChannelSettings (every one with Force), verify them with one pipelined readback and return a list of mismatches
+        Written = []
+        for Key in self.SetpointKeys: # Current limits before voltages, same order as the old reset
+            if(Key not in Settings):
+                continue
+            Value = round(float(Settings[Key]), 3)
+            if(not Force and Key in self.ChannelSettings and abs(self.ChannelSettings[Key] - Value) < 0.0005):
+                continue # Already set, skip the write
+            self.GPD_4303S_RM.write(self.SetpointCommands[Key] + ":" + str(Value), Origin)
+            Written.append((Key, Value))
+        Verify = self.SetpointKeys if VerifyAll else [Key for Key, Value in Written] # Verifying only what was written keeps a recall to the changed registers
+        Replies = self.GPD_4303S_RM.QueryBatch([self.SetpointCommands[Key] + "?" for Key in Verify])
+        Mismatch = []
+        for Key, Reply in zip(Verify, Replies):
+            ReadBack = GPD_4303S_Codec.Reading(Reply, Key[0]) # NaN if the reply was malformed, reported as a mismatch
+            if(Key in Settings and not abs(ReadBack - round(float(Settings[Key]), 3)) < 0.0005):
+                Mismatch.append(f"{Key} set {round(float(Settings[Key]), 3)} read {ReadBack}")
+            self.ChannelSettings[Key] = ReadBack # Cache what the power supply actually holds
+        for Key, Value in Written: # Journal the readback of every write
+            self.Journal.Readback(self.SetpointCommands[Key] + ":" + str(Value), self.ChannelSettings[Key], abs(self.ChannelSettings[Key] - Value) < 0.0005, Origin)
+        return Mismatch
+
+    def ApplyAll(self): # Apply every setpoint typed into the input boxes at once, blank boxes keep their current value
+        try:
+            Settings = {}
+            for Key in self.SetpointKeys:
+                LineEdit = getattr(self, "lineEdit" + Key + "IN")
+                UserInput = LineEdit.text()
+                if(UserInput.strip() == ""):
+                    continue
+                try:
+                    Settings[Key] = round(float(UserInput), 3)
+                except ValueError:
+                    self.textEditMSG.setText(f"Invalid {Key} Input")
+                    return
+            for Key in Settings:
+                getattr(self, "lineEdit" + Key + "IN").clear()
+            Mismatch = self.ApplySetpoints(Settings)
+            if(self.PSstate["Output"] == "OFF"):
+                self.UpdateSettingInterface()
+            if(Mismatch):
+                self.textEditMSG.setText("Apply mismatch: " + ", ".join(Mismatch))
+            else:
+                self.textEditMSG.setText("APPLIED " + (" ".join(Settings) if Settings else "NOTHING"))
+        except Exception as e:
+            self.textEditMSG.setText(f"Error in ApplyAll: {e}")
+
     def A1Set(self): # Set current limit from user input for channel 1
         try:
             UserInput = self.lineEditA1IN.text()
@@ -218,11 +397,10 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
             try:
                 InputFloat = float(UserInput)
                 InputFloat = round(InputFloat, 3)
-                self.GPD_4303S_RM.write("ISET1:" + str(InputFloat))
-                self.ChannelSettings["A1"] = str(InputFloat)
+                Mismatch = self.ApplySetpoints({"A1": InputFloat}, VerifyAll=False, Force=True) # Written every time it is asked for, read back in the same pipelined pass and journaled
                 if(self.PSstate["Output"] == "OFF"):
                     self.UpdateSettingInterface()
-                self.textEditMSG.setText("SET A1")
+                self.textEditMSG.setText("SET A1" if not Mismatch else "A1 mismatch: " + ", ".join(Mismatch))
             except ValueError:
                 self.textEditMSG.setText("Invalid A1 Input")
         except Exception as e:
@@ -235,11 +413,10 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
             try:
                 InputFloat = float(UserInput)
                 InputFloat = round(InputFloat, 3)
-                self.GPD_4303S_RM.write("ISET2:" + str(InputFloat))
-                self.ChannelSettings["A2"] = str(InputFloat)
+                Mismatch = self.ApplySetpoints({"A2": InputFloat}, VerifyAll=False, Force=True) # Written every time it is asked for, read back in the same pipelined pass and journaled
                 if(self.PSstate["Output"] == "OFF"):
                     self.UpdateSettingInterface()
-                self.textEditMSG.setText("SET A2")
+                self.textEditMSG.setText("SET A2" if not Mismatch else "A2 mismatch: " + ", ".join(Mismatch))
             except ValueError:
                 self.textEditMSG.setText("Invalid A2 Input")
         except Exception as e:
@@ -252,11 +429,10 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
             try:
                 InputFloat = float(UserInput)
                 InputFloat = round(InputFloat, 3)
-                self.GPD_4303S_RM.write("ISET3:" + str(InputFloat))
-                self.ChannelSettings["A3"] = str(InputFloat)
+                Mismatch = self.ApplySetpoints({"A3": InputFloat}, VerifyAll=False, Force=True) # Written every time it is asked for, read back in the same pipelined pass and journaled
                 if(self.PSstate["Output"] == "OFF"):
                     self.UpdateSettingInterface()
-                self.textEditMSG.setText("SET A3")
+                self.textEditMSG.setText("SET A3" if not Mismatch else "A3 mismatch: " + ", ".join(Mismatch))
             except ValueError:
                 self.textEditMSG.setText("Invalid A3 Input")
         except Exception as e:
@@ -269,11 +445,10 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
             try:
                 InputFloat = float(UserInput)
                 InputFloat = round(InputFloat, 3)
-                self.GPD_4303S_RM.write("ISET4:" + str(InputFloat))
-                self.ChannelSettings["A4"] = str(InputFloat)
+                Mismatch = self.ApplySetpoints({"A4": InputFloat}, VerifyAll=False, Force=True) # Written every time it is asked for, read back in the same pipelined pass and journaled
                 if(self.PSstate["Output"] == "OFF"):
                     self.UpdateSettingInterface()
-                self.textEditMSG.setText("SET A4")
+                self.textEditMSG.setText("SET A4" if not Mismatch else "A4 mismatch: " + ", ".join(Mismatch))
             except ValueError:
                 self.textEditMSG.setText("Invalid A4 Input")
         except Exception as e:
@@ -286,11 +461,10 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
             try:
                 InputFloat = float(UserInput)
                 InputFloat = round(InputFloat, 3)
-                self.GPD_4303S_RM.write("VSET1:" + str(InputFloat))
-                self.ChannelSettings["V1"] = str(InputFloat)
+                Mismatch = self.ApplySetpoints({"V1": InputFloat}, VerifyAll=False, Force=True) # Written every time it is asked for, read back in the same pipelined pass and journaled
                 if(self.PSstate["Output"] == "OFF"):
                     self.UpdateSettingInterface()
-                self.textEditMSG.setText("SET V1")
+                self.textEditMSG.setText("SET V1" if not Mismatch else "V1 mismatch: " + ", ".join(Mismatch))
             except ValueError:
                 self.textEditMSG.setText("Invalid V1 Input")
         except Exception as e:
@@ -303,11 +477,10 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
             try:
                 InputFloat = float(UserInput)
                 InputFloat = round(InputFloat, 3)
-                self.GPD_4303S_RM.write("VSET2:" + str(InputFloat))
-                self.ChannelSettings["V2"] = str(InputFloat)
+                Mismatch = self.ApplySetpoints({"V2": InputFloat}, VerifyAll=False, Force=True) # Written every time it is asked for, read back in the same pipelined pass and journaled
                 if(self.PSstate["Output"] == "OFF"):
                     self.UpdateSettingInterface()
-                self.textEditMSG.setText("SET V2")
+                self.textEditMSG.setText("SET V2" if not Mismatch else "V2 mismatch: " + ", ".join(Mismatch))
             except ValueError:
                 self.textEditMSG.setText("Invalid V2 Input")
         except Exception as e:
@@ -320,11 +493,10 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
             try:
                 InputFloat = float(UserInput)
                 InputFloat = round(InputFloat, 3)
-                self.GPD_4303S_RM.write("VSET3:" + str(InputFloat))
-                self.ChannelSettings["V3"] = str(InputFloat)
+                Mismatch = self.ApplySetpoints({"V3": InputFloat}, VerifyAll=False, Force=True) # Written every time it is asked for, read back in the same pipelined pass and journaled
                 if(self.PSstate["Output"] == "OFF"):
                     self.UpdateSettingInterface()
-                self.textEditMSG.setText("SET V3")
+                self.textEditMSG.setText("SET V3" if not Mismatch else "V3 mismatch: " + ", ".join(Mismatch))
             except ValueError:
                 self.textEditMSG.setText("Invalid V3 Input")
         except Exception as e:
@@ -337,11 +509,10 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
             try:
                 InputFloat = float(UserInput)
                 InputFloat = round(InputFloat, 3)
-                self.GPD_4303S_RM.write("VSET4:" + str(InputFloat))
-                self.ChannelSettings["V4"] = str(InputFloat)
+                Mismatch = self.ApplySetpoints({"V4": InputFloat}, VerifyAll=False, Force=True) # Written every time it is asked for, read back in the same pipelined pass and journaled
                 if(self.PSstate["Output"] == "OFF"):
                     self.UpdateSettingInterface()
-                self.textEditMSG.setText("SET V4")
+                self.textEditMSG.setText("SET V4" if not Mismatch else "V4 mismatch: " + ", ".join(Mismatch))
             except ValueError:
                 self.textEditMSG.setText("Invalid V4 Input")
         except Exception as e:
@@ -360,109 +531,454 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
         except Exception as e:
             self.textEditMSG.setText(f"Error updating UI: {e}")
 
-    def OutputToggle(self): # Write toggle output and start/stop peroidic reading of the channel measurements
+    def OutputToggle(self, Origin="user"): # Write toggle output and start/stop peroidic reading of the channel measurements
         try:
+            Command = "OUT1" if self.PSstate["Output"] == "OFF" else "OUT0"
             if(self.PSstate["Output"] == "OFF"):
-                self.GPD_4303S_RM.write("OUT1")
-                self.timer.start(1000) # Time Between Recording Current Outputs (ms)
+                self.GPD_4303S_RM.write("OUT1", Origin)
+                self.Stats.Reset() # New run, new statistics
+                self.LogIndex.Reset()
+                self.Acquisition.StartAcquisition(1000) # Time Between Recording Current Outputs (ms)
                 self.textEditMSG.setText("Output ON")
             elif(self.PSstate["Output"] == "ON"):
-                self.GPD_4303S_RM.write("OUT0")
+                self.GPD_4303S_RM.write("OUT0", Origin)
                 self.textEditMSG.setText("Output OFF")
-                self.timer.stop()
+                self.Acquisition.StopAcquisition()
+                self.WriteStatsFooter()
                 self.UpdateSettingInterface()
             self.ReadState()
+            self.VerifyState(Command, Origin)
         except Exception as e:
             self.textEditMSG.setText(f"Error toggling output: {e}")
 
-    def MeasureOutputs(self): # Measure the current output of each channel, send it directly to the user interface
-        try:
-            Voltage1 = self.GPD_4303S_RM.query("VOUT1?")[:-3]
-            Voltage2 = self.GPD_4303S_RM.query("VOUT2?")[:-3]
-            Voltage3 = self.GPD_4303S_RM.query("VOUT3?")[:-3]
-            Voltage4 = self.GPD_4303S_RM.query("VOUT4?")[:-3]
-            Current1 = self.GPD_4303S_RM.query("IOUT1?")[:-3]
-            Current2 = self.GPD_4303S_RM.query("IOUT2?")[:-3]
-            Current3 = self.GPD_4303S_RM.query("IOUT3?")[:-3]
-            Current4 = self.GPD_4303S_RM.query("IOUT4?")[:-3]
-            self.lineEditV1.setText(str(Voltage1))
-            self.lineEditV2.setText(str(Voltage2))
-            self.lineEditV3.setText(str(Voltage3))
-            self.lineEditV4.setText(str(Voltage4))
-            self.lineEditA1.setText(str(Current1))
-            self.lineEditA2.setText(str(Current2))
-            self.lineEditA3.setText(str(Current3))
-            self.lineEditA4.setText(str(Current4))
-            # Timestamp with milliseconds for precision
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-            data_row = [
-                timestamp, Voltage1, Voltage2, Voltage3, Voltage4,
-                Current1, Current2, Current3, Current4
-            ]
+    def VerifyState(self, Command, Origin="user"): # Journal whether the STATUS? just read shows what an OUT/BEEP/TRACK command set
+        Field, Expected = self.StateCommands[Command]
+        self.Journal.Readback(Command, GPD_4303S_Codec.NaN, self.PSstate.get(Field) == Expected, Origin)
+
+    def MeasureOutputs(self, Sample): # Receive a measurement of each channel from the acquisition worker, send it to the user interface and the log
+        try:
+            Readings = [GPD_4303S_Codec.Format(Value) for Value in Sample["Voltages"] + Sample["Currents"]] # "nan" for readings that are not polled or were malformed
+            self.Stats.Add(Sample["Time"], Sample["Voltages"], Sample["Currents"])
+            self.History.Add(Sample["Wall"], Sample["Voltages"] + Sample["Currents"])
+            for Key, Reading in zip(GPD_4303S_Alarms.LimitKeys, Readings):
+                getattr(self, "lineEdit" + Key).setText("-" if Reading == "nan" else Reading)
+            timestamp = Sample["Stamp"] # Timestamp with milliseconds for precision, taken when the sample was read
+            data_row = [timestamp] + Readings
+            if(Sample["Status"] is not None):
+                data_row.append(Sample["Status"]) # STATUS? bits (CC/CV, tracking, output...) for the offline dwell analysis
             # Open the file in append mode and write the new data row
-            with open("GPD_4303S_Log_" + str(self.PSstate["SN"]) + ".csv", mode='a', newline='') as log_file:
+            with open(self.LogPath(), mode='a', newline='') as log_file:
+                self.LogIndex.Add(timestamp, log_file.tell()) # Append mode starts at the end of the file, where this row goes
                 csv_writer = csv.writer(log_file)
                 csv_writer.writerow(data_row)
+            self.LastSample = Sample
+            self.Logged += 1
+            if(self.Stream is not None):
+                self.Stream.Publish(Sample) # Only queues the frame, slow clients lose frames instead of holding up the log
         except Exception as e:
             self.textEditMSG.setText(f"Error measuring outputs: {e}")
-            self.timer.stop() # Stop timer if measurement fails to prevent repeated errors
+            self.Acquisition.StopAcquisition() # Stop acquiring if logging fails to prevent repeated errors
+
+    def AcquisitionFailed(self, Error): # The worker has stopped after a failed reading
+        self.textEditMSG.setText(f"Error measuring outputs: {Error}")
+
+    def LinkLost(self, Event): # The worker is reconnecting in the background, mark the start of the gap in the log
+        try:
+            self.Stats.Break()
+            with open(self.LogPath(), mode='a', newline='') as log_file:
+                csv.writer(log_file).writerow(["# Gap", Event["Stamp"], "LINK LOST", Event["Error"]])
+            self.textEditMSG.setText(f"LINK LOST {Event['Stamp']}: {Event['Error']}, reconnecting...")
+        except Exception as e:
+            self.textEditMSG.setText(f"Error handling lost link: {e}")
+
+    def LinkReconnecting(self, Attempt, Wait, Error):
+        self.textEditMSG.setText(f"RECONNECT attempt {Attempt} failed ({Error}), retrying in {Wait:.1f} s")
+
+    def LinkReconnected(self, Event): # Same SN is back and acquisition has resumed, close the gap in the log and refresh the interface
+        try:
+            with open(self.LogPath(), mode='a', newline='') as log_file:
+                csv.writer(log_file).writerow(["# Gap", Event["Stamp"], "LINK RESTORED", f"{Event['Down']:.1f} s", f"{Event['Attempts']} attempts"])
+            self.IdentifyPS()
+            self.ReadState()
+            self.textEditMSG.setText(f"RECONNECTED {Event['Stamp']} after {Event['Down']:.1f} s ({Event['Attempts']} attempts)")
+            if(self.PSstate["Output"] == "OFF"): # The power supply was power cycled, nothing left to acquire
+                self.Acquisition.StopAcquisition()
+                self.WriteStatsFooter()
+                self.UpdateSettingInterface()
+                self.textEditMSG.setText(f"RECONNECTED {Event['Stamp']} after {Event['Down']:.1f} s, output was OFF so the run has ended")
+        except Exception as e:
+            self.textEditMSG.setText(f"Error handling reconnect: {e}")
+
+    def AlarmTripped(self, Event): # The acquisition worker has already sent OUT0, bring the interface in line and report the trip
+        try:
+            Tripped = ", ".join(f"{Key} {Kind} {Value} (limit {Limit})" for Key, Value, Kind, Limit in Event["Violations"])
+            self.textEditMSG.setText(f"ALARM {Event['Stamp']}: {Tripped}, output OFF in {Event['Latency'] * 1000:.1f} ms ({Event['SampleLatency'] * 1000:.1f} ms from sample start)")
+            self.ReadState()
+            self.VerifyState("OUT0", "alarm")
+            self.WriteStatsFooter()
+            self.UpdateSettingInterface()
+        except Exception as e:
+            self.textEditMSG.setText(f"Error handling alarm: {e}")
+
+    def AskLimit(self, Limits, Title): # Pick a voltage/current and enter its low,high limits (leave a side blank to disable it), returns the key set or None
+        Key, OK = QtWidgets.QInputDialog.getItem(self, Title, "Reading:", GPD_4303S_Alarms.LimitKeys, 0, False)
+        if(not OK):
+            return None
+        Text, OK = QtWidgets.QInputDialog.getText(self, Title, f"{Key} low,high (blank side = no limit):")
+        if(not OK):
+            return None
+        Parts = (Text.split(",") + [""])[:2]
+        try:
+            Low, High = [float(Part) if Part.strip() != "" else None for Part in Parts]
+        except ValueError:
+            self.textEditMSG.setText(f"Invalid {Key} limit")
+            return None
+        Limits.SetLimit(Key, Low, High)
+        return Key
+
+    def SetAlarmLimit(self):
+        try:
+            Key = self.AskLimit(self.Alarms, "Set Alarm Limit")
+            if(Key is not None):
+                self.textEditMSG.setText(f"ALARM {Key} " + ", ".join(self.Alarms.Describe()))
+        except Exception as e:
+            self.textEditMSG.setText(f"Error setting alarm limit: {e}")
+
+    def ClearAlarmLimits(self):
+        self.Alarms.Clear()
+        self.textEditMSG.setText("ALARM LIMITS CLEARED")
+
+    def ShowAlarmLimits(self):
+        Lines = self.Alarms.Describe() + [f"Worst detect-to-off latency: {self.Alarms.WorstLatency * 1000:.1f} ms"]
+        QtWidgets.QMessageBox.information(self, "Alarm Limits", "\n".join(Lines))
+
+    def ConfigureCapture(self): # Set the pre-trigger history length, post-trigger window and CC triggering
+        try:
+            Default = f"{self.Capture.PreSamples}, {self.Capture.PostSeconds}, {int(self.Capture.TriggerOnCC)}"
+            Text, OK = QtWidgets.QInputDialog.getText(self, "Configure Capture", "Pre-trigger samples, post-trigger seconds, trigger on CC (1/0):", text=Default)
+            if(not OK):
+                return
+            try:
+                Pre, Post, CC = [Part.strip() for Part in Text.split(",")]
+                self.Capture.PreSamples = max(0, int(Pre))
+                self.Capture.PostSeconds = max(0.0, float(Post))
+                self.Capture.TriggerOnCC = CC not in ("0", "")
+            except ValueError:
+                self.textEditMSG.setText("Invalid capture settings")
+                return
+            if(self.Capture.Armed):
+                self.Capture.Arm() # Resize the history buffer
+            self.textEditMSG.setText(f"CAPTURE {self.Capture.PreSamples} pre, {self.Capture.PostSeconds} s post, CC trigger {'ON' if self.Capture.TriggerOnCC else 'OFF'}")
+        except Exception as e:
+            self.textEditMSG.setText(f"Error configuring capture: {e}")
+
+    def SetCaptureTrigger(self):
+        try:
+            Key = self.AskLimit(self.Capture.Levels, "Set Capture Trigger")
+            if(Key is not None):
+                self.textEditMSG.setText(f"TRIGGER {Key} " + ", ".join(self.Capture.Levels.Describe()))
+        except Exception as e:
+            self.textEditMSG.setText(f"Error setting capture trigger: {e}")
+
+    def ArmCapture(self):
+        self.Capture.Arm()
+        self.textEditMSG.setText("CAPTURE ARMED")
+
+    def DisarmCapture(self):
+        self.Capture.Disarm()
+        self.textEditMSG.setText("CAPTURE DISARMED")
+
+    def ExportHistory(self): # Write a time range of the history at a chosen resolution, answered from the coarsest tier that meets it
+        try:
+            Text, OK = QtWidgets.QInputDialog.getText(self, "Export History", "From minutes ago, to minutes ago, resolution (s):", text="60, 0, 1")
+            if(not OK):
+                return
+            try:
+                From, To, Resolution = [float(Part) for Part in Text.split(",")]
+            except ValueError:
+                self.textEditMSG.setText("Invalid history range")
+                return
+            Now = time.time()
+            Width, Rows = self.History.Query(Now - From * 60, Now - To * 60, Resolution)
+            Path = "GPD_4303S_History_" + str(self.PSstate["SN"]) + ".csv"
+            with open(Path, mode='w', newline='') as history_file:
+                csv_writer = csv.writer(history_file)
+                csv_writer.writerow(["Time", "Width (s)"] + [Key + " " + Part for Part in ("Min", "Max", "Mean") for Key in GPD_4303S_Alarms.LimitKeys])
+                for Start, RowWidth, Min, Max, Mean in Rows:
+                    csv_writer.writerow([datetime.fromtimestamp(Start).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3], RowWidth] + [f"{Value:.4f}" for Value in Min + Max + Mean])
+            self.textEditMSG.setText(f"EXPORTED {len(Rows)} ROWS ({Width} s tier) TO {Path}")
+        except Exception as e:
+            self.textEditMSG.setText(f"Error exporting history: {e}")
+
+    def QueryLogRange(self): # Pull a time range out of the log through the sidecar index and write it to its own file
+        try:
+            Text, OK = QtWidgets.QInputDialog.getText(self, "Query Log Range", "From, to (YYYY-MM-DD HH:MM[:SS]):")
+            if(not OK):
+                return
+            try:
+                Start, End = [Part.strip() for Part in Text.split(",")]
+            except ValueError:
+                self.textEditMSG.setText("Invalid log range")
+                return
+            Path = "GPD_4303S_LogRange_" + str(self.PSstate["SN"]) + ".csv"
+            Rows = 0
+            with open(Path, mode='w', newline='') as range_file:
+                csv_writer = csv.writer(range_file)
+                for Row in GPD_4303S_LogIndex.QueryRange(self.LogPath(), Start, End):
+                    csv_writer.writerow(Row)
+                    Rows += 1
+            self.textEditMSG.setText(f"WROTE {Rows} ROWS TO {Path}")
+        except Exception as e:
+            self.textEditMSG.setText(f"Error querying log: {e}")
+
+    def RebuildLogIndex(self): # Index a log written before the index existed (or repair a damaged index)
+        try:
+            self.LogIndex.Close()
+            Rows = GPD_4303S_LogIndex.Rebuild(self.LogPath())
+            self.LogIndex.Reset()
+            self.textEditMSG.setText(f"INDEXED {Rows} LOG ROWS")
+        except Exception as e:
+            self.textEditMSG.setText(f"Error rebuilding log index: {e}")
+
+    def RunSweep(self): # Step a channel's voltage setpoint and record the settled V/I of every point on a worker thread
+        try:
+            if(self.CaptureRunning()):
+                self.textEditMSG.setText("Sweep or step response already running")
+                return
+            if(self.PSstate["Output"] == "OFF"):
+                self.textEditMSG.setText("Turn the output on before sweeping")
+                return
+            Text, OK = QtWidgets.QInputDialog.getText(self, "Run Sweep", "Channel, start V, stop V, step V, dwell s:", text="1, 0, 5, 0.1, 0")
+            if(not OK):
+                return
+            try:
+                Channel, Start, Stop, Step, Dwell = [float(Part) for Part in Text.split(",")]
+                if(int(Channel) not in (1, 2, 3, 4) or Step == 0):
+                    raise ValueError
+            except ValueError:
+                self.textEditMSG.setText("Invalid sweep settings")
+                return
+            self.StartSweepWorker(GPD_4303S_Sweep.SweepWorker(self.GPD_4303S_RM, int(Channel), Start, Stop, Step, Dwell, Parent=self))
+            self.textEditMSG.setText(f"SWEEP CH{int(Channel)} {len(self.Sweep.Setpoints)} points")
+        except Exception as e:
+            self.textEditMSG.setText(f"Error starting sweep: {e}")
+
+    def StartSweepWorker(self, Sweep): # Connect and start a new (or resumed) sweep
+        self.Sweep = Sweep
+        self.Sweep.PointReady.connect(self.SweepPoint)
+        self.Sweep.Finished.connect(self.SweepFinished)
+        self.Sweep.Failed.connect(lambda Error: self.textEditMSG.setText(f"Error in sweep: {Error}"))
+        self.Sweep.finished.connect(self.CaptureDone)
+        self.CaptureControls(False)
+        self.Sweep.start()
+
+    def CaptureRunning(self): # A sweep or step response holds the channel setpoint, only one of them at a time
+        return any(Worker is not None and Worker.isRunning() for Worker in (getattr(self, "Sweep", None), getattr(self, "Step", None)))
+
+    def CaptureControls(self, Enabled): # Sweep and step response start controls
+        self.actionRun_Sweep.setEnabled(Enabled)
+        self.actionStep_Response.setEnabled(Enabled)
+
+    def CaptureDone(self): # Called when a sweep or step response thread ends, however it ended
+        self.CaptureControls(not self.CaptureRunning())
+
+    def StopSweep(self):
+        if(getattr(self, "Sweep", None) is not None):
+            self.Sweep.Cancelled = True
+
+    def SweepPoint(self, Index, Setpoint, Voltage, Current):
+        self.textEditMSG.setText(f"SWEEP {Index + 1}/{len(self.Sweep.Setpoints)}: set {Setpoint:.3f} V, {Voltage:.3f} V {Current:.3f} A")
+
+    def SweepFinished(self, Results): # Export the sweep and plot it when matplotlib is available
+        try:
+            Path = "GPD_4303S_Sweep_" + str(self.PSstate["SN"]) + "_" + datetime.now().strftime("%Y%m%d_%H%M%S") + ".csv"
+            GPD_4303S_Sweep.Export(Path, self.Sweep.Channel, Results)
+            Plotted = GPD_4303S_Sweep.Plot(self.Sweep.Channel, Results, f"CH{self.Sweep.Channel} IV Sweep")
+            Unsettled = int(len(Results) - Results[:, 4].sum()) if len(Results) else 0
+            self.textEditMSG.setText(f"SWEEP DONE: {len(Results)} points ({Unsettled} unsettled) saved to {Path}" + ("" if Plotted else " (install matplotlib to plot)"))
+        except Exception as e:
+            self.textEditMSG.setText(f"Error saving sweep: {e}")
+
+    def RunStepResponse(self): # Step a channel's setpoint and capture only that channel as fast as the link allows
+        try:
+            if(self.CaptureRunning()):
+                self.textEditMSG.setText("Sweep or step response already running")
+                return
+            if(self.PSstate["Output"] == "OFF"):
+                self.textEditMSG.setText("Turn the output on before a step response")
+                return
+            Text, OK = QtWidgets.QInputDialog.getText(self, "Step Response", "Channel, target V, tolerance V:", text="1, 5, 0.01")
+            if(not OK):
+                return
+            try:
+                Channel, Target, Tolerance = [float(Part) for Part in Text.split(",")]
+                if(int(Channel) not in (1, 2, 3, 4)):
+                    raise ValueError
+            except ValueError:
+                self.textEditMSG.setText("Invalid step settings")
+                return
+            self.Acquisition.Suspended.set() # Other channels are not queried during the capture, the step worker checks the alarm limits on its own samples
+            self.Step = GPD_4303S_Sweep.StepResponseWorker(self.GPD_4303S_RM, int(Channel), Target, Tolerance, Acquisition=self.Acquisition, Parent=self)
+            self.Step.Finished.connect(self.StepResponseFinished)
+            self.Step.Failed.connect(lambda Error: self.textEditMSG.setText(f"Error in step response: {Error}"))
+            self.Step.Tripped.connect(self.StepTripped)
+            self.Step.finished.connect(self.Acquisition.Suspended.clear)
+            self.Step.finished.connect(self.CaptureDone)
+            self.CaptureControls(False)
+            self.Step.start()
+            self.ChannelSettings["V" + str(int(Channel))] = round(Target, 3)
+            self.textEditMSG.setText(f"STEP CH{int(Channel)} to {Target} V")
+        except Exception as e:
+            self.Acquisition.Suspended.clear()
+            self.textEditMSG.setText(f"Error starting step response: {e}")
+
+    def StepTripped(self, Event): # Output already off, end the run as a trip during acquisition would
+        self.Acquisition.StopAcquisition()
+        self.AlarmTripped(Event)
+
+    def StepResponseFinished(self, Result):
+        try:
+            Path = "GPD_4303S_Step_" + str(self.PSstate["SN"]) + "_" + datetime.now().strftime("%Y%m%d_%H%M%S") + ".csv"
+            GPD_4303S_Sweep.ExportStep(Path, Result)
+            self.textEditMSG.setText(f"STEP CH{Result['Channel']}: rise {Result['RiseTime'] * 1000:.1f} ms, overshoot {Result['Overshoot']:.2f} %, settling {Result['SettlingTime'] * 1000:.1f} ms "
+                                     f"({Result['Samples']} samples at {Result['Rate']:.1f}/s) saved to {Path}")
+        except Exception as e:
+            self.textEditMSG.setText(f"Error saving step response: {e}")
+
+    def StartRegulator(self, Mode): # Hold a constant power (CP) or resistance (CR) on a channel with the software control loop
+        try:
+            if(self.PSstate["Output"] == "OFF"):
+                self.textEditMSG.setText("Turn the output on before regulating")
+                return
+            self.StopRegulator()
+            Unit = "W" if Mode == "CP" else "ohm"
+            Text, OK = QtWidgets.QInputDialog.getText(self, "Constant Power" if Mode == "CP" else "Constant Resistance", f"Channel, target {Unit}, max V:", text="1, 1, 5")
+            if(not OK):
+                return
+            try:
+                Channel, Target, VMax = [float(Part) for Part in Text.split(",")]
+                if(int(Channel) not in (1, 2, 3, 4) or Target <= 0 or VMax <= 0):
+                    raise ValueError
+            except ValueError:
+                self.textEditMSG.setText("Invalid regulator settings")
+                return
+            self.Regulator = GPD_4303S_Regulator.RegulatorWorker(self.GPD_4303S_RM, int(Channel), Mode, Target, VMax, Parent=self)
+            self.Regulator.Report.connect(self.RegulatorReport)
+            self.Regulator.Failed.connect(lambda Error: self.textEditMSG.setText(f"Error in regulator: {Error}"))
+            self.Regulator.start()
+            self.textEditMSG.setText(f"{Mode} CH{int(Channel)} {Target} {Unit} STARTED")
+        except Exception as e:
+            self.textEditMSG.setText(f"Error starting regulator: {e}")
+
+    def StopRegulator(self):
+        if(getattr(self, "Regulator", None) is not None):
+            self.Regulator.Running = False
+            self.Regulator.wait()
+            self.ChannelSettings["V" + str(self.Regulator.Channel)] = GPD_4303S_Codec.Reading(self.GPD_4303S_RM.query("VSET" + str(self.Regulator.Channel) + "?"), "V") # The loop moved the setpoint
+            self.Regulator = None
+
+    def RegulatorReport(self, Report): # Show what the link really supports: loop rate, jitter and regulation error
+        Unit = "W" if Report["Mode"] == "CP" else "ohm"
+        self.textEditMSG.setText(f"{Report['Mode']} CH{Report['Channel']} {Report['Target']} {Unit}: {Report['Voltage']:.3f} V {Report['Current']:.3f} A (set {Report['Setpoint']:.3f} V), "
+                                 f"error mean {Report['ErrorMean']:+.4f} rms {Report['ErrorRMS']:.4f} {Unit}, loop {Report['Rate']:.1f} Hz, jitter {Report['Jitter'] * 1000:.2f} ms")
+
+    def SetPolling(self): # Choose which channels and quantities the acquisition worker queries, fewer readings means faster samples
+        try:
+            Text, OK = QtWidgets.QInputDialog.getText(self, "Polling", "Channels to poll:", text=",".join(str(Channel) for Channel in self.Acquisition.Channels))
+            if(not OK):
+                return
+            try:
+                Channels = sorted(set(int(Part) for Part in Text.split(",") if Part.strip() != ""))
+                if(not Channels or any(Channel not in (1, 2, 3, 4) for Channel in Channels)):
+                    raise ValueError
+            except ValueError:
+                self.textEditMSG.setText("Invalid polling channels")
+                return
+            Choices = ["V and I", "V only", "I only"]
+            Choice, OK = QtWidgets.QInputDialog.getItem(self, "Polling", "Quantities:", Choices, 0, False)
+            if(not OK):
+                return
+            self.Acquisition.Channels = Channels
+            self.Acquisition.Quantities = {"V and I": "VI", "V only": "V", "I only": "I"}[Choice]
+            Indexes, Mirrored = self.Acquisition.Polled()
+            self.textEditMSG.setText(f"POLLING CH{','.join(str(Channel) for Channel in Channels)} {Choice}: {len(Indexes)} queries per sample" + (" (CH2 follows CH1 in tracking)" if Mirrored else ""))
+        except Exception as e:
+            self.textEditMSG.setText(f"Error setting polling: {e}")
+
+    def LoadCalibration(self): # Apply the stored link calibration for this SN and baud rate
+        try:
+            Result = GPD_4303S_Calibration.Load(self.PSstate.get("SN"), self.BaudRate)
+            if(Result is not None):
+                self.GPD_4303S_RM.Calibrate(Result["Gap"], Result["Timeouts"])
+                print(f"Link calibration: {GPD_4303S_Calibration.Describe(Result)}")
+        except Exception as e:
+            self.textEditMSG.setText(f"Error loading link calibration: {e}")
+
+    def CalibrateLink(self): # Measure the link's real limits on a worker thread, writes setpoints so the output has to be off
+        try:
+            if(self.PSstate["Output"] == "ON"):
+                self.textEditMSG.setText("Turn the output off before calibrating the link")
+                return
+            if(getattr(self, "Calibration", None) is not None and self.Calibration.isRunning()):
+                self.textEditMSG.setText("Link calibration already running")
+                return
+            self.Calibration = GPD_4303S_Calibration.CalibrationWorker(self.GPD_4303S_RM, self)
+            self.Calibration.Finished.connect(self.CalibrationFinished)
+            self.Calibration.Failed.connect(self.CalibrationFailed)
+            self.Calibration.start()
+            self.textEditMSG.setText("CALIBRATING LINK...")
+        except Exception as e:
+            self.textEditMSG.setText(f"Error starting link calibration: {e}")
+
+    def CalibrationFinished(self, Result):
+        try:
+            GPD_4303S_Calibration.Save(self.PSstate["SN"], self.BaudRate, Result)
+            self.textEditMSG.setText(f"LINK CALIBRATED: {GPD_4303S_Calibration.Describe(Result)}")
+        except Exception as e:
+            self.textEditMSG.setText(f"Error saving link calibration: {e}")
+
+    def CalibrationFailed(self, Error):
+        self.GPD_4303S_RM.Calibrate(0.0, {}) # Back to the defaults rather than a half finished calibration
+        self.LoadCalibration()
+        self.textEditMSG.setText(f"Error calibrating link: {Error}")
+
+    def CaptureSaved(self, Path):
+        self.textEditMSG.setText(f"CAPTURE ({self.Capture.Reason}) SAVED TO {Path}")
     
-    def ReadState(self): # Get power supply status setting through the conversion of a byte of data
+    def LogPath(self): # CSV log file for the connected power supply
+        return "GPD_4303S_Log_" + str(self.PSstate["SN"]) + ".csv"
+
+    def WriteStatsFooter(self): # Append the run statistics to the end of the log as comment rows
         try:
-            Status = self.GPD_4303S_RM.query('STATUS?')
-            # Power Supply Channel Control Mode Status
-            if(int(Status[0]) == 1):
-                self.PSstate["C1CCCV"] = "CV"
-            else:
-                self.PSstate["C1CCCV"] = "CC"
+            if(self.Stats.Samples() == 0):
+                return
+            with open(self.LogPath(), mode='a', newline='') as log_file:
+                csv.writer(log_file).writerows(self.Stats.FooterRows())
+        except Exception as e:
+            self.textEditMSG.setText(f"Error writing stats footer: {e}")
 
-            # Power Supply Channel Control Mode Status
-            if(int(Status[1]) == 1):
-                self.PSstate["C2CCCV"] = "CV"
-            else:
-                self.PSstate["C2CCCV"] = "CC"
-
-            # Power Supply Tracking Status
-            if(int(Status[2]),int(Status[3])) == (0,1):
-                self.PSstate["Track"] = "Independent"
-            elif(int(Status[2]),int(Status[3])) == (1,1):
-                self.PSstate["Track"] = "Series"
-            elif(int(Status[2]),int(Status[3]) == (1,0)):
-                self.PSstate["Track"] = "Parallel"
-
-            # Power Supply Beep Status
-            if(int(Status[4]) == 1):
-                self.PSstate["Beep"] = "ON"
-            else:
-                self.PSstate["Beep"] = "OFF"
+    def ShowStatistics(self): # Pop up the running statistics of the current (or last) run
+        QtWidgets.QMessageBox.information(self, "Channel Statistics", "\n".join(self.Stats.Summary()))
 
-            # Power Supply Output Status
-            if(int(Status[5]) == 1):
-                self.PSstate["Output"] = "ON"
-            else:
-                self.PSstate["Output"] = "OFF"
-
-            # Baud Rate Status
-            if(int(Status[6]),int(Status[7])) == (0,0):
-                self.PSstate["BaudRate"] = "115200"
-            elif(int(Status[6]),int(Status[7])) == (0,1):
-                self.PSstate["BaudRate"] = "57600"
-            elif(int(Status[6]),int(Status[7])) == (1,0):
-                self.PSstate["BaudRate"] = "9600"
+    def ReadState(self): # Get power supply status setting through the conversion of a byte of data
+        try:
+            Fields = GPD_4303S_Codec.StatusFields(self.GPD_4303S_RM.query('STATUS?')) # CC/CV of CH1/CH2, tracking, beep, output and baud rate bits
+            if(Fields is None):
+                self.textEditMSG.setText("Malformed STATUS? reply, state not updated")
+                return
+            self.PSstate.update(Fields)
+            self.Acquisition.Tracking = self.PSstate["Track"] # CH2 is not polled while it follows CH1
             self.UpdateState()
         except Exception as e:
             self.textEditMSG.setText(f"Error reading PS state: {e}")
 
     def IdentifyPS(self): # Identify the connected power supply and write it to the status dictionary
         try:
-            IDN = self.GPD_4303S_RM.query('*IDN?')
-            Split_IDN = str(IDN).split(",")
-            Split_IDN[2] = Split_IDN[2][3:] # Remove Extra Characters
-            Split_IDN[3] = Split_IDN[3][:5]
-            self.PSstate["Mfr."] = Split_IDN[0]
-            self.PSstate["Model"] = Split_IDN[1]
-            self.PSstate["SN"] = Split_IDN[2]
-            self.PSstate["FWVer"] = Split_IDN[3]
+            Identity = GPD_4303S_Codec.Identity(self.GPD_4303S_RM.query('*IDN?')) # Manufacturer, model, SN and firmware version
+            if(Identity is None):
+                self.textEditMSG.setText("Malformed *IDN? reply, power supply not identified")
+                return
+            self.PSstate.update(Identity)
             self.UpdateState("IDN")
         except Exception as e:
             self.textEditMSG.setText(f"Error identifying PS: {e}")
@@ -485,13 +1001,95 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
             # Can't write to textEditMSG here if the UI itself is failing, so print to console
             print(f"Error in UpdateState: {e}")
 
+    def MetricsText(self): # Prometheus exposition of the cached readings and counters, runs on the endpoint's thread and never touches the link
+        Counters = [("gpd_samples_total", "Samples read, full rate capture samples included", self.Acquisition.Taken),
+                    ("gpd_samples_logged_total", "Samples written to the log", self.Logged),
+                    ("gpd_samples_missed_total", "Scheduled samples skipped because the link was slow or down", self.Acquisition.Missed),
+                    ("gpd_malformed_replies_total", "Replies that failed to parse", self.Acquisition.Malformed),
+                    ("gpd_reconnects_total", "Times the link was reopened after a drop", self.Acquisition.Reconnects),
+                    ("gpd_log_queue_depth", "Samples read but not written to the log yet", self.Acquisition.Emitted - self.Logged),
+                    ("gpd_journal_queue_depth", "Command journal records waiting for the writer thread", self.Journal.Queue.qsize())]
+        return GPD_4303S_Metrics.Render(self.PSstate.get("SN"), self.LastSample, dict(self.PSstate), Counters, self.GPD_4303S_RM.Latency)
+
+    def SessionState(self): # What a restart needs to carry on this session, saved by SaveCheckpoint
+        Sweep = getattr(self, "Sweep", None)
+        return {"SN": self.PSstate.get("SN"), "PSstate": self.PSstate, "ChannelSettings": self.ChannelSettings, "SavedSettings": self.SavedSettings,
+                "Running": self.Acquisition.isRunning(), "Interval": self.Acquisition.Interval, "Channels": self.Acquisition.Channels, "Quantities": self.Acquisition.Quantities,
+                "Alarms": self.Alarms.Limits, "Stats": self.Stats.State(),
+                "Sweep": {"Channel": Sweep.Channel, "Arguments": Sweep.Arguments, "Next": Sweep.Next, "Original": Sweep.Original} if Sweep is not None and Sweep.isRunning() and not Sweep.Cancelled else None}
+
+    def SaveCheckpoint(self): # Called by the checkpoint timer
+        try:
+            Volatile = {"Saved": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), # Change on every call, only written along with a real change of state
+                        "Log": {"Path": self.LogPath(), "Size": os.path.getsize(self.LogPath()) if os.path.exists(self.LogPath()) else 0}}
+            self.Checkpoint.Save(self.SessionState(), Volatile)
+        except Exception as e:
+            print(f"Error saving checkpoint: {e}")
+
+    def AskResume(self, Checkpoint): # Offer to carry on the session a crash left behind
+        Answer = QtWidgets.QMessageBox.question(self, "Resume Session", f"The last session ({Checkpoint.get('Saved')}, output {Checkpoint.get('PSstate', {}).get('Output')}) did not shut down cleanly.\n"
+                                                "Resume it without resetting the power supply?")
+        return Answer == QtWidgets.QMessageBox.StandardButton.Yes
+
+    def ResumeSession(self, Checkpoint): # Take the session back from a checkpoint, the setpoints and output are read from the power supply, never written
+        try:
+            Start = time.perf_counter()
+            self.SavedSettings = Checkpoint["SavedSettings"]
+            self.ChannelSettings = dict(Checkpoint["ChannelSettings"])
+            self.ApplySetpoints({}) # Nothing written, one pipelined readback of all eight setpoints replaces the checkpointed ones
+            Changed = [Key for Key in self.SetpointKeys if not abs(self.ChannelSettings[Key] - Checkpoint["ChannelSettings"].get(Key, GPD_4303S_Codec.NaN)) < 0.0005]
+            self.Alarms.Limits = {Key: tuple(Limit) for Key, Limit in Checkpoint["Alarms"].items()}
+            self.Acquisition.Channels = Checkpoint["Channels"]
+            self.Acquisition.Quantities = Checkpoint["Quantities"]
+            Message = f"RESUMED session from {Checkpoint['Saved']}"
+            Cut, Shortened = GPD_4303S_Checkpoint.RepairLog(self.LogPath(), Checkpoint.get("Log", {}).get("Size", 0))
+            if(Cut):
+                Message += f", partial last log row removed ({Cut} bytes)"
+            if(Shortened):
+                Message += ", log is shorter than at the checkpoint"
+            if(Checkpoint["Running"]):
+                self.Stats.Restore(Checkpoint["Stats"])
+                if(self.PSstate["Output"] == "ON"): # Still running, carry on in the same log
+                    with open(self.LogPath(), mode='a', newline='') as log_file:
+                        csv.writer(log_file).writerow(["# Gap", datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3], "RESUMED", Checkpoint["Saved"]])
+                    self.LogIndex.Reset()
+                    self.Acquisition.StartAcquisition(int(Checkpoint["Interval"] * 1000))
+                else: # The output went off while the GUI was down, close the run off
+                    self.WriteStatsFooter()
+                    Message += ", output was OFF so the run has ended"
+            elif(self.PSstate["Output"] == "ON"): # Turned on from the front panel since
+                self.Acquisition.StartAcquisition(int(Checkpoint["Interval"] * 1000))
+            Sweep = Checkpoint["Sweep"]
+            if(Sweep is not None and self.PSstate["Output"] == "ON"): # Carry on from the point the sweep was stepping to, the original setpoint is still put back at the end
+                self.StartSweepWorker(GPD_4303S_Sweep.SweepWorker(self.GPD_4303S_RM, Sweep["Channel"], *Sweep["Arguments"], First=Sweep["Next"], Original=Sweep["Original"], Parent=self))
+                Message += f", sweep resumed at point {Sweep['Next'] + 1}"
+            if(Changed):
+                Message += ", changed since the checkpoint: " + " ".join(Changed)
+            self.UpdateSettingInterface()
+            self.textEditMSG.setText(Message + f" ({(time.perf_counter() - Start) * 1000:.0f} ms)")
+        except Exception as e:
+            self.textEditMSG.setText(f"Error resuming session: {e}")
+
     def GUI_Shutdown(self): # Close the UI after stopping PyVISA services
         try:
+            self.CheckpointTimer.stop()
             if(self.PSstate["Output"] == "ON"): # On exit, if power supply is on, turn off output
                 self.OutputToggle()
-            self.timer.stop()
+            self.Acquisition.StopAcquisition()
+            self.StopSweep()
+            self.StopRegulator()
+            if(getattr(self, "Sweep", None) is not None):
+                self.Sweep.wait()
             self.GPD_4303S_RM.close()
             self.RM.close()
+            self.Presets.Close()
+            self.LogIndex.Close()
+            self.Journal.Close()
+            if(self.Metrics is not None):
+                self.Metrics.Close()
+            if(self.Stream is not None):
+                self.Stream.Close()
+            self.Checkpoint.Remove() # Clean shutdown, the next start is a fresh session
             self.close()
         except Exception as e:
             print(f"Error during shutdown: {e}")
@@ -505,6 +1103,23 @@ class GPD_4303S(QtWidgets.QMainWindow, GPD_4303S_GUI_UI.Ui_MainWindow):
 
 if __name__=="__main__": # Send application to computer, wait for user exit
     app = QtWidgets.QApplication(sys.argv) 
-    GPD_4303S_INST1 = GPD_4303S("ASRL3::INSTR")
+    Arguments = sys.argv[1:] # --serial uses pyserial directly instead of PyVISA, --record TRACE records the session, --replay TRACE [--realtime] runs on a recorded session and --simulate [FAULTS] on a simulated power supply, --resume/--fresh answer the resume question up front, --metrics [PORT] serves Prometheus metrics and --stream [PORT] streams samples over WebSocket
+    Record = Arguments[Arguments.index("--record") + 1] if "--record" in Arguments else None
+    Metrics = None
+    if("--metrics" in Arguments):
+        Port = Arguments[Arguments.index("--metrics") + 1:Arguments.index("--metrics") + 2]
+        Metrics = int(Port[0]) if Port and Port[0].isdigit() else GPD_4303S_Metrics.Port
+    Stream = None
+    if("--stream" in Arguments):
+        Port = Arguments[Arguments.index("--stream") + 1:Arguments.index("--stream") + 2]
+        Stream = int(Port[0]) if Port and Port[0].isdigit() else GPD_4303S_Stream.Port
+    Resume = True if "--resume" in Arguments else (False if "--fresh" in Arguments else None)
+    if("--simulate" in Arguments):
+        Faults = Arguments[Arguments.index("--simulate") + 1:Arguments.index("--simulate") + 2]
+        GPD_4303S_INST1 = GPD_4303S(Faults[0] if Faults and not Faults[0].startswith("--") else "", "simulate", Record, Resume, Metrics, Stream)
+    elif("--replay" in Arguments):
+        GPD_4303S_INST1 = GPD_4303S(Arguments[Arguments.index("--replay") + 1], "realtime" if "--realtime" in Arguments else "replay", Record, Resume, Metrics, Stream)
+    else:
+        GPD_4303S_INST1 = GPD_4303S("ASRL3::INSTR", "serial" if "--serial" in Arguments else "visa", Record, Resume, Metrics, Stream)
     GPD_4303S_INST1.show()
     sys.exit(app.exec())
\ No newline at end of file
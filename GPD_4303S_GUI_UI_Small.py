@@ -512,6 +512,20 @@ class Ui_MainWindow(object):
         self.menuLoad_State.setObjectName("menuLoad_State")
         self.menuToggle = QtWidgets.QMenu(parent=self.menubar)
         self.menuToggle.setObjectName("menuToggle")
+        self.menuPresets = QtWidgets.QMenu(parent=self.menubar)
+        self.menuPresets.setObjectName("menuPresets")
+        self.menuStatistics = QtWidgets.QMenu(parent=self.menubar)
+        self.menuStatistics.setObjectName("menuStatistics")
+        self.menuAlarms = QtWidgets.QMenu(parent=self.menubar)
+        self.menuAlarms.setObjectName("menuAlarms")
+        self.menuCapture = QtWidgets.QMenu(parent=self.menubar)
+        self.menuCapture.setObjectName("menuCapture")
+        self.menuHistory = QtWidgets.QMenu(parent=self.menubar)
+        self.menuHistory.setObjectName("menuHistory")
+        self.menuSweep = QtWidgets.QMenu(parent=self.menubar)
+        self.menuSweep.setObjectName("menuSweep")
+        self.menuRegulator = QtWidgets.QMenu(parent=self.menubar)
+        self.menuRegulator.setObjectName("menuRegulator")
         MainWindow.setMenuBar(self.menubar)
         self.actionReset = QtGui.QAction(parent=MainWindow)
         self.actionReset.setObjectName("actionReset")
@@ -569,7 +583,60 @@ class Ui_MainWindow(object):
         self.action_ToggleBeep.setObjectName("action_ToggleBeep")
         self.actionToggleTracking = QtGui.QAction(parent=MainWindow)
         self.actionToggleTracking.setObjectName("actionToggleTracking")
+        self.actionApply_All = QtGui.QAction(parent=MainWindow)
+        self.actionApply_All.setObjectName("actionApply_All")
+        self.actionSave_Preset = QtGui.QAction(parent=MainWindow)
+        self.actionSave_Preset.setObjectName("actionSave_Preset")
+        self.actionLoad_Preset = QtGui.QAction(parent=MainWindow)
+        self.actionLoad_Preset.setObjectName("actionLoad_Preset")
+        self.actionDelete_Preset = QtGui.QAction(parent=MainWindow)
+        self.actionDelete_Preset.setObjectName("actionDelete_Preset")
+        self.actionShow_Statistics = QtGui.QAction(parent=MainWindow)
+        self.actionShow_Statistics.setObjectName("actionShow_Statistics")
+        self.actionReset_Statistics = QtGui.QAction(parent=MainWindow)
+        self.actionReset_Statistics.setObjectName("actionReset_Statistics")
+        self.actionSet_Alarm_Limit = QtGui.QAction(parent=MainWindow)
+        self.actionSet_Alarm_Limit.setObjectName("actionSet_Alarm_Limit")
+        self.actionClear_Alarm_Limits = QtGui.QAction(parent=MainWindow)
+        self.actionClear_Alarm_Limits.setObjectName("actionClear_Alarm_Limits")
+        self.actionShow_Alarm_Limits = QtGui.QAction(parent=MainWindow)
+        self.actionShow_Alarm_Limits.setObjectName("actionShow_Alarm_Limits")
+        self.actionConfigure_Capture = QtGui.QAction(parent=MainWindow)
+        self.actionConfigure_Capture.setObjectName("actionConfigure_Capture")
+        self.actionSet_Capture_Trigger = QtGui.QAction(parent=MainWindow)
+        self.actionSet_Capture_Trigger.setObjectName("actionSet_Capture_Trigger")
+        self.actionArm_Capture = QtGui.QAction(parent=MainWindow)
+        self.actionArm_Capture.setObjectName("actionArm_Capture")
+        self.actionDisarm_Capture = QtGui.QAction(parent=MainWindow)
+        self.actionDisarm_Capture.setObjectName("actionDisarm_Capture")
+        self.actionExport_History = QtGui.QAction(parent=MainWindow)
+        self.actionExport_History.setObjectName("actionExport_History")
+        self.actionClear_History = QtGui.QAction(parent=MainWindow)
+        self.actionClear_History.setObjectName("actionClear_History")
+        self.actionQuery_Log_Range = QtGui.QAction(parent=MainWindow)
+        self.actionQuery_Log_Range.setObjectName("actionQuery_Log_Range")
+        self.actionRebuild_Log_Index = QtGui.QAction(parent=MainWindow)
+        self.actionRebuild_Log_Index.setObjectName("actionRebuild_Log_Index")
+        self.actionRun_Sweep = QtGui.QAction(parent=MainWindow)
+        self.actionRun_Sweep.setObjectName("actionRun_Sweep")
+        self.actionStop_Sweep = QtGui.QAction(parent=MainWindow)
+        self.actionStop_Sweep.setObjectName("actionStop_Sweep")
+        self.actionStep_Response = QtGui.QAction(parent=MainWindow)
+        self.actionStep_Response.setObjectName("actionStep_Response")
+        self.actionConstant_Power = QtGui.QAction(parent=MainWindow)
+        self.actionConstant_Power.setObjectName("actionConstant_Power")
+        self.actionConstant_Resistance = QtGui.QAction(parent=MainWindow)
+        self.actionConstant_Resistance.setObjectName("actionConstant_Resistance")
+        self.actionStop_Regulator = QtGui.QAction(parent=MainWindow)
+        self.actionStop_Regulator.setObjectName("actionStop_Regulator")
+        self.actionPolling = QtGui.QAction(parent=MainWindow)
+        self.actionPolling.setObjectName("actionPolling")
+        self.actionCalibrate_Link = QtGui.QAction(parent=MainWindow)
+        self.actionCalibrate_Link.setObjectName("actionCalibrate_Link")
         self.menuOptions.addAction(self.actionReset)
+        self.menuOptions.addAction(self.actionApply_All)
+        self.menuOptions.addAction(self.actionPolling)
+        self.menuOptions.addAction(self.actionCalibrate_Link)
         self.menuOptions.addAction(self.actionExit)
         self.menuSave_State.addAction(self.actionSave_State_1)
         self.menuSave_State.addAction(self.actionSave_State_2)
@@ -581,10 +648,39 @@ class Ui_MainWindow(object):
         self.menuLoad_State.addAction(self.actionLoad_State_4)
         self.menuToggle.addAction(self.action_ToggleBeep)
         self.menuToggle.addAction(self.actionToggleTracking)
+        self.menuPresets.addAction(self.actionSave_Preset)
+        self.menuPresets.addAction(self.actionLoad_Preset)
+        self.menuPresets.addAction(self.actionDelete_Preset)
+        self.menuStatistics.addAction(self.actionShow_Statistics)
+        self.menuStatistics.addAction(self.actionReset_Statistics)
+        self.menuAlarms.addAction(self.actionSet_Alarm_Limit)
+        self.menuAlarms.addAction(self.actionClear_Alarm_Limits)
+        self.menuAlarms.addAction(self.actionShow_Alarm_Limits)
+        self.menuCapture.addAction(self.actionConfigure_Capture)
+        self.menuCapture.addAction(self.actionSet_Capture_Trigger)
+        self.menuCapture.addAction(self.actionArm_Capture)
+        self.menuCapture.addAction(self.actionDisarm_Capture)
+        self.menuHistory.addAction(self.actionExport_History)
+        self.menuHistory.addAction(self.actionClear_History)
+        self.menuHistory.addAction(self.actionQuery_Log_Range)
+        self.menuHistory.addAction(self.actionRebuild_Log_Index)
+        self.menuSweep.addAction(self.actionRun_Sweep)
+        self.menuSweep.addAction(self.actionStop_Sweep)
+        self.menuSweep.addAction(self.actionStep_Response)
+        self.menuRegulator.addAction(self.actionConstant_Power)
+        self.menuRegulator.addAction(self.actionConstant_Resistance)
+        self.menuRegulator.addAction(self.actionStop_Regulator)
         self.menubar.addAction(self.menuOptions.menuAction())
         self.menubar.addAction(self.menuSave_State.menuAction())
         self.menubar.addAction(self.menuLoad_State.menuAction())
         self.menubar.addAction(self.menuToggle.menuAction())
+        self.menubar.addAction(self.menuPresets.menuAction())
+        self.menubar.addAction(self.menuStatistics.menuAction())
+        self.menubar.addAction(self.menuAlarms.menuAction())
+        self.menubar.addAction(self.menuCapture.menuAction())
+        self.menubar.addAction(self.menuHistory.menuAction())
+        self.menubar.addAction(self.menuSweep.menuAction())
+        self.menubar.addAction(self.menuRegulator.menuAction())
 
         self.retranslateUi(MainWindow)
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
@@ -662,6 +758,13 @@ class Ui_MainWindow(object):
         self.menuSave_State.setTitle(_translate("MainWindow", "Save State"))
         self.menuLoad_State.setTitle(_translate("MainWindow", "Load State"))
         self.menuToggle.setTitle(_translate("MainWindow", "Toggle"))
+        self.menuPresets.setTitle(_translate("MainWindow", "Presets"))
+        self.menuStatistics.setTitle(_translate("MainWindow", "Statistics"))
+        self.menuAlarms.setTitle(_translate("MainWindow", "Alarms"))
+        self.menuCapture.setTitle(_translate("MainWindow", "Capture"))
+        self.menuHistory.setTitle(_translate("MainWindow", "History"))
+        self.menuSweep.setTitle(_translate("MainWindow", "Sweep"))
+        self.menuRegulator.setTitle(_translate("MainWindow", "Regulator"))
         self.actionReset.setText(_translate("MainWindow", "Reset"))
         self.actionExit.setText(_translate("MainWindow", "Exit"))
         self.actionSave_State_1.setText(_translate("MainWindow", "Save State 1"))
@@ -690,3 +793,28 @@ class Ui_MainWindow(object):
         self.action_Parallel.setText(_translate("MainWindow", "Parallel"))
         self.action_ToggleBeep.setText(_translate("MainWindow", "Beep"))
         self.actionToggleTracking.setText(_translate("MainWindow", "Tracking"))
+        self.actionApply_All.setText(_translate("MainWindow", "Apply All Setpoints"))
+        self.actionSave_Preset.setText(_translate("MainWindow", "Save Preset..."))
+        self.actionLoad_Preset.setText(_translate("MainWindow", "Load Preset..."))
+        self.actionDelete_Preset.setText(_translate("MainWindow", "Delete Preset..."))
+        self.actionShow_Statistics.setText(_translate("MainWindow", "Show Statistics"))
+        self.actionReset_Statistics.setText(_translate("MainWindow", "Reset Statistics"))
+        self.actionSet_Alarm_Limit.setText(_translate("MainWindow", "Set Alarm Limit..."))
+        self.actionClear_Alarm_Limits.setText(_translate("MainWindow", "Clear Alarm Limits"))
+        self.actionShow_Alarm_Limits.setText(_translate("MainWindow", "Show Alarm Limits"))
+        self.actionConfigure_Capture.setText(_translate("MainWindow", "Configure Capture..."))
+        self.actionSet_Capture_Trigger.setText(_translate("MainWindow", "Set Capture Trigger..."))
+        self.actionArm_Capture.setText(_translate("MainWindow", "Arm Capture"))
+        self.actionDisarm_Capture.setText(_translate("MainWindow", "Disarm Capture"))
+        self.actionExport_History.setText(_translate("MainWindow", "Export History..."))
+        self.actionClear_History.setText(_translate("MainWindow", "Clear History"))
+        self.actionQuery_Log_Range.setText(_translate("MainWindow", "Query Log Range..."))
+        self.actionRebuild_Log_Index.setText(_translate("MainWindow", "Rebuild Log Index"))
+        self.actionRun_Sweep.setText(_translate("MainWindow", "Run Sweep..."))
+        self.actionStop_Sweep.setText(_translate("MainWindow", "Stop Sweep"))
+        self.actionStep_Response.setText(_translate("MainWindow", "Step Response..."))
+        self.actionConstant_Power.setText(_translate("MainWindow", "Constant Power..."))
+        self.actionConstant_Resistance.setText(_translate("MainWindow", "Constant Resistance..."))
+        self.actionStop_Regulator.setText(_translate("MainWindow", "Stop Regulator"))
+        self.actionPolling.setText(_translate("MainWindow", "Polling..."))
+        self.actionCalibrate_Link.setText(_translate("MainWindow", "Calibrate Link"))
@@ -0,0 +1,148 @@
+"""
+Name: GPD_4303S_Group.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Switch the outputs of several GPD-X303S power supplies together, each supply's thread takes its link and waits pre-staged so OUT1/OUT0 goes out on every port at once (or in order with programmed delays), then the achieved timing and skew are reported and the output state read back
+"""
+
+Usage = """
+Usage: python GPD_4303S_Group.py on|off RESOURCE[@DELAY_MS] [RESOURCE[@DELAY_MS] ...] [--serial] [--baud N]
+- Fires OUT1 (on) or OUT0 (off) on every power supply, at the same moment unless a delay after the start is given (ASRL4::INSTR@50)
+- Prints when each command went out against its programmed time, the inter-supply skew and the output state read back
+- --serial  Opens the ports with pyserial directly instead of PyVISA
+- --baud N  Baud rate of every power supply (default 115200)
+- RESOURCE "sim" opens a simulated power supply, for trying out a sequence
+- Close any GUI that has one of the ports open first
+"""
+
+import itertools
+import sys
+import threading
+import time
+import GPD_4303S_Codec
+import GPD_4303S_Link
+import GPD_4303S_Simulator
+import GPD_4303S_Transport
+
+Simulated = itertools.count(1) # Serial numbers of the simulated supplies opened so far
+
+def OpenLink(Resource, Backend="visa", BaudRate=115200, ResourceManager=None): # Link to one power supply for the tools that drive several at once
+    if(Resource == "sim"):
+        Supply = GPD_4303S_Simulator.SimulatedSupply(SN=f"SIM{next(Simulated):06d}")
+        Opener = lambda: GPD_4303S_Simulator.SimulatedTransport(Supply)
+    elif(Backend == "serial"):
+        Opener = lambda: GPD_4303S_Transport.SerialTransport(Resource, BaudRate)
+    else:
+        Opener = lambda: GPD_4303S_Transport.VisaTransport(ResourceManager, Resource, BaudRate)
+    return GPD_4303S_Link.GPD_4303S_Link(Opener(), Opener)
+
+class GroupSwitch(): # One thread per supply, staged with the link held so nothing else can be on the wire when the command fires
+    def __init__(self, Links, Names=None):
+        self.Links = list(Links)
+        self.Names = list(Names) if Names is not None else [f"PS{i + 1}" for i in range(len(self.Links))]
+
+    def Stage(self, i, Command, Delay, Origin, Staged, Go, Results):
+        Link = self.Links[i]
+        try:
+            Link.Check()
+            with Link.Lock:
+                Link.Pace() # Any gap owed to the last command is served before the start, not after it
+                Staged.wait() # Every supply is held here, an abort (another one failed to stage) raises and nothing is sent
+                Go.wait() # Released together, no spinning so the threads never fight over the GIL at the start
+                Wait = self.Start + Delay - time.perf_counter()
+                if(Wait > 0):
+                    time.sleep(Wait)
+                Before = time.perf_counter()
+                Link.Send(Command, Origin)
+                After = time.perf_counter()
+                Link.LastWrite = After
+            Results[i] = {"Name": self.Names[i], "Command": Command, "Delay": Delay, "Sent": Before - self.Start, "Written": After - self.Start, "Error": None}
+        except threading.BrokenBarrierError:
+            Results[i] = {"Name": self.Names[i], "Command": Command, "Delay": Delay, "Sent": None, "Written": None, "Error": "not sent, another supply failed to stage"}
+        except Exception as e:
+            Staged.abort()
+            Results[i] = {"Name": self.Names[i], "Command": Command, "Delay": Delay, "Sent": None, "Written": None, "Error": str(e)}
+
+    def Fire(self, On, Delays=None, Origin="script"): # Switch every output on or off, Delays (s after the start) gives an ordered sequence, returns the report
+        Command = "OUT1" if On else "OUT0"
+        Delays = list(Delays) if Delays is not None else [0.0] * len(self.Links)
+        Staged = threading.Barrier(len(self.Links) + 1)
+        Go = threading.Event()
+        Results = [None] * len(self.Links)
+        Threads = [threading.Thread(target=self.Stage, args=(i, Command, Delays[i], Origin, Staged, Go, Results), daemon=True) for i in range(len(self.Links))]
+        for Thread in Threads:
+            Thread.start()
+        try:
+            Staged.wait()
+        except threading.BrokenBarrierError:
+            pass
+        self.Start = time.perf_counter()
+        Go.set()
+        for Thread in Threads:
+            Thread.join()
+        Report = {"Command": Command, "Supplies": Results}
+        Offsets = [Result["Sent"] - Result["Delay"] for Result in Results if Result["Sent"] is not None]
+        Report["Skew"] = max(Offsets) - min(Offsets) if len(Offsets) > 1 else 0.0 # Spread of the send times against the programmed ones
+        Report["Verified"] = self.Verify(On)
+        return Report
+
+    def Verify(self, On): # Output bit of every supply read back in parallel after the switch, None where STATUS? failed
+        States = [None] * len(self.Links)
+        def Read(i):
+            try:
+                Fields = GPD_4303S_Codec.StatusFields(self.Links[i].query("STATUS?"))
+                States[i] = None if Fields is None else Fields["Output"] == ("ON" if On else "OFF")
+            except Exception:
+                States[i] = None
+        Threads = [threading.Thread(target=Read, args=(i,), daemon=True) for i in range(len(self.Links))]
+        for Thread in Threads:
+            Thread.start()
+        for Thread in Threads:
+            Thread.join()
+        return States
+
+def Describe(Report): # Lines for the command line report
+    Lines = ["Supply,Command,Programmed (ms),Sent (ms),Error (ms),Write (ms),Verified"]
+    for Result, Verified in zip(Report["Supplies"], Report["Verified"]):
+        if(Result["Sent"] is None):
+            Lines.append(f"{Result['Name']},{Result['Command']},{Result['Delay'] * 1e3:.3f},,,,{Result['Error']}")
+        else:
+            Lines.append(f"{Result['Name']},{Result['Command']},{Result['Delay'] * 1e3:.3f},{Result['Sent'] * 1e3:.3f},{(Result['Sent'] - Result['Delay']) * 1e3:.3f},"
+                         f"{(Result['Written'] - Result['Sent']) * 1e3:.3f},{'yes' if Verified else 'NO' if Verified is False else 'unknown'}")
+    Lines.append(f"Skew {Report['Skew'] * 1e6:.0f} us")
+    return Lines
+
+if __name__=="__main__": # Command line front end, see the usage notes at the top
+    Arguments = sys.argv[1:]
+    Backend = "visa"
+    BaudRate = 115200
+    if("--serial" in Arguments):
+        Arguments.remove("--serial")
+        Backend = "serial"
+    if("--baud" in Arguments):
+        i = Arguments.index("--baud")
+        BaudRate = int(Arguments[i + 1])
+        del Arguments[i:i + 2]
+    if(len(Arguments) < 2 or Arguments[0] not in ("on", "off")):
+        print(Usage)
+        sys.exit(1)
+    Resources = []
+    Delays = []
+    for Argument in Arguments[1:]:
+        Resource, _, Delay = Argument.partition("@")
+        Resources.append(Resource)
+        Delays.append(float(Delay) / 1000.0 if Delay else 0.0)
+    ResourceManager = None
+    if(Backend == "visa" and any(Resource != "sim" for Resource in Resources)):
+        import pyvisa
+        ResourceManager = pyvisa.ResourceManager("@py")
+    Links = [OpenLink(Resource, Backend, BaudRate, ResourceManager) for Resource in Resources]
+    try:
+        Names = []
+        for Resource, Link in zip(Resources, Links):
+            Identity = GPD_4303S_Codec.Identity(Link.query("*IDN?"))
+            Names.append(f"{Resource} ({Identity['SN'] if Identity is not None else 'unknown SN'})")
+        print("\n".join(Describe(GroupSwitch(Links, Names).Fire(Arguments[0] == "on", Delays))))
+    finally:
+        for Link in Links:
+            Link.close()
@@ -0,0 +1,120 @@
+"""
+Name: GPD_4303S_History.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Bounded history for long GPD-X303S monitoring runs, keeps full rate samples for a recent window and rolls older data into 1 s, 1 min and 1 h tiers of min/max/mean per reading
+"""
+
+import bisect
+import math
+from array import array
+
+Readings = 8 # V1-V4 then A1-A4, the same order the acquisition worker reads them
+
+class Tier():
+    def __init__(self, Width, Keep):
+        self.Width = Width # Bucket width (s), 0 for the raw tier
+        self.Keep = Keep # Most buckets (or raw samples) kept, oldest are dropped first
+        self.Starts = [] # Bucket start times, sorted so a query can bisect
+        self.Rows = [] # array("d") of min, max, mean for each reading (just the readings in the raw tier)
+        self.OpenStart = None # Bucket still being filled
+        self.Dropped = False # Set once old data has been aged out, until then the tier holds the whole run
+        self.Count = None # Valid (not NaN) samples of each reading in the open bucket
+        self.Min = None
+        self.Max = None
+        self.Sum = None
+
+    def Append(self, Start, Row):
+        self.Starts.append(Start)
+        self.Rows.append(Row)
+        if(len(self.Starts) > self.Keep + self.Keep // 4): # Trim in blocks so dropping old data stays O(1) amortised
+            self.Drop(len(self.Starts) - self.Keep)
+
+    def Drop(self, Count):
+        del self.Starts[:Count]
+        del self.Rows[:Count]
+        self.Dropped = True
+
+    def Add(self, Time, Values):
+        if(self.Width == 0):
+            self.Append(Time, array("d", Values))
+            return
+        Start = math.floor(Time / self.Width) * self.Width
+        if(self.OpenStart is not None and Start != self.OpenStart):
+            self.Close()
+        if(self.OpenStart is None):
+            self.OpenStart = Start
+            self.Count = [0] * Readings
+            self.Min = [math.inf] * Readings
+            self.Max = [-math.inf] * Readings
+            self.Sum = [0.0] * Readings
+        for i in range(Readings):
+            Value = Values[i]
+            if(Value != Value): # NaN (malformed or unpolled) is left out, the rest of the bucket still counts
+                continue
+            self.Count[i] += 1
+            if(Value < self.Min[i]):
+                self.Min[i] = Value
+            if(Value > self.Max[i]):
+                self.Max[i] = Value
+            self.Sum[i] += Value
+
+    def OpenRow(self):
+        Valid = [Count > 0 for Count in self.Count] # A reading with no valid sample in the bucket is NaN
+        return array("d", [Low if OK else math.nan for Low, OK in zip(self.Min, Valid)] + [High if OK else math.nan for High, OK in zip(self.Max, Valid)] +
+                     [Sum / Count if Count else math.nan for Sum, Count in zip(self.Sum, self.Count)])
+
+    def Close(self):
+        self.Append(self.OpenStart, self.OpenRow())
+        self.OpenStart = None
+
+    def Covers(self, Start): # True if the tier still holds everything from Start onwards
+        Oldest = self.Starts[0] if self.Starts else self.OpenStart
+        return Oldest is not None and (Oldest <= Start or not self.Dropped)
+
+    def Unpack(self, Start, Row): # (Time, Width, Min, Max, Mean) for one stored row
+        Values = Row.tolist()
+        if(self.Width == 0):
+            return (Start, 0, Values, Values, Values)
+        return (Start, self.Width, Values[:Readings], Values[Readings:2 * Readings], Values[2 * Readings:])
+
+    def Query(self, Start, End): # Rows overlapping [Start, End], found by bisection so the cost only depends on the rows returned
+        First = bisect.bisect_left(self.Starts, Start - self.Width)
+        Last = bisect.bisect_right(self.Starts, End)
+        Result = [self.Unpack(self.Starts[i], self.Rows[i]) for i in range(First, Last) if self.Starts[i] + self.Width >= Start]
+        if(self.OpenStart is not None and self.OpenStart <= End and self.OpenStart + self.Width >= Start):
+            Result.append(self.Unpack(self.OpenStart, self.OpenRow()))
+        return Result
+
+class TieredHistory():
+    def __init__(self, RawSeconds=600, RawLimit=200000):
+        self.RawSeconds = RawSeconds # Full rate data older than this is only kept in the tiers
+        self.Raw = Tier(0, RawLimit)
+        self.Tiers = [Tier(1, 6 * 3600), Tier(60, 31 * 24 * 60), Tier(3600, 366 * 24)] # 6 hours of 1 s, a month of 1 min, a year of 1 h
+        self.Samples = 0
+
+    def Add(self, Time, Values): # Feed one sample (epoch seconds, 8 readings), O(1) per tier
+        self.Raw.Add(Time, Values)
+        Cut = bisect.bisect_left(self.Raw.Starts, Time - self.RawSeconds)
+        if(Cut > len(self.Raw.Starts) // 4): # Age out the raw window in blocks
+            self.Raw.Drop(Cut)
+        for Tier in self.Tiers:
+            Tier.Add(Time, Values)
+        self.Samples += 1
+
+    def Clear(self):
+        self.__init__(self.RawSeconds, self.Raw.Keep)
+
+    def Pick(self, Start, Resolution): # Coarsest tier no coarser than the resolution that still holds data back to Start
+        Candidates = [Tier for Tier in [self.Raw] + self.Tiers if Tier.Width <= Resolution]
+        for Tier in reversed(Candidates):
+            if(Tier.Covers(Start)):
+                return Tier
+        for Tier in [self.Raw] + self.Tiers: # Nothing fine enough reaches back that far, use the finest tier that does
+            if(Tier.Covers(Start)):
+                return Tier
+        return Candidates[-1] if Candidates else self.Raw
+
+    def Query(self, Start, End, Resolution=0): # Rows for a time range at (or finer than) the requested resolution in seconds, returns (Width, Rows)
+        Tier = self.Pick(Start, Resolution)
+        return Tier.Width, Tier.Query(Start, End)
@@ -0,0 +1,106 @@
+"""
+Name: GPD_4303S_Journal.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Append-only audit journal of every setting command sent to a GPD-X303S (VSET, ISET, OUT, SAV, RCL, TRACK, BEEP) with its time, origin and readback, written as fixed size binary records by a background thread so a command only pays for a queue put
+"""
+
+Usage = """
+Usage: python GPD_4303S_Journal.py JOURNAL [--from TIME] [--to TIME] [--command PREFIX] [--origin ORIGIN] [--csv OUT]
+- Prints the journal records (or writes them to OUT as CSV), oldest first
+- TIME is "YYYY-MM-DD HH:MM:SS" (wall clock), PREFIX a command start such as VSET1 or OUT, ORIGIN one of user, script, alarm
+- The GUI journals to GPD_4303S_Journal_<SN>.gpdj
+"""
+
+import csv
+import math
+import queue
+import struct
+import sys
+import threading
+import time
+from datetime import datetime
+
+Magic = b"GPDJ"
+Version = 1
+Record = struct.Struct("<ddBBf16s") # Monotonic time, wall time, kind, origin, readback value (NaN if none), command (38 bytes a record)
+Origins = ["user", "script", "alarm", "startup"] # Stored as the index, new origins go on the end
+Kinds = ["Sent", "Failed", "Verified", "Mismatch"] # A readback is journaled as its own record after the command it checks
+
+class JournalWriter(): # Commands are queued by whichever thread sends them and packed and written by one background thread
+    def __init__(self, Path):
+        self.Path = Path
+        self.File = open(Path, "ab")
+        if(self.File.tell() == 0):
+            self.File.write(Magic + struct.pack("<H", Version))
+            self.File.flush()
+        self.Queue = queue.SimpleQueue()
+        self.Thread = threading.Thread(target=self.Run, daemon=True)
+        self.Thread.start()
+
+    def Add(self, Command, Origin="user", Kind="Sent", Value=math.nan): # Called on the sending thread, a couple of microseconds
+        self.Queue.put((time.monotonic(), time.time(), Kinds.index(Kind), Origins.index(Origin), Value, Command))
+
+    def Readback(self, Command, Value, Matched, Origin="user"): # Journal what the power supply reported back for Command (the value, or NaN for a state check)
+        self.Add(Command, Origin, "Verified" if Matched else "Mismatch", Value)
+
+    def Run(self):
+        while True:
+            Item = self.Queue.get()
+            Data = bytearray()
+            while Item is not None: # Write everything already queued in one go
+                Monotonic, Wall, Kind, Origin, Value, Command = Item
+                Data += Record.pack(Monotonic, Wall, Kind, Origin, Value, Command.encode("ascii", "replace"))
+                try:
+                    Item = self.Queue.get_nowait()
+                except queue.Empty:
+                    break
+            self.File.write(Data)
+            self.File.flush()
+            if(Item is None):
+                return
+
+    def Close(self): # Waits for the queued records to reach the file
+        self.Queue.put(None)
+        self.Thread.join()
+        self.File.close()
+
+def ReadJournal(Path): # Yields (monotonic, wall, kind, origin, value, command) for every record
+    with open(Path, "rb") as journal_file:
+        if(journal_file.read(len(Magic)) != Magic):
+            raise ValueError(f"{Path} is not a GPD-X303S journal")
+        journal_file.read(2)
+        Data = journal_file.read()
+    Data = Data[:len(Data) - len(Data) % Record.size] # A record cut short by a crash is dropped
+    for Monotonic, Wall, Kind, Origin, Value, Command in Record.iter_unpack(Data):
+        yield Monotonic, Wall, Kinds[Kind], Origins[Origin], Value, Command.rstrip(b"\0").decode("ascii")
+
+def Query(Path, Start=None, End=None, Command=None, Origin=None): # Records in a wall clock range (seconds since the epoch) matching a command prefix and origin
+    return [Entry for Entry in ReadJournal(Path) if (Start is None or Entry[1] >= Start) and (End is None or Entry[1] <= End)
+            and (Command is None or Entry[5].startswith(Command)) and (Origin is None or Entry[3] == Origin)]
+
+def Rows(Entries): # Journal records as CSV rows
+    yield ["Wall", "Monotonic", "Kind", "Origin", "Command", "Readback"]
+    for Monotonic, Wall, Kind, Origin, Value, Command in Entries:
+        yield [datetime.fromtimestamp(Wall).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3], f"{Monotonic:.6f}", Kind, Origin, Command, "" if Value != Value else f"{Value:.3f}"]
+
+if __name__=="__main__": # Command line front end, see the usage notes at the top
+    Arguments = sys.argv[1:]
+    Options = {}
+    for Flag in ("--from", "--to", "--command", "--origin", "--csv"):
+        if(Flag in Arguments):
+            i = Arguments.index(Flag)
+            Options[Flag] = Arguments[i + 1]
+            del Arguments[i:i + 2]
+    if(len(Arguments) != 1):
+        print(Usage)
+        sys.exit(1)
+    Stamp = lambda Text: datetime.strptime(Text, "%Y-%m-%d %H:%M:%S").timestamp() if Text is not None else None
+    Entries = Query(Arguments[0], Stamp(Options.get("--from")), Stamp(Options.get("--to")), Options.get("--command"), Options.get("--origin"))
+    if("--csv" in Options):
+        with open(Options["--csv"], mode='w', newline='') as csv_file:
+            csv.writer(csv_file).writerows(Rows(Entries))
+        print(f"{len(Entries)} records written to {Options['--csv']}")
+    else:
+        for Row in Rows(Entries):
+            print(",".join(Row))
@@ -0,0 +1,168 @@
+"""
+Name: GPD_4303S_Link.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Thread safe wrapper around the transport (PyVISA or pyserial) of a GPD-X303S so the GUI and the acquisition worker can share one serial link, paced and timed out with the limits found by GPD_4303S_Calibration and reopened when the adapter drops
+"""
+
+import threading
+import time
+import GPD_4303S_Codec
+
+DefaultTimeout = 2.0 # PyVISA's default (s), used until the link is calibrated
+
+def CommandClass(Command): # Commands with similar response times share a timeout
+    if(not Command.endswith("?")):
+        return "Write"
+    if(Command.startswith(("VOUT", "IOUT"))):
+        return "Measure"
+    if(Command.startswith("STATUS")):
+        return "Status"
+    if(Command.startswith("*IDN")):
+        return "Identity"
+    return "Setting"
+
+class GPD_4303S_Link():
+    def __init__(self, Resource, Opener=None):
+        self.Resource = Resource # Opened GPD_4303S_Transport
+        self.Opener = Opener # Opens a new transport to the same resource, None disables reconnecting
+        self.Up = threading.Event() # Cleared while the link is being reopened
+        self.Up.set()
+        self.Lock = threading.RLock() # One transaction on the wire at a time, re-entrant so a batch can hold it across its writes and reads
+        self.Idle = threading.Event() # Cleared while a priority write (alarm cut-off) waits for the link, new transactions hold back and batches stop pipelining
+        self.Idle.set()
+        self.Gap = 0.0 # Minimum time between two commands (s), 0 until the link is calibrated
+        self.Timeouts = {} # Reply timeout per command class (s), empty keeps the transport default
+        self.Timeout = None # Timeout the transport is set to now, only changed when a different class needs another one
+        self.LastWrite = 0.0
+        self.Latency = {} # Command -> [replies, total seconds, slowest seconds], write to reply, read by the metrics endpoint without touching the link
+        self.Journal = None # GPD_4303S_Journal.JournalWriter every setting command is recorded to, set by the GUI once the SN is known
+
+    def Pace(self): # Hold the next command until the calibrated gap since the last one has passed
+        Wait = self.LastWrite + self.Gap - time.perf_counter()
+        if(Wait > 0.002):
+            time.sleep(Wait)
+        else:
+            while time.perf_counter() < self.LastWrite + self.Gap: # Sleep is too coarse for sub-ms gaps
+                pass
+        self.LastWrite = time.perf_counter()
+
+    def Expect(self, Commands): # Set the transport timeout for the slowest class among the replies about to be read
+        if(self.Timeouts):
+            Timeout = max(self.Timeouts.get(CommandClass(Command), max(self.Timeouts.values())) for Command in Commands)
+            if(Timeout != self.Timeout):
+                self.Resource.SetTimeout(Timeout)
+                self.Timeout = Timeout
+
+    def Observe(self, Command, Seconds): # Add one reply latency to the per command counters
+        Counter = self.Latency.get(Command)
+        if(Counter is None):
+            self.Latency[Command] = [1, Seconds, Seconds]
+        else:
+            Counter[0] += 1
+            Counter[1] += Seconds
+            if(Seconds > Counter[2]):
+                Counter[2] = Seconds
+
+    def Check(self): # Commands fail straight away while the link is down instead of queueing behind the reconnect
+        if(not self.Up.is_set()):
+            raise ConnectionError("Link down, reconnecting")
+        self.Idle.wait() # A pending priority write goes first
+
+    def Drop(self): # Mark the link dead, called by the acquisition worker when a reading fails
+        self.Up.clear()
+
+    def Reconnect(self, SN=None): # Reopen the transport and confirm it is the same power supply, raises if it is not (or does not answer), returns the *IDN? reply
+        with self.Lock:
+            try:
+                self.Resource.close()
+            except Exception:
+                pass # Usually already gone with the adapter
+            self.Resource = self.Opener()
+            self.Timeout = None
+            self.Expect(["*IDN?"])
+            IDN = self.Resource.query("*IDN?")
+            Identity = GPD_4303S_Codec.Identity(IDN)
+            if(Identity is None):
+                raise ConnectionError("Malformed *IDN? reply")
+            if(SN is not None and Identity["SN"] != SN):
+                raise ConnectionError(f"Different power supply on the port (SN {Identity['SN']})")
+            self.Up.set()
+            return IDN
+
+    def Calibrate(self, Gap, Timeouts): # Apply a calibration (see GPD_4303S_Calibration), no Timeouts goes back to the default
+        with self.Lock:
+            self.Gap = Gap
+            self.Timeouts = dict(Timeouts)
+            self.Timeout = None
+            if(not Timeouts):
+                self.Resource.SetTimeout(DefaultTimeout)
+
+    def Send(self, Command, Origin): # Write a setting command and journal it (or its failure)
+        try:
+            self.Resource.write(Command)
+        except Exception:
+            if(self.Journal is not None):
+                self.Journal.Add(Command, Origin, "Failed")
+            raise
+        if(self.Journal is not None):
+            self.Journal.Add(Command, Origin)
+
+    def write(self, Command, Origin="user"): # Origin ("user", "script" or "alarm") is what the journal records as having sent the command
+        self.Check()
+        with self.Lock:
+            self.Pace()
+            self.Send(Command, Origin)
+
+    def read(self):
+        self.Check()
+        with self.Lock:
+            return self.Resource.read()
+
+    def query(self, Command):
+        self.Check()
+        with self.Lock:
+            self.Expect([Command])
+            self.Pace()
+            Reply = self.Resource.query(Command)
+            self.Observe(Command, time.perf_counter() - self.LastWrite)
+            return Reply
+
+    def QueryBatch(self, Commands): # Pipeline a list of queries, write them all back to back then read the replies in order (one pass instead of a round trip per query)
+        self.Check()
+        Replies = []
+        while len(Replies) < len(Commands):
+            self.Idle.wait() # Between segments the link is handed to a pending priority write
+            with self.Lock:
+                Remaining = Commands[len(Replies):]
+                self.Expect(Remaining)
+                Sent = []
+                for Command in Remaining:
+                    if(Sent and not self.Idle.is_set()): # Priority write waiting, stop here and read back only what is in flight
+                        break
+                    self.Pace()
+                    self.Resource.write(Command)
+                    Sent.append((Command, self.LastWrite))
+                for Command, Time in Sent: # Each reply is timed from its own write, so a pipelined batch still gives per command latency
+                    Replies.append(self.Resource.read())
+                    self.Observe(Command, time.perf_counter() - Time)
+        return Replies
+
+    def PriorityWrite(self, Command): # Write that goes ahead of queued transactions, a batch in progress stops after the replies already in flight, used by the alarm cut-off
+        self.Check()
+        self.Idle.clear()
+        try:
+            with self.Lock:
+                self.Pace()
+                self.Send(Command, "alarm")
+        finally:
+            self.Idle.set()
+
+    def Flush(self):
+        self.Check()
+        with self.Lock:
+            self.Resource.Flush()
+
+    def close(self):
+        with self.Lock:
+            self.Resource.close()
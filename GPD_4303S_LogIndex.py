@@ -0,0 +1,94 @@
+"""
+Name: GPD_4303S_LogIndex.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Sidecar time index for the GPD-X303S CSV logs, records the byte offset of every Nth row so a time range can be read by seeking straight to it instead of scanning a multi-GB file
+"""
+
+import bisect
+import csv
+import os
+import struct
+from datetime import datetime
+
+Record = struct.Struct("<23sQ") # Row timestamp as written in the log ("%Y-%m-%d %H:%M:%S.fff") and the byte offset of the row
+Every = 1000 # Rows between index entries
+
+def IndexPath(LogPath):
+    return LogPath + ".idx"
+
+def StampKey(Stamp, Pad="0000-00-00 00:00:00.000"): # Log timestamp key (bytes) from a datetime or a (possibly shortened) timestamp string, fixed width so keys compare in time order
+    if(isinstance(Stamp, datetime)):
+        Stamp = Stamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+    Stamp = Stamp.strip()[:23]
+    return (Stamp + Pad[len(Stamp):]).encode("ascii")
+
+class LogIndexWriter():
+    def __init__(self, LogPath, Every=Every):
+        self.LogPath = LogPath
+        self.Every = Every
+        self.Rows = Every # Index the first row written this session
+        self.File = None
+
+    def Add(self, Stamp, Offset): # Called for every row appended to the log, with the offset the row was written at
+        self.Rows += 1
+        if(self.Rows < self.Every):
+            return
+        self.Rows = 0
+        if(self.File is None): # Rows logged before the index existed are still found (by scanning from the start) until the index is rebuilt
+            self.File = open(IndexPath(self.LogPath), "ab")
+        self.File.write(Record.pack(StampKey(Stamp), Offset))
+        self.File.flush()
+
+    def Reset(self): # Next row starts a new index entry (new run or the log was reopened)
+        self.Rows = self.Every
+
+    def Close(self):
+        if(self.File is not None):
+            self.File.close()
+            self.File = None
+
+def Rebuild(LogPath, Every=Every): # Recreate the index of an existing log with one scan, returns the number of data rows
+    Rows = 0
+    Offset = 0
+    with open(LogPath, "rb") as log_file, open(IndexPath(LogPath) + ".tmp", "wb") as index_file:
+        for Line in log_file:
+            if(not Line.startswith(b"#") and Line.strip()):
+                if(Rows % Every == 0):
+                    index_file.write(Record.pack(Line[:23], Offset))
+                Rows += 1
+            Offset += len(Line)
+    os.replace(IndexPath(LogPath) + ".tmp", IndexPath(LogPath))
+    return Rows
+
+def LoadIndex(LogPath): # Index entries as two parallel lists (keys, offsets), rebuilt first if the log has none
+    if(not os.path.exists(IndexPath(LogPath))):
+        Rebuild(LogPath)
+    with open(IndexPath(LogPath), "rb") as index_file:
+        Data = index_file.read()
+    Keys = []
+    Offsets = []
+    for Key, Offset in Record.iter_unpack(Data[:len(Data) - len(Data) % Record.size]):
+        Keys.append(Key)
+        Offsets.append(Offset)
+    return Keys, Offsets
+
+def SeekOffset(Keys, Offsets, Start): # Offset of the last indexed row at or before Start (0 when Start is before the first entry)
+    Position = bisect.bisect_left(Keys, Start) - 1
+    return Offsets[Position] if Position >= 0 else 0
+
+def QueryRange(LogPath, Start, End, Index=None): # Stream the rows with Start <= time <= End as CSV row lists
+    Start = StampKey(Start)
+    End = StampKey(End, "9999-99-99 99:99:99.999") # "2026-10-19 02:14" runs to the end of that minute
+    Keys, Offsets = Index if Index is not None else LoadIndex(LogPath)
+    with open(LogPath, "rb") as log_file:
+        log_file.seek(SeekOffset(Keys, Offsets, Start))
+        for Line in log_file:
+            if(Line.startswith(b"#") or not Line.strip()):
+                continue
+            Key = Line[:23]
+            if(Key < Start):
+                continue
+            if(Key > End):
+                break
+            yield next(csv.reader([Line.decode("ascii", "replace").rstrip("\r\n")]))
@@ -0,0 +1,173 @@
+"""
+Name: GPD_4303S_Merged.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Log several GPD-X303S power supplies into one wide CSV, every supply is polled on its own thread and stamped from the same monotonic clock, then the samples are aligned onto a common time grid (nearest or linear) and streamed out row by row so nothing grows with the length of the run
+"""
+
+Usage = """
+Usage: python GPD_4303S_Merged.py OUT.csv RESOURCE [RESOURCE ...] [--interval S] [--mode nearest|linear] [--duration S] [--serial] [--baud N]
+- Polls every power supply on its own thread and writes one row per grid point with V1-V4/I1-I4 of every supply side by side
+- --interval S  Grid spacing, each supply is also polled on this schedule (default 1 s)
+- --mode        nearest takes the sample closest to the grid point, linear interpolates between the samples either side when both are within 3 intervals and falls back to nearest otherwise (default nearest)
+- The offset column of each supply is how far its sample was from the grid point, for an interpolated value the farther of the two samples
+- --duration S  Stop after S seconds (default: run until Ctrl+C)
+- --serial, --baud N  As for GPD_4303S_Group.py, RESOURCE "sim" opens a simulated power supply
+- A supply with no sample within 3 intervals of a grid point (link down) is written as nan for that row
+"""
+
+import collections
+import csv
+import sys
+import threading
+import time
+from datetime import datetime
+import GPD_4303S_Acquisition
+import GPD_4303S_Alarms
+import GPD_4303S_Codec
+import GPD_4303S_Group
+
+Columns = ["V1", "V2", "V3", "V4", "A1", "A2", "A3", "A4"] # Same order as the readings of a sample
+
+class GridMerger(): # Holds only the few samples of each supply around the next grid point
+    def __init__(self, Count, Start, Interval=1.0, Mode="nearest", Timeout=None):
+        self.Samples = [collections.deque() for i in range(Count)] # (time, readings) per supply, oldest first
+        self.Start = Start # Monotonic time of grid point 0
+        self.Interval = Interval
+        self.Mode = Mode
+        self.Timeout = Timeout if Timeout is not None else 3 * Interval # How long a grid point waits for a late supply
+        self.Ready = threading.Condition()
+
+    def Add(self, i, Time, Readings): # Called by supply i's poller with the monotonic time the readings were taken
+        with self.Ready:
+            self.Samples[i].append((Time, Readings))
+            self.Ready.notify()
+
+    def Complete(self, Time): # Every supply has a sample at or after Time, or has run out of time to send one
+        Late = time.monotonic() > Time + self.Timeout
+        return Late or all(Samples and Samples[-1][0] >= Time for Samples in self.Samples)
+
+    def Align(self, Samples, Time): # Readings and time offset (s) of one supply at a grid point, drops the samples no later point can use
+        while len(Samples) > 1 and Samples[1][0] <= Time:
+            Samples.popleft()
+        if(not Samples):
+            return [GPD_4303S_Codec.NaN] * len(Columns), GPD_4303S_Codec.NaN
+        Before = Samples[0]
+        After = Samples[1] if len(Samples) > 1 else None
+        if(Before[0] > Time): # Only a sample after the grid point so far
+            Before, After = None, Before
+        if(Before is None or After is None):
+            Nearest = Before if After is None else After
+            if(abs(Nearest[0] - Time) > self.Timeout): # Too far from the grid point to stand for it
+                return [GPD_4303S_Codec.NaN] * len(Columns), GPD_4303S_Codec.NaN
+            return Nearest[1], Nearest[0] - Time
+        if(self.Mode == "linear" and After[0] > Before[0] and Time - Before[0] <= self.Timeout and After[0] - Time <= self.Timeout): # Both sides close enough to stand for the grid point
+            Weight = (Time - Before[0]) / (After[0] - Before[0])
+            Farthest = Before if Time - Before[0] > After[0] - Time else After # The offset is how far the interpolation had to reach
+            return [Low + (High - Low) * Weight for Low, High in zip(Before[1], After[1])], Farthest[0] - Time
+        Nearest = Before if Time - Before[0] <= After[0] - Time else After # Nearest mode, or a gap too wide to interpolate across
+        if(abs(Nearest[0] - Time) > self.Timeout):
+            return [GPD_4303S_Codec.NaN] * len(Columns), GPD_4303S_Codec.NaN
+        return Nearest[1], Nearest[0] - Time
+
+    def Next(self, k, Stop): # Aligned readings of every supply at grid point k, None if stopped first
+        Time = self.Start + k * self.Interval
+        with self.Ready:
+            while not self.Complete(Time):
+                if(Stop.is_set()):
+                    return None
+                self.Ready.wait(min(self.Interval, max(0.01, Time + self.Timeout - time.monotonic())))
+            return [self.Align(Samples, Time) for Samples in self.Samples]
+
+class SupplyPoller(threading.Thread): # Polls one power supply on the grid schedule through the acquisition worker's Measure and reconnect logic
+    def __init__(self, Index, Link, SN, Merger, Stop):
+        super().__init__(daemon=True)
+        self.Index = Index
+        self.Merger = Merger
+        self.Stop = Stop
+        self.Worker = GPD_4303S_Acquisition.AcquisitionWorker(Link, GPD_4303S_Alarms.AlarmLimits()) # Only its Measure and Recover are used, it is never started
+        self.Worker.SN = SN
+        self.Worker.ReadStatus = False
+        self.Worker.StopEvent = Stop
+
+    def run(self):
+        k = 0
+        while not self.Stop.is_set():
+            self.Stop.wait(max(0.0, self.Merger.Start + k * self.Merger.Interval - time.monotonic()))
+            if(self.Stop.is_set()):
+                return
+            try:
+                Sample = self.Worker.Measure()
+            except Exception as e:
+                if(not self.Worker.Recover(str(e))):
+                    return
+            else:
+                self.Merger.Add(self.Index, (Sample["Start"] + Sample["Time"]) / 2, Sample["Voltages"] + Sample["Currents"]) # Middle of the batch stands for when it was read
+            k = max(k + 1, int((time.monotonic() - self.Merger.Start) / self.Merger.Interval) + 1) # Skip grid points already missed
+
+def MergedLog(Path, Links, Names, Interval=1.0, Mode="nearest", Duration=None, SNs=None): # Poll and write until Duration (s) runs out or Ctrl+C, returns the number of rows written, SNs (default Names) are checked on reconnect, None skips the check
+    Stop = threading.Event()
+    Merger = GridMerger(len(Links), time.monotonic() + Interval, Interval, Mode)
+    Wall = time.time() + (Merger.Start - time.monotonic()) # Wall clock time of grid point 0, every row is stamped from the monotonic grid
+    SNs = list(SNs) if SNs is not None else list(Names)
+    Pollers = [SupplyPoller(i, Link, SN, Merger, Stop) for i, (Link, SN) in enumerate(zip(Links, SNs))]
+    for Poller in Pollers:
+        Poller.start()
+    Rows = 0
+    try:
+        with open(Path, mode='a', newline='') as log_file:
+            csv_writer = csv.writer(log_file)
+            if(log_file.tell() == 0):
+                csv_writer.writerow(["Time", "Elapsed (s)"] + [f"{Name} {Column}" for Name in Names for Column in Columns] + [f"{Name} Offset (ms)" for Name in Names])
+            while Duration is None or Rows * Interval < Duration:
+                Aligned = Merger.Next(Rows, Stop)
+                if(Aligned is None):
+                    break
+                Row = [datetime.fromtimestamp(Wall + Rows * Interval).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3], f"{Rows * Interval:.3f}"]
+                for Readings, Offset in Aligned:
+                    Row += [GPD_4303S_Codec.Format(Value) for Value in Readings]
+                Row += [GPD_4303S_Codec.Format(Offset * 1e3) for Readings, Offset in Aligned]
+                csv_writer.writerow(Row)
+                log_file.flush()
+                Rows += 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        Stop.set()
+        for Poller in Pollers:
+            Poller.join()
+    return Rows
+
+if __name__=="__main__": # Command line front end, see the usage notes at the top
+    Arguments = sys.argv[1:]
+    Options = {"--interval": "1", "--mode": "nearest", "--duration": None, "--baud": "115200"}
+    for Flag in ("--interval", "--mode", "--duration", "--baud"):
+        if(Flag in Arguments):
+            i = Arguments.index(Flag)
+            Options[Flag] = Arguments[i + 1]
+            del Arguments[i:i + 2]
+    Backend = "visa"
+    if("--serial" in Arguments):
+        Arguments.remove("--serial")
+        Backend = "serial"
+    if(len(Arguments) < 2 or Options["--mode"] not in ("nearest", "linear")):
+        print(Usage)
+        sys.exit(1)
+    Resources = Arguments[1:]
+    ResourceManager = None
+    if(Backend == "visa" and any(Resource != "sim" for Resource in Resources)):
+        import pyvisa
+        ResourceManager = pyvisa.ResourceManager("@py")
+    Links = [GPD_4303S_Group.OpenLink(Resource, Backend, int(Options["--baud"]), ResourceManager) for Resource in Resources]
+    try:
+        Names = []
+        SNs = []
+        for Resource, Link in zip(Resources, Links):
+            Identity = GPD_4303S_Codec.Identity(Link.query("*IDN?"))
+            SNs.append(Identity["SN"] if Identity is not None else None) # Unknown SN, a reconnect cannot check it is the same supply
+            Names.append(Identity["SN"] if Identity is not None else Resource)
+        Rows = MergedLog(Arguments[0], Links, Names, float(Options["--interval"]), Options["--mode"], float(Options["--duration"]) if Options["--duration"] else None, SNs)
+        print(f"{Rows} rows written to {Arguments[0]}")
+    finally:
+        for Link in Links:
+            Link.close()
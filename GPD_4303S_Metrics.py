@@ -0,0 +1,80 @@
+"""
+Name: GPD_4303S_Metrics.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Optional local HTTP endpoint serving the GPD-X303S GUI's latest readings, state and internal counters in the Prometheus text format, built from what the GUI already holds so a scrape never sends anything to the power supply
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+Port = 9105 # Default port for "--metrics"
+ContentType = "text/plain; version=0.0.4; charset=utf-8"
+
+def Escape(Text): # Label values are quoted, backslashes, quotes and newlines escaped
+    return str(Text).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def Value(Number): # Prometheus spelling of a float, NaN and infinities included
+    Number = float(Number)
+    if(Number != Number):
+        return "NaN"
+    if(Number in (float("inf"), float("-inf"))):
+        return "+Inf" if Number > 0 else "-Inf"
+    return repr(Number)
+
+def Metric(Lines, Name, Help, Kind, Samples): # Append one metric family, Samples is a list of (label dictionary, value)
+    Lines.append(f"# HELP {Name} {Help}")
+    Lines.append(f"# TYPE {Name} {Kind}")
+    for Labels, Number in Samples:
+        Label = "{" + ",".join(f'{Key}="{Escape(Text)}"' for Key, Text in Labels.items()) + "}" if Labels else ""
+        Lines.append(f"{Name}{Label} {Value(Number)}")
+
+def Render(SN, Sample, PSstate, Counters, Latency): # Exposition text, Counters is a list of (name, help, value) and Latency the link's per command [count, total, max]
+    Lines = []
+    Identity = {"sn": SN}
+    if(Sample is not None):
+        Metric(Lines, "gpd_voltage_volts", "Latest measured output voltage", "gauge", [(dict(Identity, channel=str(i + 1)), Volts) for i, Volts in enumerate(Sample["Voltages"])])
+        Metric(Lines, "gpd_current_amps", "Latest measured output current", "gauge", [(dict(Identity, channel=str(i + 1)), Amps) for i, Amps in enumerate(Sample["Currents"])])
+        Metric(Lines, "gpd_sample_timestamp_seconds", "Wall clock time of the latest sample", "gauge", [(Identity, Sample["Wall"])])
+    Metric(Lines, "gpd_output_on", "Output state (1 on, 0 off)", "gauge", [(Identity, 1 if PSstate.get("Output") == "ON" else 0)])
+    Metric(Lines, "gpd_constant_voltage", "CH1/CH2 regulation mode (1 CV, 0 CC)", "gauge",
+           [(dict(Identity, channel=Channel), 1 if PSstate.get(Key) == "CV" else 0) for Channel, Key in (("1", "C1CCCV"), ("2", "C2CCCV")) if Key in PSstate])
+    for Name, Help, Number in Counters:
+        Metric(Lines, Name, Help, "gauge" if Name.endswith("_depth") else "counter", [(Identity, Number)])
+    Latency = sorted(dict(Latency).items()) # Snapshot, the link may add a command while this runs
+    Metric(Lines, "gpd_command_latency_seconds", "Write to reply time of each query", "summary", [])
+    for Command, (Count, Total, Slowest) in Latency:
+        Lines.append(f'gpd_command_latency_seconds_count{{sn="{Escape(SN)}",command="{Escape(Command)}"}} {Count}')
+        Lines.append(f'gpd_command_latency_seconds_sum{{sn="{Escape(SN)}",command="{Escape(Command)}"}} {Value(Total)}')
+    Metric(Lines, "gpd_command_latency_max_seconds", "Slowest reply of each query", "gauge", [(dict(Identity, command=Command), Slowest) for Command, (Count, Total, Slowest) in Latency])
+    return "\n".join(Lines) + "\n"
+
+class MetricsServer(): # Serves Source() at /metrics from a background thread
+    def __init__(self, Source, Port=Port, Host="127.0.0.1"):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if(self.path.split("?")[0] != "/metrics"):
+                    self.send_error(404)
+                    return
+                try:
+                    Body = Source().encode("utf-8")
+                except Exception as e:
+                    self.send_error(500, str(e))
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", ContentType)
+                self.send_header("Content-Length", str(len(Body)))
+                self.end_headers()
+                self.wfile.write(Body)
+
+            def log_message(self, Format, *Arguments): # Scrapes every few seconds would flood the console
+                pass
+
+        self.Server = ThreadingHTTPServer((Host, Port), Handler)
+        self.Server.daemon_threads = True
+        self.Thread = threading.Thread(target=self.Server.serve_forever, daemon=True)
+        self.Thread.start()
+
+    def Close(self):
+        self.Server.shutdown()
+        self.Server.server_close()
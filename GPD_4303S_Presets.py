@@ -0,0 +1,42 @@
+"""
+Name: GPD_4303S_Presets.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Store an unlimited number of named channel setting presets for the GPD-X303S GUI in a single indexed SQLite file, beyond the 4 memory slots the power supply has built-in
+"""
+
+import sqlite3
+from datetime import datetime
+
+SettingKeys = ["V1", "V2", "V3", "V4", "A1", "A2", "A3", "A4"] # Same keys the GUI uses in ChannelSettings
+
+class PresetLibrary():
+    def __init__(self, Path="GPD_4303S_Presets.db"):
+        self.DB = sqlite3.connect(Path)
+        self.DB.execute("CREATE TABLE IF NOT EXISTS Presets (Name TEXT PRIMARY KEY COLLATE NOCASE, " + ", ".join(Key + " REAL" for Key in SettingKeys) + ", Saved TEXT)") # Primary key doubles as the name index
+        self.DB.commit()
+
+    def Save(self, Name, Settings): # Create or overwrite a preset with the given channel settings
+        Values = [float(Settings[Key]) for Key in SettingKeys]
+        Unknown = [Key for Key, Value in zip(SettingKeys, Values) if Value != Value] # NaN after a malformed readback, SQLite would store it as NULL
+        if(Unknown):
+            raise ValueError("unknown setting " + ", ".join(Unknown) + ", read the setpoints back before saving")
+        self.DB.execute("INSERT OR REPLACE INTO Presets VALUES (?" + ", ?" * len(SettingKeys) + ", ?)", [Name] + Values + [datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
+        self.DB.commit()
+
+    def Load(self, Name): # Return the channel settings of a preset, None if it does not exist, a register stored empty is left out so it is not applied
+        Row = self.DB.execute("SELECT " + ", ".join(SettingKeys) + " FROM Presets WHERE Name = ?", (Name,)).fetchone()
+        if(Row is None):
+            return None
+        return {Key: Value for Key, Value in zip(SettingKeys, Row) if Value is not None}
+
+    def Search(self, Text=""): # Return the preset names containing the text (case insensitive), sorted by name
+        Pattern = "%" + Text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return [Row[0] for Row in self.DB.execute("SELECT Name FROM Presets WHERE Name LIKE ? ESCAPE '\\' ORDER BY Name", (Pattern,))]
+
+    def Delete(self, Name):
+        self.DB.execute("DELETE FROM Presets WHERE Name = ?", (Name,))
+        self.DB.commit()
+
+    def Close(self):
+        self.DB.close()
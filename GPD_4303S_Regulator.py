@@ -0,0 +1,81 @@
+"""
+Name: GPD_4303S_Regulator.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Software constant power (CP) and constant resistance (CR) modes for the GPD-X303S, a dedicated control loop that reads VOUT/IOUT and adjusts VSET to hold the target
+"""
+
+import math
+import time
+from PyQt6.QtCore import QThread, pyqtSignal
+import GPD_4303S_Codec
+import GPD_4303S_Stats
+
+class RegulatorWorker(QThread):
+    Report = pyqtSignal(object) # Loop rate, jitter and regulation error, emitted a few times a second
+    Failed = pyqtSignal(str)
+
+    def __init__(self, Link, Channel, Mode, Target, VMax, Gain=0.5, Interval=0.0, Parent=None):
+        super().__init__(Parent)
+        self.Link = Link # GPD_4303S_Link shared with the GUI and the acquisition worker
+        self.Channel = int(Channel)
+        self.Mode = Mode # "CP" holds V*I at Target watts, "CR" holds V/I at Target ohms
+        self.Target = float(Target)
+        self.VMax = float(VMax) # Setpoint ceiling, the loop never asks for more than this
+        self.Gain = Gain # Fraction of the correction applied each iteration (damping)
+        self.Interval = Interval # Loop period (s), 0 runs as fast as the link allows
+        self.Running = True
+        self.Error = GPD_4303S_Stats.RunningStats() # Regulation error since the last report
+        self.Period = GPD_4303S_Stats.RunningStats() # Loop period since the last report
+
+    def Read(self): # Fastest single channel path, one pipelined VOUT/IOUT pair
+        Replies = self.Link.QueryBatch([f"VOUT{self.Channel}?", f"IOUT{self.Channel}?"])
+        return GPD_4303S_Codec.Reading(Replies[0], "V"), GPD_4303S_Codec.Reading(Replies[1], "A")
+
+    def NextSetpoint(self, Voltage, Current, Setpoint): # Returns (new setpoint, regulation error in target units)
+        if(self.Mode == "CP"):
+            Error = Voltage * Current - self.Target
+            if(Current > 0.0005 and Voltage > 0.0005):
+                Wanted = math.sqrt(self.Target * Voltage / Current) # Voltage that gives the target power into the load resistance just measured
+            else:
+                Wanted = Setpoint + 0.01 # No load current yet, creep up until there is some
+        else:
+            Error = (Voltage / Current - self.Target) if Current > 0.0005 else math.inf
+            Wanted = self.Target * Current if Current > 0.0005 else Setpoint + 0.01 # V = R*I at the current the load draws now
+        New = Setpoint + self.Gain * (Wanted - Setpoint)
+        return min(max(round(New, 3), 0.0), self.VMax), Error
+
+    def run(self):
+        try:
+            self.setPriority(QThread.Priority.TimeCriticalPriority)
+            Setpoint = GPD_4303S_Codec.Reading(self.Link.query(f"VSET{self.Channel}?"), "V")
+            if(Setpoint != Setpoint):
+                raise ValueError("Malformed VSET? reply")
+            Last = time.perf_counter()
+            LastReport = Last
+            while self.Running:
+                Voltage, Current = self.Read()
+                if(Voltage != Voltage or Current != Current): # Malformed reply, skip this iteration rather than steer on it
+                    continue
+                New, Error = self.NextSetpoint(Voltage, Current, Setpoint)
+                if(abs(New - Setpoint) >= 0.001): # Only write when the setpoint really changes
+                    self.Link.write(f"VSET{self.Channel}:{New}", "script")
+                    Setpoint = New
+                if(not math.isinf(Error)):
+                    self.Error.Add(Error)
+                Now = time.perf_counter()
+                self.Period.Add(Now - Last)
+                Last = Now
+                if(Now - LastReport >= 0.5):
+                    self.Report.emit({"Channel": self.Channel, "Mode": self.Mode, "Target": self.Target, "Setpoint": Setpoint,
+                                      "Voltage": Voltage, "Current": Current, "Rate": 1.0 / self.Period.Mean if self.Period.Mean else 0.0,
+                                      "Jitter": self.Period.StdDev(), "ErrorMean": self.Error.Mean, "ErrorRMS": self.Error.RMS()})
+                    self.Error.Reset()
+                    self.Period.Reset()
+                    LastReport = Now
+                if(self.Interval > 0):
+                    Wait = self.Interval - (time.perf_counter() - Now)
+                    if(Wait > 0):
+                        time.sleep(Wait)
+        except Exception as e:
+            self.Failed.emit(str(e))
@@ -0,0 +1,276 @@
+"""
+Name: GPD_4303S_Simulator.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Simulated GPD-4303S that stands in for the power supply as a transport, with configurable fault injection (latency spikes, dropped bytes, corrupted replies, silence, disconnects), and a soak test that runs hours of acquisition on a simulated clock in seconds
+"""
+
+Usage = """
+Usage: python GPD_4303S_Simulator.py HOURS [--interval S] [--faults SPEC] [--seed N]
+- Soak test: HOURS of simulated acquisition through the same link, worker and recovery code the GUI uses, then a report of lost samples, recovery times, bad values and memory growth
+- --interval S   Time between samples (default 1 s)
+- --faults SPEC  Comma separated name=value list, e.g. latency=0.002,spike=0.001,drop=0.0005,corrupt=0.0005,silent=0.0005,disconnect=0.00005
+                 (see FaultSettings for every name, probabilities are per reply except disconnect which is per command)
+- --seed N       Random seed, the same seed and faults reproduce the same run
+- The GUI runs on the simulator with "python GPD_4303S_GUI.py --simulate [SPEC]"
+"""
+
+import collections
+import random
+import sys
+import time
+import tracemalloc
+import GPD_4303S_Transport
+
+class FaultSettings(): # Fault injection settings, everything off by default
+    Names = {"latency": "Latency", "spike": "Spike", "spikes": "SpikeSeconds", "drop": "Drop", "corrupt": "Corrupt", "silent": "Silent",
+             "disconnect": "Disconnect", "disconnects": "DisconnectSeconds"}
+
+    def __init__(self, Latency=0.0, Spike=0.0, SpikeSeconds=0.5, Drop=0.0, Corrupt=0.0, Silent=0.0, Disconnect=0.0, DisconnectSeconds=5.0):
+        self.Latency = Latency # Normal reply latency (s)
+        self.Spike = Spike # Chance a reply is SpikeSeconds late
+        self.SpikeSeconds = SpikeSeconds
+        self.Drop = Drop # Chance one byte goes missing from a reply
+        self.Corrupt = Corrupt # Chance a reply is replaced with line noise
+        self.Silent = Silent # Chance a query is never answered
+        self.Disconnect = Disconnect # Chance the adapter drops on a command, it stays gone for DisconnectSeconds
+        self.DisconnectSeconds = DisconnectSeconds
+
+def ParseFaults(Spec): # "latency=0.002,drop=0.001" -> FaultSettings
+    Result = FaultSettings()
+    for Part in Spec.split(","):
+        if(Part.strip()):
+            Name, Value = Part.split("=")
+            setattr(Result, FaultSettings.Names[Name.strip().lower()], float(Value))
+    return Result
+
+class RealClock(): # Faults take real time, used when the GUI runs on the simulator
+    def Now(self):
+        return time.monotonic()
+
+    def Sleep(self, Seconds):
+        time.sleep(Seconds)
+
+class SimClock(): # Faults only move a counter, hours of operation run in seconds
+    def __init__(self):
+        self.Time = 0.0
+
+    def Now(self):
+        return self.Time
+
+    def Sleep(self, Seconds):
+        self.Time += max(Seconds, 0.0)
+
+class SimulatedSupply(): # State of the simulated power supply, shared by every transport opened to it so it survives a reconnect
+    def __init__(self, Clock=None, SN="SIM000001", Loads=(10.0, 10.0, 10.0, 10.0)):
+        self.Clock = Clock or RealClock()
+        self.SN = SN
+        self.Loads = list(Loads) # Load resistance on each output (ohm)
+        self.Settings = {Key: 0.0 for Key in ["VSET1", "VSET2", "VSET3", "VSET4", "ISET1", "ISET2", "ISET3", "ISET4"]}
+        self.Memory = [dict(self.Settings) for i in range(4)]
+        self.Output = 0
+        self.Track = "01" # STATUS? bits 2-3
+        self.Beep = 1
+        self.DownUntil = None # Set while the adapter is disconnected
+
+    def Down(self):
+        if(self.DownUntil is not None and self.Clock.Now() >= self.DownUntil):
+            self.DownUntil = None
+        return self.DownUntil is not None
+
+    def Outputs(self, Channel): # (V, I, CC) of a channel into its load
+        if(not self.Output):
+            return 0.0, 0.0, False
+        Voltage = self.Settings[f"VSET{Channel}"]
+        Limit = self.Settings[f"ISET{Channel}"]
+        if(Voltage / self.Loads[Channel - 1] > Limit): # Current limited, the voltage folds back
+            return round(Limit * self.Loads[Channel - 1], 3), round(Limit, 3), True
+        return round(Voltage, 3), round(Voltage / self.Loads[Channel - 1], 3), False
+
+    def Apply(self, Command):
+        if(":" in Command):
+            Key, Value = Command.split(":")
+            if(Key in self.Settings):
+                self.Settings[Key] = round(float(Value), 3)
+        elif(Command.startswith("OUT")):
+            self.Output = int(Command[3])
+        elif(Command.startswith("RCL")):
+            self.Settings = dict(self.Memory[int(Command[3]) - 1])
+        elif(Command.startswith("SAV")):
+            self.Memory[int(Command[3]) - 1] = dict(self.Settings)
+        elif(Command.startswith("BEEP")):
+            self.Beep = int(Command[4])
+        elif(Command.startswith("TRACK")):
+            self.Track = {"0": "01", "1": "11", "2": "10"}[Command[5]]
+
+    def Answer(self, Command): # Reply to a query exactly as the power supply frames it
+        if(Command == "STATUS?"):
+            return ("0" if self.Outputs(1)[2] else "1") + ("0" if self.Outputs(2)[2] else "1") + self.Track + str(self.Beep) + str(self.Output) + "00\r\n"
+        if(Command == "*IDN?"):
+            return f"GW INSTEK,GPD-4303S,SN:{self.SN},V1.00\r\n"
+        if(Command[:4] in ("VSET", "ISET")):
+            return f"{self.Settings[Command[:-1]]:.3f}{'V' if Command[0] == 'V' else 'A'}\r\n"
+        if(Command[:4] == "VOUT"):
+            return f"{self.Outputs(int(Command[4]))[0]:.3f}V\r\n"
+        if(Command[:4] == "IOUT"):
+            return f"{self.Outputs(int(Command[4]))[1]:.3f}A\r\n"
+        return "\r\n"
+
+class SimulatedTransport(GPD_4303S_Transport.Transport): # One open "port" to a SimulatedSupply, with faults injected on the way
+    def __init__(self, Supply, Faults=None, Random=None):
+        if(Supply.Down()):
+            raise OSError("Could not open port (simulated adapter unplugged)")
+        self.Supply = Supply
+        self.Faults = Faults or FaultSettings()
+        self.Random = Random or random.Random()
+        self.Timeout = 2.0
+        self.Queue = collections.deque() # Replies waiting to be read, None for a query that will never be answered
+        self.Injected = collections.Counter() # Faults injected through this transport
+
+    def Chance(self, Probability):
+        return Probability > 0 and self.Random.random() < Probability
+
+    def write(self, Command):
+        if(self.Supply.Down()):
+            raise OSError("Device disconnected (simulated)")
+        if(self.Chance(self.Faults.Disconnect)):
+            self.Injected["Disconnect"] += 1
+            self.Supply.DownUntil = self.Supply.Clock.Now() + self.Faults.DisconnectSeconds
+            raise OSError("Device disconnected (simulated)")
+        if(not Command.endswith("?")):
+            self.Supply.Apply(Command)
+            return
+        if(self.Chance(self.Faults.Silent)):
+            self.Injected["Silent"] += 1
+            self.Queue.append(None)
+            return
+        Reply = self.Supply.Answer(Command)
+        if(self.Chance(self.Faults.Drop)):
+            self.Injected["Drop"] += 1
+            i = self.Random.randrange(len(Reply) - 2) # Lose a byte of the reply, the frame still ends
+            Reply = Reply[:i] + Reply[i + 1:]
+        if(self.Chance(self.Faults.Corrupt)):
+            self.Injected["Corrupt"] += 1
+            Reply = "".join(self.Random.choice("0123456789.-VA?#~ ") for i in range(len(Reply) - 2)) + "\r\n"
+        self.Queue.append(Reply)
+
+    def read(self):
+        if(self.Supply.Down()):
+            raise OSError("Device disconnected (simulated)")
+        Reply = self.Queue.popleft() if self.Queue else None
+        Latency = self.Faults.Latency
+        if(self.Chance(self.Faults.Spike)):
+            self.Injected["Spike"] += 1
+            Latency += self.Faults.SpikeSeconds
+        if(Reply is None or Latency > self.Timeout):
+            self.Supply.Clock.Sleep(self.Timeout)
+            raise TimeoutError("Timeout waiting for a reply (simulated)")
+        self.Supply.Clock.Sleep(Latency)
+        return Reply
+
+    def SetTimeout(self, Seconds):
+        self.Timeout = Seconds
+
+    def Flush(self):
+        self.Queue.clear()
+
+    def close(self):
+        self.Queue.clear()
+
+class SimStop(): # Stands in for the worker's StopEvent so its reconnect backoff waits on the simulated clock
+    def __init__(self, Clock):
+        self.Clock = Clock
+
+    def wait(self, Seconds=None):
+        self.Clock.Sleep(Seconds or 0.0)
+        return False
+
+    def is_set(self):
+        return False
+
+def Soak(Hours, Interval=1.0, Faults=None, Seed=None): # Hours of acquisition on a simulated clock, returns the report dictionary
+    import GPD_4303S_Acquisition
+    import GPD_4303S_Alarms
+    import GPD_4303S_History
+    import GPD_4303S_Link
+    import GPD_4303S_Stats
+    Clock = SimClock()
+    Random = random.Random(Seed)
+    Supply = SimulatedSupply(Clock)
+    Transports = []
+    def Opener():
+        Transports.append(SimulatedTransport(Supply, Faults, Random))
+        return Transports[-1]
+    Link = GPD_4303S_Link.GPD_4303S_Link(Opener(), Opener)
+    for Command in ["VSET1:5", "VSET2:12", "VSET3:3.3", "VSET4:1.8", "ISET1:1", "ISET2:1", "ISET3:0.2", "ISET4:0.1", "OUT1"]: # ISET3/4 put CH3 and CH4 in CC
+        Supply.Apply(Command)
+    Worker = GPD_4303S_Acquisition.AcquisitionWorker(Link, GPD_4303S_Alarms.AlarmLimits())
+    Worker.StopEvent = SimStop(Clock)
+    Worker.SN = Supply.SN
+    Stats = GPD_4303S_Stats.StatsEngine()
+    History = GPD_4303S_History.TieredHistory()
+    Truth = [Supply.Outputs(Channel)[0] for Channel in range(1, 5)] + [Supply.Outputs(Channel)[1] for Channel in range(1, 5)]
+    Report = {"Recorded": 0, "BadValues": 0, "Outages": [], "Errors": collections.Counter()}
+    tracemalloc.start()
+    Memory = [] # Traced memory at every simulated hour
+    Start = time.perf_counter()
+    End = Hours * 3600.0
+    NextTime = 0.0
+    while NextTime < End - Interval * 0.5: # Half an interval of slack so float rounding never adds a sample
+        Clock.Time = max(Clock.Time, NextTime)
+        try:
+            Sample = Worker.Measure()
+        except Exception as e:
+            Report["Errors"][type(e).__name__] += 1
+            Lost = Clock.Now()
+            Worker.Recover(str(e))
+            Report["Outages"].append(Clock.Now() - Lost)
+            NextTime = Clock.Now() # Back on schedule from the moment the link returned, samples due meanwhile are lost
+            continue
+        Report["Recorded"] += 1
+        Values = Sample["Voltages"] + Sample["Currents"]
+        if(any(abs(Value - Expected) > 0.0005 for Value, Expected in zip(Values, Truth))): # Parsed without error but wrong, e.g. a dropped digit
+            Report["BadValues"] += 1
+        Stats.Add(Clock.Now(), Sample["Voltages"], Sample["Currents"])
+        History.Add(Clock.Now(), Values)
+        if(Clock.Now() >= len(Memory) * 3600.0):
+            Memory.append(tracemalloc.get_traced_memory()[0])
+        NextTime += Interval
+    Report["Memory"] = Memory
+    tracemalloc.stop()
+    Report["Expected"] = int(round(End / Interval)) # Samples a perfect link would have delivered
+    Report["Lost"] = Report["Expected"] - Report["Recorded"]
+    Report["Injected"] = sum((Transport.Injected for Transport in Transports), collections.Counter())
+    Report["Elapsed"] = time.perf_counter() - Start
+    return Report
+
+def Describe(Report, Hours):
+    Outages = Report["Outages"]
+    Lines = [f"{Hours:g} h simulated in {Report['Elapsed']:.1f} s",
+             f"Samples: {Report['Recorded']} of {Report['Expected']} recorded, {Report['Lost']} lost ({100.0 * Report['Lost'] / max(Report['Expected'], 1):.3f} %)",
+             f"Bad values accepted: {Report['BadValues']}",
+             "Faults injected: " + (", ".join(f"{Name} {Count}" for Name, Count in sorted(Report["Injected"].items())) or "none"),
+             "Errors seen: " + (", ".join(f"{Name} {Count}" for Name, Count in sorted(Report["Errors"].items())) or "none")]
+    if(Outages):
+        Lines.append(f"Recoveries: {len(Outages)}, mean {sum(Outages) / len(Outages):.2f} s, max {max(Outages):.2f} s")
+    Memory = Report["Memory"]
+    if(len(Memory) > 2):
+        Half = len(Memory) // 2 # Growth is taken over the second half, the history tiers are still filling early on (the 1 s tier holds 6 h)
+        Lines.append(f"Memory: {Memory[1] / 1024:.0f} KiB after 1 h, {Memory[-1] / 1024:.0f} KiB at the end, "
+                     f"{(Memory[-1] - Memory[Half]) / 1024 / (len(Memory) - 1 - Half):.1f} KiB/h growth over the last {len(Memory) - 1 - Half} h")
+    return Lines
+
+if __name__=="__main__": # Command line front end, see the usage notes at the top
+    Arguments = sys.argv[1:]
+    Options = {"--interval": "1", "--faults": "", "--seed": None}
+    for Option in Options:
+        if(Option in Arguments):
+            i = Arguments.index(Option)
+            Options[Option] = Arguments[i + 1]
+            del Arguments[i:i + 2]
+    if(len(Arguments) != 1):
+        print(Usage)
+        sys.exit(1)
+    Hours = float(Arguments[0])
+    Report = Soak(Hours, float(Options["--interval"]), ParseFaults(Options["--faults"]), None if Options["--seed"] is None else int(Options["--seed"]))
+    print("\n".join(Describe(Report, Hours)))
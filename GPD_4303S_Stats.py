@@ -0,0 +1,129 @@
+"""
+Name: GPD_4303S_Stats.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Online per-channel statistics (mean, min, max, standard deviation, RMS) and delivered energy for the GPD-X303S GUI, updated one sample at a time so the cost never grows with the length of a run
+"""
+
+import math
+
+class RunningStats():
+    def __init__(self):
+        self.Reset()
+
+    def Reset(self):
+        self.Count = 0
+        self.Mean = 0.0
+        self.M2 = 0.0 # Sum of squared differences from the mean (Welford)
+        self.Min = math.inf
+        self.Max = -math.inf
+
+    def Add(self, Value): # Welford's update, numerically stable for long runs
+        self.Count += 1
+        Delta = Value - self.Mean
+        self.Mean += Delta / self.Count
+        self.M2 += Delta * (Value - self.Mean)
+        if(Value < self.Min):
+            self.Min = Value
+        if(Value > self.Max):
+            self.Max = Value
+
+    def StdDev(self): # Population standard deviation
+        return math.sqrt(self.M2 / self.Count) if self.Count else 0.0
+
+    def RMS(self): # Mean of the squares is the variance plus the squared mean
+        return math.sqrt(self.M2 / self.Count + self.Mean * self.Mean) if self.Count else 0.0
+
+    def State(self): # Accumulators as a list for a checkpoint
+        return [self.Count, self.Mean, self.M2, self.Min, self.Max]
+
+    def Restore(self, State):
+        self.Count, self.Mean, self.M2, self.Min, self.Max = State
+
+class ChannelStats():
+    def __init__(self):
+        self.Voltage = RunningStats()
+        self.Current = RunningStats()
+        self.Reset()
+
+    def Reset(self):
+        self.Voltage.Reset()
+        self.Current.Reset()
+        self.EnergyWh = 0.0
+        self.LastTime = None
+        self.LastPower = 0.0
+
+    def Add(self, Time, Voltage, Current): # Time is in seconds from a monotonic clock, a reading that was not polled is NaN
+        if(not math.isnan(Voltage)):
+            self.Voltage.Add(Voltage)
+        if(not math.isnan(Current)):
+            self.Current.Add(Current)
+        Power = Voltage * Current
+        if(math.isnan(Power)): # Energy needs both readings
+            return
+        if(self.LastTime is not None and Time > self.LastTime):
+            self.EnergyWh += (Power + self.LastPower) * 0.5 * (Time - self.LastTime) / 3600.0 # Trapezoid between this sample and the last one
+        self.LastTime = Time
+        self.LastPower = Power
+
+class StatsEngine():
+    def __init__(self, Channels=4):
+        self.Channels = [ChannelStats() for i in range(Channels)]
+        self.StartTime = None
+        self.LastTime = None
+        self.Carried = 0.0 # Duration of the run before a resume, the monotonic clock starts over in a new process
+
+    def Reset(self):
+        for Channel in self.Channels:
+            Channel.Reset()
+        self.StartTime = None
+        self.LastTime = None
+        self.Carried = 0.0
+
+    def Add(self, Time, Voltages, Currents): # Feed one acquisition sample, Voltages/Currents are indexed by channel (NaN readings are skipped)
+        if(self.StartTime is None):
+            self.StartTime = Time
+        self.LastTime = Time
+        for Channel, Voltage, Current in zip(self.Channels, Voltages, Currents):
+            Channel.Add(Time, Voltage, Current)
+
+    def Break(self): # Gap in the samples (link lost), energy is not integrated across it
+        for Channel in self.Channels:
+            Channel.LastTime = None
+
+    def Samples(self): # Most readings taken on any channel, channels that are not polled stay at 0
+        return max(max(Channel.Voltage.Count, Channel.Current.Count) for Channel in self.Channels)
+
+    def Duration(self):
+        return self.Carried + ((self.LastTime - self.StartTime) if self.StartTime is not None else 0.0)
+
+    def State(self): # Everything needed to carry the run on in another process, JSON friendly
+        return {"Duration": self.Duration(), "Channels": [[Channel.Voltage.State(), Channel.Current.State(), Channel.EnergyWh] for Channel in self.Channels]}
+
+    def Restore(self, State): # Pick up a run from State, energy is not integrated across the gap
+        self.Reset()
+        self.Carried = State["Duration"]
+        for Channel, (Voltage, Current, EnergyWh) in zip(self.Channels, State["Channels"]):
+            Channel.Voltage.Restore(Voltage)
+            Channel.Current.Restore(Current)
+            Channel.EnergyWh = EnergyWh
+
+    def Summary(self): # Human readable summary, one line per channel
+        Lines = [f"Samples: {self.Samples()}  Duration: {self.Duration():.1f} s"]
+        for i, Channel in enumerate(self.Channels):
+            V = Channel.Voltage
+            A = Channel.Current
+            Lines.append(f"CH{i + 1}: V mean {V.Mean:.3f} min {V.Min if V.Count else 0:.3f} max {V.Max if V.Count else 0:.3f} rms {V.RMS():.3f} sd {V.StdDev():.4f} | "
+                         f"A mean {A.Mean:.3f} min {A.Min if A.Count else 0:.3f} max {A.Max if A.Count else 0:.3f} rms {A.RMS():.3f} sd {A.StdDev():.4f} | {Channel.EnergyWh:.6f} Wh")
+        return Lines
+
+    def FooterRows(self): # Rows to append to the CSV log at the end of a run, prefixed with "#" so they read as comments
+        Rows = [["# Stats", "Channel", "Samples", "V Mean", "V Min", "V Max", "V RMS", "V StdDev", "A Mean", "A Min", "A Max", "A RMS", "A StdDev", "Energy (Wh)", "Duration (s)"]]
+        for i, Channel in enumerate(self.Channels):
+            V = Channel.Voltage
+            A = Channel.Current
+            if(V.Count == 0 and A.Count == 0):
+                continue
+            Rows.append(["# Stats", f"CH{i + 1}", max(V.Count, A.Count), f"{V.Mean:.4f}", f"{V.Min:.3f}", f"{V.Max:.3f}", f"{V.RMS():.4f}", f"{V.StdDev():.4f}",
+                         f"{A.Mean:.4f}", f"{A.Min:.3f}", f"{A.Max:.3f}", f"{A.RMS():.4f}", f"{A.StdDev():.4f}", f"{Channel.EnergyWh:.6f}", f"{self.Duration():.3f}"])
+        return Rows
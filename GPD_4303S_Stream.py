@@ -0,0 +1,177 @@
+"""
+Name: GPD_4303S_Stream.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Optional local WebSocket server pushing each GPD-X303S acquisition sample to browser dashboards, every sample is encoded once and queued to each client with its own decimation and a bounded queue, so a slow client loses frames instead of holding up acquisition
+"""
+
+import base64
+import collections
+import hashlib
+import json
+import socket
+import socketserver
+import struct
+import threading
+from urllib.parse import parse_qs, urlparse
+
+Port = 9106 # Default port for "--stream"
+Depth = 64 # Frames a client can fall behind before the oldest are dropped
+GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11" # RFC 6455 handshake constant
+Binary = struct.Struct("<d8f") # Wall clock time, V1-V4, I1-I4 (NaN when not polled), 40 bytes a frame
+
+def Frame(Opcode, Payload): # Unmasked server frame
+    Length = len(Payload)
+    if(Length < 126):
+        Header = struct.pack("!BB", 0x80 | Opcode, Length)
+    elif(Length < 65536):
+        Header = struct.pack("!BBH", 0x80 | Opcode, 126, Length)
+    else:
+        Header = struct.pack("!BBQ", 0x80 | Opcode, 127, Length)
+    return Header + Payload
+
+def Encode(Sample, Format): # One frame for every client that wants Format ("json" or "binary")
+    if(Format == "binary"):
+        return Frame(0x2, Binary.pack(Sample["Wall"], *(Sample["Voltages"] + Sample["Currents"])))
+    Clean = lambda Values: [None if Value != Value else Value for Value in Values] # NaN is not valid JSON for a browser
+    return Frame(0x1, json.dumps({"t": Sample["Wall"], "stamp": Sample["Stamp"], "v": Clean(Sample["Voltages"]), "i": Clean(Sample["Currents"]),
+                                  "status": Sample["Status"]}, separators=(",", ":")).encode("utf-8"))
+
+class StreamClient():
+    def __init__(self, Socket, Every=1, Format="json"):
+        self.Socket = Socket
+        self.Every = max(1, Every) # Send every Nth sample
+        self.Format = Format
+        self.Seen = 0
+        self.Dropped = 0 # Frames lost because the client could not keep up
+        self.Frames = collections.deque(maxlen=Depth)
+        self.Ready = threading.Condition()
+        self.SendLock = threading.Lock() # Pong/close from the reader thread and frames from the sender thread
+        self.Open = True
+
+    def Offer(self, Frames): # Called on the publishing thread, never blocks on the socket
+        self.Seen += 1
+        if(self.Seen % self.Every):
+            return
+        with self.Ready:
+            if(len(self.Frames) == Depth):
+                self.Dropped += 1 # The deque drops its oldest frame
+            self.Frames.append(Frames[self.Format])
+            self.Ready.notify()
+
+    def Send(self, Data):
+        with self.SendLock:
+            self.Socket.sendall(Data)
+
+    def Close(self):
+        with self.Ready:
+            self.Open = False
+            self.Ready.notify()
+
+    def Receive(self): # Read client frames until it closes: answers pings and takes {"every": N} to change the decimation
+        Buffer = self.Socket.makefile("rb")
+        while self.Open:
+            Head = Buffer.read(2)
+            if(len(Head) < 2):
+                break
+            Opcode = Head[0] & 0x0F
+            Length = Head[1] & 0x7F
+            if(Length == 126):
+                Length = struct.unpack("!H", Buffer.read(2))[0]
+            elif(Length == 127):
+                Length = struct.unpack("!Q", Buffer.read(8))[0]
+            Mask = Buffer.read(4) if Head[1] & 0x80 else b"\0\0\0\0"
+            Payload = bytes(Byte ^ Mask[i % 4] for i, Byte in enumerate(Buffer.read(Length)))
+            if(Opcode == 0x8): # Close, echo it back
+                self.Send(Frame(0x8, Payload[:2]))
+                break
+            if(Opcode == 0x9):
+                self.Send(Frame(0xA, Payload))
+            elif(Opcode == 0x1):
+                try:
+                    self.Every = max(1, int(json.loads(Payload)["every"]))
+                except (ValueError, KeyError, TypeError):
+                    pass
+        self.Close()
+
+class StreamServer(): # Serves ws://Host:Port/?every=N&format=json|binary
+    def __init__(self, Port=Port, Host="127.0.0.1"):
+        self.Clients = []
+        self.Lock = threading.Lock()
+        Server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                Request = self.rfile.readline(4096).decode("latin-1").split()
+                Headers = {}
+                while True:
+                    Line = self.rfile.readline(4096).decode("latin-1").strip()
+                    if(not Line):
+                        break
+                    Key, _, Text = Line.partition(":")
+                    Headers[Key.strip().lower()] = Text.strip()
+                if(len(Request) < 2 or Headers.get("upgrade", "").lower() != "websocket" or "sec-websocket-key" not in Headers):
+                    self.wfile.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+                    return
+                Query = parse_qs(urlparse(Request[1]).query)
+                try:
+                    Every = int(Query.get("every", ["1"])[0])
+                except ValueError:
+                    Every = 1
+                Format = "binary" if Query.get("format", ["json"])[0] == "binary" else "json"
+                Accept = base64.b64encode(hashlib.sha1((Headers["sec-websocket-key"] + GUID).encode("ascii")).digest()).decode("ascii")
+                self.wfile.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                                  f"Sec-WebSocket-Accept: {Accept}\r\n\r\n").encode("ascii"))
+                self.wfile.flush()
+                Client = StreamClient(self.request, Every, Format)
+                Server.Add(Client)
+                Reader = threading.Thread(target=Client.Receive, daemon=True)
+                Reader.start()
+                try:
+                    while True:
+                        with Client.Ready:
+                            while Client.Open and not Client.Frames:
+                                Client.Ready.wait()
+                            if(not Client.Open):
+                                break
+                            Data = Client.Frames.popleft()
+                        Client.Send(Data) # Only this client's thread waits on a slow socket
+                except OSError:
+                    pass
+                finally:
+                    Client.Close()
+                    Server.Remove(Client)
+
+        self.Server = socketserver.ThreadingTCPServer((Host, Port), Handler, bind_and_activate=False)
+        self.Server.daemon_threads = True
+        self.Server.allow_reuse_address = True
+        self.Server.server_bind()
+        self.Server.server_activate()
+        self.Thread = threading.Thread(target=self.Server.serve_forever, daemon=True)
+        self.Thread.start()
+
+    def Add(self, Client):
+        with self.Lock:
+            self.Clients = self.Clients + [Client] # Replaced, not changed, so Publish can walk it without the lock
+
+    def Remove(self, Client):
+        with self.Lock:
+            self.Clients = [Other for Other in self.Clients if Other is not Client]
+
+    def Publish(self, Sample): # Encode the sample once per format in use and queue it to every client
+        Clients = self.Clients
+        if(not Clients):
+            return
+        Frames = {Format: Encode(Sample, Format) for Format in set(Client.Format for Client in Clients)}
+        for Client in Clients:
+            Client.Offer(Frames)
+
+    def Close(self):
+        self.Server.shutdown()
+        for Client in self.Clients:
+            Client.Close()
+            try:
+                Client.Socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.Server.server_close()
@@ -0,0 +1,191 @@
+"""
+Name: GPD_4303S_Sweep.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: IV-curve / load-line sweep and step-response workers for the GPD-X303S GUI, step a channel's voltage setpoint and record its output voltage and current with as few transactions as possible
+"""
+
+import csv
+import math
+import time
+from datetime import datetime
+import numpy as np
+from PyQt6.QtCore import QThread, pyqtSignal
+import GPD_4303S_Codec
+
+class SweepWorker(QThread):
+    PointReady = pyqtSignal(int, float, float, float) # Index, setpoint, voltage, current of each settled point
+    Finished = pyqtSignal(object) # (N, 5) array of setpoint, voltage, current, settle time, settled flag
+    Failed = pyqtSignal(str)
+
+    def __init__(self, Link, Channel, Start, Stop, Step, Dwell=0.0, Tolerance=0.002, Timeout=5.0, First=0, Original=None, Parent=None):
+        super().__init__(Parent)
+        self.Link = Link # GPD_4303S_Link shared with the GUI
+        self.Channel = int(Channel)
+        self.Arguments = [Start, Stop, Step, Dwell] # Kept for the session checkpoint
+        self.Next = First # Index of the point being stepped to, a resumed sweep starts part way through
+        self.Original = Original # Setpoint to put back afterwards, read at the start unless a resumed sweep already knows it
+        Count = int(math.floor(abs(Stop - Start) / abs(Step) + 1e-9)) + 1 if Step else 1 # Never steps past Stop when Step does not divide the span
+        self.Setpoints = np.clip(np.round(Start + np.arange(Count) * (abs(Step) if Stop >= Start else -abs(Step)), 3), min(Start, Stop), max(Start, Stop))
+        self.Dwell = Dwell # Minimum time at each point before a reading can count as settled (s)
+        self.Tolerance = Tolerance # Two consecutive readings this close (V and A) count as settled
+        self.Timeout = Timeout # Longest wait for a point to settle, the point is kept and flagged if it runs out
+        self.Results = np.full((Count, 5), np.nan)
+        self.Cancelled = False
+
+    def Read(self): # One pipelined voltage/current pair, only for the swept channel
+        Replies = self.Link.QueryBatch([f"VOUT{self.Channel}?", f"IOUT{self.Channel}?"])
+        return GPD_4303S_Codec.Reading(Replies[0], "V"), GPD_4303S_Codec.Reading(Replies[1], "A") # NaN never counts as settled
+
+    def Settle(self): # Poll until the readback stops moving (not a fixed sleep), returns (V, I, time taken, settled)
+        Start = time.monotonic()
+        Last = self.Read()
+        while not self.Cancelled:
+            Reading = self.Read()
+            Elapsed = time.monotonic() - Start
+            if(Elapsed >= self.Dwell and abs(Reading[0] - Last[0]) <= self.Tolerance and abs(Reading[1] - Last[1]) <= self.Tolerance):
+                return Reading[0], Reading[1], Elapsed, True
+            if(Elapsed >= self.Timeout):
+                return Reading[0], Reading[1], Elapsed, False
+            Last = Reading
+        return Last[0], Last[1], time.monotonic() - Start, False
+
+    def run(self):
+        try:
+            if(self.Original is None):
+                self.Original = GPD_4303S_Codec.Reading(self.Link.query(f"VSET{self.Channel}?"), "V") # Put the setpoint back afterwards
+            Original = self.Original
+            if(Original != Original):
+                raise ValueError("Malformed VSET? reply")
+            for i in range(self.Next, len(self.Setpoints)):
+                if(self.Cancelled):
+                    break
+                Setpoint = self.Setpoints[i]
+                self.Next = i
+                self.Link.write(f"VSET{self.Channel}:{Setpoint}", "script") # One write per point
+                Voltage, Current, Elapsed, Settled = self.Settle()
+                self.Results[i] = (Setpoint, Voltage, Current, Elapsed, Settled)
+                self.PointReady.emit(i, float(Setpoint), Voltage, Current)
+            self.Link.write(f"VSET{self.Channel}:{Original}", "script")
+            self.Finished.emit(self.Results[~np.isnan(self.Results[:, 0])])
+        except Exception as e:
+            self.Failed.emit(str(e))
+
+class StepResponseWorker(QThread):
+    Finished = pyqtSignal(object) # Dictionary of the samples and the step metrics
+    Failed = pyqtSignal(str)
+    Tripped = pyqtSignal(object) # Emitted after an alarm limit crossed during the capture has already turned the output off
+
+    def __init__(self, Link, Channel, Target, Tolerance=0.01, Hold=0.2, Timeout=5.0, Acquisition=None, Parent=None):
+        super().__init__(Parent)
+        self.Link = Link # GPD_4303S_Link, the GUI suspends acquisition so this worker has the link to itself
+        self.Acquisition = Acquisition # Suspended GPD_4303S_Acquisition.AcquisitionWorker, its alarm limits and cut-off are applied to every captured sample
+        self.Channel = int(Channel)
+        self.Target = round(float(Target), 3)
+        self.Tolerance = Tolerance # Band around the target the reading has to stay in (V)
+        self.Hold = Hold # How long the reading has to stay in the band before the capture stops (s)
+        self.Timeout = Timeout
+
+    def Guard(self, Begin, Done, Voltage, Current): # Check one captured sample against the alarm limits, cuts the output and returns True when one is crossed
+        if(self.Acquisition is None):
+            return False
+        Voltages = [GPD_4303S_Codec.NaN] * 4 # The other channels are not read during the capture
+        Currents = [GPD_4303S_Codec.NaN] * 4
+        Voltages[self.Channel - 1] = Voltage
+        Currents[self.Channel - 1] = Current
+        Violations = self.Acquisition.Alarms.Check(Voltages, Currents)
+        if(not Violations):
+            return False
+        Sample = {"Time": Done, "Start": Begin, "Stamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3], "Voltages": Voltages, "Currents": Currents}
+        self.Tripped.emit(self.Acquisition.Trip(Sample, Violations)) # Same cut-off and event log as a trip during normal acquisition
+        return True
+
+    def run(self):
+        try:
+            Commands = [f"VOUT{self.Channel}?", f"IOUT{self.Channel}?"]
+            Begin = time.monotonic()
+            Replies = self.Link.QueryBatch(Commands)
+            Initial = GPD_4303S_Codec.Reading(Replies[0], "V")
+            if(self.Guard(Begin, time.monotonic(), Initial, GPD_4303S_Codec.Reading(Replies[1], "A"))):
+                return
+            if(Initial != Initial):
+                raise ValueError("Malformed VOUT? reply")
+            Times = [0.0]
+            Voltages = [Initial]
+            Currents = [GPD_4303S_Codec.Reading(Replies[1], "A")]
+            self.Link.write(f"VSET{self.Channel}:{self.Target}", "script")
+            Start = time.perf_counter() # High resolution monotonic clock, the step is time zero
+            InBand = None
+            while True:
+                Begin = time.monotonic()
+                Replies = self.Link.QueryBatch(Commands) # Only this channel, back to back
+                Now = time.perf_counter() - Start
+                Voltage = GPD_4303S_Codec.Reading(Replies[0], "V") # A malformed reply is NaN, outside the band
+                Times.append(Now)
+                Voltages.append(Voltage)
+                Currents.append(GPD_4303S_Codec.Reading(Replies[1], "A"))
+                if(self.Guard(Begin, time.monotonic(), Voltage, Currents[-1])):
+                    return
+                if(abs(Voltage - self.Target) <= self.Tolerance):
+                    InBand = Now if InBand is None else InBand
+                    if(Now - InBand >= self.Hold):
+                        break
+                else:
+                    InBand = None
+                if(Now >= self.Timeout):
+                    break
+            Result = StepMetrics(np.array(Times), np.array(Voltages), Initial, self.Target, self.Tolerance)
+            Result["Currents"] = np.array(Currents)
+            Result["Channel"] = self.Channel
+            self.Finished.emit(Result)
+        except Exception as e:
+            self.Failed.emit(str(e))
+
+def StepMetrics(Times, Voltages, Initial, Target, Tolerance): # Rise time (10-90 %), overshoot and settling time of one captured step
+    Result = {"Times": Times, "Voltages": Voltages, "Initial": Initial, "Target": Target, "Samples": len(Times),
+              "Rate": (len(Times) - 1) / Times[-1] if Times[-1] > 0 else 0.0, "RiseTime": np.nan, "Overshoot": 0.0, "SettlingTime": np.nan}
+    Step = Target - Initial
+    if(Step == 0):
+        return Result
+    Progress = (Voltages - Initial) / Step # 0 before the step, 1 at the target, whichever way the step goes
+    Ten = np.flatnonzero(Progress >= 0.1)
+    Ninety = np.flatnonzero(Progress >= 0.9)
+    if(len(Ten) and len(Ninety)):
+        Result["RiseTime"] = Times[Ninety[0]] - Times[Ten[0]]
+    Result["Overshoot"] = max(0.0, float(Progress.max()) - 1.0) * 100.0 # Percent of the step
+    Outside = np.flatnonzero(np.abs(Voltages - Target) > Tolerance)
+    if(len(Outside) == 0):
+        Result["SettlingTime"] = 0.0
+    elif(Outside[-1] + 1 < len(Times)): # Settled at the first sample after the last one outside the band
+        Result["SettlingTime"] = Times[Outside[-1] + 1]
+    return Result
+
+def ExportStep(Path, Result): # Write a step response capture with its metrics as a comment header
+    with open(Path, mode='w', newline='') as step_file:
+        csv_writer = csv.writer(step_file)
+        csv_writer.writerow(["# Step", f"CH{Result['Channel']}", f"{Result['Initial']:.3f} V -> {Result['Target']:.3f} V", f"Rise {Result['RiseTime']:.4f} s",
+                             f"Overshoot {Result['Overshoot']:.2f} %", f"Settling {Result['SettlingTime']:.4f} s", f"{Result['Rate']:.1f} samples/s"])
+        csv_writer.writerow(["Time (s)", f"VOUT{Result['Channel']}", f"IOUT{Result['Channel']}"])
+        for Time, Voltage, Current in zip(Result["Times"], Result["Voltages"], Result["Currents"]):
+            csv_writer.writerow([f"{Time:.6f}", f"{Voltage:.3f}", f"{Current:.3f}"])
+
+def Export(Path, Channel, Results): # Write the sweep to CSV
+    with open(Path, mode='w', newline='') as sweep_file:
+        csv_writer = csv.writer(sweep_file)
+        csv_writer.writerow([f"VSET{Channel}", f"VOUT{Channel}", f"IOUT{Channel}", "Settle Time (s)", "Settled"])
+        for Setpoint, Voltage, Current, Elapsed, Settled in Results:
+            csv_writer.writerow([f"{Setpoint:.3f}", f"{Voltage:.3f}", f"{Current:.3f}", f"{Elapsed:.4f}", int(Settled)])
+
+def Plot(Channel, Results, Title="IV Sweep"): # Plot current against voltage, matplotlib is optional
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return False
+    Figure, Axis = plt.subplots()
+    Axis.plot(Results[:, 1], Results[:, 2], marker=".")
+    Axis.set_xlabel(f"VOUT{Channel} (V)")
+    Axis.set_ylabel(f"IOUT{Channel} (A)")
+    Axis.set_title(Title)
+    Axis.grid(True)
+    Figure.show()
+    return True
@@ -0,0 +1,192 @@
+"""
+Name: GPD_4303S_Trace.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Record every command and reply on the GPD-X303S link with its timing into a compact binary trace, and replay a trace as a transport (at the recorded link speed or as fast as possible) to reproduce field problems and profile the software without hardware
+"""
+
+Usage = """
+Usage: python GPD_4303S_Trace.py TRACE [--bench N]
+- Prints the records, duration and per-command reply latency of a trace (recorded with "python GPD_4303S_GUI.py --record TRACE")
+- --bench N  Replays the acquisition traffic of the trace N samples as fast as possible and reports the samples/s the software reaches
+- The GUI replays a trace with "python GPD_4303S_GUI.py --replay TRACE" (add --realtime to keep the recorded reply latency)
+"""
+
+import collections
+import statistics
+import struct
+import sys
+import time
+import GPD_4303S_Transport
+
+Magic = b"GPDT"
+Header = struct.Struct("<Hd") # Version, wall clock time the recording started
+Entry = struct.Struct("<BIH") # Kind, microseconds since the previous record, payload length, followed by the payload (7 bytes overhead a record)
+Version = 1
+Write = 0 # Command sent
+Reply = 1 # Reply read
+Error = 2 # Read that failed (timeout, dropped adapter), the payload is the error
+
+class TraceWriter(): # Shared by every RecordingTransport of a session so a reconnect carries on in the same trace
+    def __init__(self, Path):
+        self.File = open(Path, "wb")
+        self.File.write(Magic + Header.pack(Version, time.time()))
+        self.Last = time.perf_counter()
+
+    def Add(self, Kind, Text):
+        Data = Text.encode("ascii", "replace")[:0xFFFF]
+        Delta = min(int((time.perf_counter() - self.Last) * 1e6), 0xFFFFFFFF)
+        self.Last += Delta / 1e6 # Advance by what was stored so rounding never builds up over a long trace
+        self.File.write(Entry.pack(Kind, Delta, len(Data)) + Data)
+
+    def Flush(self):
+        self.File.flush()
+
+    def Close(self):
+        self.File.close()
+
+class RecordingTransport(GPD_4303S_Transport.Transport): # Wraps the real transport and records what goes through it
+    def __init__(self, Inner, Writer):
+        self.Inner = Inner
+        self.Writer = Writer
+
+    def write(self, Command):
+        self.Writer.Add(Write, Command)
+        self.Inner.write(Command)
+
+    def read(self):
+        try:
+            Text = self.Inner.read()
+        except Exception as e:
+            self.Writer.Add(Error, str(e))
+            raise
+        self.Writer.Add(Reply, Text)
+        return Text
+
+    def query(self, Command):
+        self.Writer.Add(Write, Command)
+        try:
+            Text = self.Inner.query(Command)
+        except Exception as e:
+            self.Writer.Add(Error, str(e))
+            raise
+        self.Writer.Add(Reply, Text)
+        return Text
+
+    def SetTimeout(self, Seconds):
+        self.Inner.SetTimeout(Seconds)
+
+    def Flush(self):
+        self.Inner.Flush()
+
+    def close(self):
+        self.Writer.Flush()
+        self.Inner.close()
+
+def ReadTrace(Path): # Yields (Kind, seconds from the start, text) for every record
+    with open(Path, "rb") as trace_file:
+        if(trace_file.read(len(Magic)) != Magic):
+            raise ValueError(f"{Path} is not a GPD-X303S trace")
+        Header.unpack(trace_file.read(Header.size))
+        Time = 0.0
+        while True:
+            Data = trace_file.read(Entry.size)
+            if(len(Data) < Entry.size):
+                return
+            Kind, Delta, Length = Entry.unpack(Data)
+            Time += Delta / 1e6
+            yield Kind, Time, trace_file.read(Length).decode("ascii")
+
+def Exchanges(Path): # Pair each query with the reply (or error) read for it, replies come back in the order the queries were sent
+    Pairs = []
+    Pending = collections.deque()
+    for Kind, Time, Text in ReadTrace(Path):
+        if(Kind == Write):
+            if(Text.endswith("?")):
+                Pending.append((Text, Time))
+        elif(Pending):
+            Command, Sent = Pending.popleft()
+            Pairs.append((Command, Time - Sent, Kind, Text))
+    return Pairs
+
+class ReplayTransport(GPD_4303S_Transport.Transport): # Answers each query with the next reply recorded for that command, so the replay stays deterministic even if the order of commands differs
+    def __init__(self, Path, RealTime=False, Loop=False):
+        self.Replies = collections.defaultdict(list)
+        for Command, Latency, Kind, Text in Exchanges(Path):
+            self.Replies[Command].append((Latency, Kind, Text))
+        self.Next = collections.Counter() # Next recorded reply to use for each command
+        self.RealTime = RealTime # Hold each reply for its recorded latency
+        self.Loop = Loop # Start a command's replies over when they run out instead of failing
+        self.Queue = collections.deque() # (due time, kind, text) of the queries sent but not read yet
+
+    def write(self, Command):
+        if(not Command.endswith("?")):
+            return # Setting commands have no reply, nothing to replay
+        Replies = self.Replies.get(Command)
+        if(not Replies):
+            raise KeyError(f"Trace has no reply to {Command}")
+        i = self.Next[Command]
+        if(i >= len(Replies)):
+            if(not self.Loop):
+                raise EOFError(f"Trace has no more replies to {Command}")
+            i = 0
+        self.Next[Command] = i + 1
+        Latency, Kind, Text = Replies[i]
+        self.Queue.append((time.perf_counter() + Latency, Kind, Text))
+
+    def read(self):
+        if(not self.Queue):
+            raise TimeoutError("No reply pending in the replay")
+        Due, Kind, Text = self.Queue.popleft()
+        if(self.RealTime):
+            Wait = Due - time.perf_counter()
+            if(Wait > 0):
+                time.sleep(Wait)
+        if(Kind == Error):
+            raise TimeoutError(Text)
+        return Text
+
+    def SetTimeout(self, Seconds):
+        pass
+
+    def Flush(self):
+        self.Queue.clear()
+
+    def close(self):
+        self.Queue.clear()
+
+def Summary(Path): # Lines describing a trace
+    Records = list(ReadTrace(Path))
+    Lines = [f"{len(Records)} records over {Records[-1][1] if Records else 0.0:.1f} s"]
+    Latencies = collections.defaultdict(list)
+    Errors = collections.Counter()
+    for Command, Latency, Kind, Text in Exchanges(Path):
+        Latencies[Command].append(Latency)
+        if(Kind == Error):
+            Errors[Command] += 1
+    Lines.append("Command,Replies,Errors,Median (ms),Max (ms)")
+    for Command, Times in sorted(Latencies.items()):
+        Lines.append(f"{Command},{len(Times)},{Errors[Command]},{statistics.median(Times) * 1e3:.3f},{max(Times) * 1e3:.3f}")
+    return Lines
+
+if __name__=="__main__": # Command line front end, see the usage notes at the top
+    Arguments = sys.argv[1:]
+    Bench = 0
+    if("--bench" in Arguments):
+        i = Arguments.index("--bench")
+        Bench = int(Arguments[i + 1])
+        del Arguments[i:i + 2]
+    if(len(Arguments) != 1):
+        print(Usage)
+        sys.exit(1)
+    print("\n".join(Summary(Arguments[0])))
+    if(Bench):
+        import GPD_4303S_Acquisition
+        import GPD_4303S_Alarms
+        import GPD_4303S_Link
+        Worker = GPD_4303S_Acquisition.AcquisitionWorker(GPD_4303S_Link.GPD_4303S_Link(ReplayTransport(Arguments[0], Loop=True)), GPD_4303S_Alarms.AlarmLimits())
+        Start = time.perf_counter()
+        for i in range(Bench):
+            Worker.Measure()
+        Elapsed = time.perf_counter() - Start
+        print(f"Replayed {Bench} samples in {Elapsed:.3f} s: {Bench / Elapsed:.0f} samples/s, {Elapsed / Bench * 1e6:.1f} us per sample")
@@ -0,0 +1,158 @@
+"""
+Name: GPD_4303S_Transport.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Interchangeable transports for the serial link of a GPD-X303S, the PyVISA stack the GUI has always used and a direct pyserial transport with a preallocated read buffer, plus a benchmark of the per-transaction overhead of each
+"""
+
+Usage = """
+Usage: python GPD_4303S_Transport.py RESOURCE [--count N] [--baud B]
+- RESOURCE is the VISA resource of the power supply (ASRL3::INSTR), both transports are benchmarked on it one after the other
+- --count N  Transactions to time on each transport (default 1000)
+- --baud B   Baud rate the power supply is set to (default 115200)
+"""
+
+import statistics
+import sys
+import time
+
+class Transport(): # What GPD_4303S_Link needs from a transport, replies are returned with their "\r\n" so GPD_4303S_Codec sees the same frame from every transport
+    def write(self, Command):
+        raise NotImplementedError
+
+    def read(self):
+        raise NotImplementedError
+
+    def query(self, Command):
+        self.write(Command)
+        return self.read()
+
+    def SetTimeout(self, Seconds): # Longest wait for one reply
+        raise NotImplementedError
+
+    def Flush(self): # Throw away anything received but not read, used after a timeout so a late reply is not taken for the next one
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+class VisaTransport(Transport): # PyVISA -> PyVISA-py -> pyserial, the original path
+    def __init__(self, ResourceManager, Resource, BaudRate=115200):
+        self.Resource = ResourceManager.open_resource(Resource)
+        self.Resource.baud_rate = BaudRate
+
+    def write(self, Command):
+        self.Resource.write(Command)
+
+    def read(self):
+        return self.Resource.read()
+
+    def query(self, Command):
+        return self.Resource.query(Command)
+
+    def SetTimeout(self, Seconds):
+        self.Resource.timeout = Seconds * 1000.0 # PyVISA timeouts are in ms
+
+    def Flush(self):
+        import pyvisa
+        self.Resource.flush(pyvisa.constants.BufferOperation.discard_read_buffer)
+
+    def close(self):
+        self.Resource.close()
+
+def PortName(Resource): # ASRL3::INSTR -> COM3 on Windows, ASRL/dev/ttyUSB0::INSTR -> /dev/ttyUSB0, anything else (loop://) is given to pyserial as is
+    if(Resource.upper().startswith("ASRL") and Resource.upper().endswith("::INSTR")):
+        Port = Resource[4:-7]
+        return ("COM" + Port) if Port.isdigit() and sys.platform.startswith("win") else Port
+    return Resource
+
+class SerialTransport(Transport): # Straight to pyserial, one encode per command and "\r\n" framing done in place in a preallocated buffer
+    def __init__(self, Resource, BaudRate=115200, Timeout=2.0, BufferSize=4096):
+        import serial # Optional, only needed for this transport (pip install pyserial, PyVISA-py already depends on it)
+        self.Port = serial.serial_for_url(PortName(Resource), baudrate=BaudRate, timeout=Timeout)
+        self.Buffer = bytearray(BufferSize) # Replies are framed here, bytes between Start and End have been received but not returned yet
+        self.Start = 0
+        self.End = 0
+        self.Encoded = {} # Commands are a small fixed set, encode each one once
+
+    def write(self, Command):
+        Data = self.Encoded.get(Command)
+        if(Data is None):
+            Data = self.Encoded[Command] = Command.encode("ascii") + b"\r\n"
+        self.Port.write(Data)
+
+    def read(self):
+        Scan = self.Start # Where to look for the terminator, bytes before it have already been searched
+        while True:
+            Index = self.Buffer.find(b"\r\n", max(Scan - 1, self.Start), self.End)
+            if(Index >= 0):
+                Reply = self.Buffer[self.Start:Index + 2].decode("ascii")
+                self.Start = Index + 2
+                if(self.Start == self.End): # Buffer drained, start filling from the front again
+                    self.Start = self.End = 0
+                return Reply
+            Scan = self.End
+            if(self.End == len(self.Buffer)): # Out of room, move the partial reply to the front
+                if(self.Start == 0):
+                    raise BufferError("Reply longer than the read buffer")
+                Length = self.End - self.Start
+                self.Buffer[:Length] = self.Buffer[self.Start:self.End]
+                Scan -= self.Start
+                self.Start = 0
+                self.End = Length
+            Data = self.Port.read(min(max(1, self.Port.in_waiting), len(self.Buffer) - self.End)) # Blocks for the first byte then takes whatever else has arrived
+            if(not Data):
+                raise TimeoutError(f"Timeout waiting for a reply on {self.Port.port}")
+            self.Buffer[self.End:self.End + len(Data)] = Data
+            self.End += len(Data)
+
+    def SetTimeout(self, Seconds):
+        self.Port.timeout = Seconds
+
+    def Flush(self):
+        self.Port.reset_input_buffer()
+        self.Start = self.End = 0
+
+    def close(self):
+        self.Port.close()
+
+def Benchmark(Link, Count=1000, Command="VOUT1?"): # Time Count single query transactions, returns the transaction times (s)
+    Link.query(Command) # First transaction pays for any setup
+    Times = []
+    for i in range(Count):
+        Start = time.perf_counter()
+        Link.query(Command)
+        Times.append(time.perf_counter() - Start)
+    return Times
+
+def WireTime(Command, Reply, BaudRate): # Time the bytes spend on the wire (10 bits a character), the rest of a transaction is overhead or instrument response time
+    return (len(Command) + 2 + len(Reply)) * 10.0 / BaudRate
+
+if __name__=="__main__": # Command line front end, see the usage notes at the top
+    Arguments = sys.argv[1:]
+    Options = {"--count": 1000, "--baud": 115200}
+    for Option in Options:
+        if(Option in Arguments):
+            i = Arguments.index(Option)
+            Options[Option] = int(Arguments[i + 1])
+            del Arguments[i:i + 2]
+    if(len(Arguments) != 1):
+        print(Usage)
+        sys.exit(1)
+    import pyvisa
+    RM = pyvisa.ResourceManager("@py")
+    Results = {}
+    for Name in ("PyVISA", "pyserial"):
+        Link = VisaTransport(RM, Arguments[0], Options["--baud"]) if Name == "PyVISA" else SerialTransport(Arguments[0], Options["--baud"])
+        try:
+            Reply = Link.query("VOUT1?")
+            Results[Name] = Benchmark(Link, Options["--count"])
+        finally:
+            Link.close()
+    RM.close()
+    Wire = WireTime("VOUT1?", Reply, Options["--baud"])
+    print(f"{Options['--count']} x VOUT1? at {Options['--baud']} baud, {Wire * 1e3:.3f} ms on the wire per transaction")
+    print("Transport,Mean (ms),Median (ms),P99 (ms),Overhead (ms)")
+    for Name, Times in Results.items():
+        Times.sort()
+        print(f"{Name},{statistics.mean(Times) * 1e3:.3f},{statistics.median(Times) * 1e3:.3f},{Times[int(len(Times) * 0.99) - 1] * 1e3:.3f},{(statistics.mean(Times) - Wire) * 1e3:.3f}")
@@ -0,0 +1,40 @@
+"""
+Name: test_GPD_4303S_Analysis.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Step detection in the chunked log analysis does not depend on where the chunks split, run with "python -m pytest"
+"""
+
+import numpy as np
+import GPD_4303S_Analysis
+
+def Chunk(Start, Voltages): # One (Time, Readings, Status) chunk with CH1 set to Voltages, one row a second
+    Values = np.zeros((len(Voltages), 8))
+    Values[:, 0] = Voltages
+    return np.arange(Start, Start + len(Voltages), dtype=float), Values, np.full(len(Voltages), np.nan)
+
+def CH1Steps(Chunks, Hold):
+    return [Event for Event in GPD_4303S_Analysis.Settling(Chunks, Hold=Hold) if Event[0] == 1]
+
+def test_step_on_chunk_boundary():
+    Events = CH1Steps([Chunk(0, [0.0, 0.0, 0.0]), Chunk(3, [5.0, 5.0, 5.0])], Hold=1)
+    assert len(Events) == 1
+    assert Events[0][1:4] == (3.0, 0.0, 5.0)
+    assert Events[0][4] == 0.0
+
+def test_split_matches_whole_log():
+    Voltages = [0.0, 0.0, 5.0, 5.0, 2.0, 2.0, 2.0, 3.0, 3.0, 3.0]
+    for Hold in (1, 2, 3):
+        Whole = CH1Steps([Chunk(0, Voltages)], Hold)
+        for Split in range(1, len(Voltages)):
+            assert CH1Steps([Chunk(0, Voltages[:Split]), Chunk(Split, Voltages[Split:])], Hold) == Whole
+
+def test_nan_next_to_step():
+    Voltages = [0.0, 0.0, 0.0, np.nan, 5.0, 5.0, np.nan, 5.0, 5.0]
+    for Hold in (1, 2, 3):
+        Events = CH1Steps([Chunk(0, Voltages)], Hold)
+        assert len(Events) == 1
+        assert Events[0][1:4] == (4.0, 0.0, 5.0)
+        assert Events[0][4] == 0.0
+        for Split in range(1, len(Voltages)):
+            assert CH1Steps([Chunk(0, Voltages[:Split]), Chunk(Split, Voltages[Split:])], Hold) == Events
@@ -0,0 +1,33 @@
+"""
+Name: test_GPD_4303S_History.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: The history tiers leave NaN readings out of a bucket instead of letting one spoil it, run with "python -m pytest"
+"""
+
+import math
+import GPD_4303S_History
+
+def Sample(V1):
+    return [V1, 2.0, 3.0, 4.0, 0.1, 0.2, 0.3, 0.4]
+
+def Bucket(Times, V1s, Width=60): # Min, max and mean of the first bucket of the tier Width wide
+    History = GPD_4303S_History.TieredHistory()
+    for Time, V1 in zip(Times, V1s):
+        History.Add(Time, Sample(V1))
+    Tier = [Tier for Tier in History.Tiers if Tier.Width == Width][0]
+    return Tier.Query(0, Width - 1)[0][2:]
+
+def test_nan_first_in_bucket():
+    Min, Max, Mean = Bucket([0, 5, 10], [math.nan, 1.0, 3.0])
+    assert (Min[0], Max[0], Mean[0]) == (1.0, 3.0, 2.0)
+    assert Mean[1] == 2.0
+
+def test_nan_in_middle_of_bucket():
+    Min, Max, Mean = Bucket([0, 5, 10], [1.0, math.nan, 3.0])
+    assert (Min[0], Max[0], Mean[0]) == (1.0, 3.0, 2.0)
+
+def test_all_nan_reading_stays_nan():
+    Min, Max, Mean = Bucket([0, 5], [math.nan, math.nan], Width=3600)
+    assert math.isnan(Min[0]) and math.isnan(Max[0]) and math.isnan(Mean[0])
+    assert Min[2] == 3.0
@@ -0,0 +1,31 @@
+"""
+Name: test_GPD_4303S_Presets.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Presets round trip through the SQLite library and never store an unknown (NaN) setting, run with "python -m pytest"
+"""
+
+import math
+import pytest
+import GPD_4303S_Presets
+
+Settings = {"V1": 1.0, "V2": 2.0, "V3": 3.3, "V4": 5.0, "A1": 0.1, "A2": 0.2, "A3": 0.3, "A4": 0.4}
+
+def test_round_trip():
+    Library = GPD_4303S_Presets.PresetLibrary(":memory:")
+    Library.Save("Bench", Settings)
+    assert Library.Load("bench") == Settings
+    assert Library.Load("Missing") is None
+
+def test_nan_setting_refused():
+    Library = GPD_4303S_Presets.PresetLibrary(":memory:")
+    with pytest.raises(ValueError, match="A2"):
+        Library.Save("Bad", dict(Settings, A2=math.nan))
+    assert Library.Load("Bad") is None
+
+def test_empty_register_left_out():
+    Library = GPD_4303S_Presets.PresetLibrary(":memory:")
+    Library.DB.execute("INSERT INTO Presets VALUES ('Old', 1, 2, 3, 4, 0.1, NULL, 0.3, 0.4, '')") # Saved before NaN was refused
+    Loaded = Library.Load("Old")
+    assert "A2" not in Loaded
+    assert Loaded["V1"] == 1.0
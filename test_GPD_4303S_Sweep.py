@@ -0,0 +1,26 @@
+"""
+Name: test_GPD_4303S_Sweep.py
+Created: 10/19/2026
+Author: Dylan Lambert
+Purpose: Sweep setpoint generation stays inside the requested span, run with "python -m pytest"
+"""
+
+import numpy as np
+import GPD_4303S_Sweep
+
+def test_uneven_step_up():
+    Setpoints = GPD_4303S_Sweep.SweepWorker(None, 1, 0.0, 5.0, 0.3).Setpoints
+    assert Setpoints[0] == 0.0
+    assert Setpoints[-1] == 4.8
+    assert Setpoints.max() <= 5.0
+
+def test_uneven_step_down():
+    Setpoints = GPD_4303S_Sweep.SweepWorker(None, 1, 5.0, 0.0, 0.3).Setpoints
+    assert Setpoints[0] == 5.0
+    assert np.isclose(Setpoints[-1], 0.2)
+    assert Setpoints.min() >= 0.0
+
+def test_even_step_reaches_stop():
+    Setpoints = GPD_4303S_Sweep.SweepWorker(None, 1, 0.0, 5.0, 0.1).Setpoints
+    assert len(Setpoints) == 51
+    assert Setpoints[-1] == 5.0